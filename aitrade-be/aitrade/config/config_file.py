@@ -1,4 +1,5 @@
 import copy
+import functools
 import logging
 import os
 from typing import Any
@@ -6,6 +7,11 @@ from typing import Dict
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML 未编译 libyaml 扩展时回退到纯 Python 实现
+    from yaml import SafeLoader as _YamlLoader
+
 from .path_utils import build_managed_data_paths
 from .path_utils import build_sqlite_database_url
 from .path_utils import extract_sqlite_database_path
@@ -27,6 +33,11 @@ from .path_utils import resolve_sqlite_path
 
 DEFAULT_GPT_STRATEGY_CONFIG = {
     'min_confidence': 0.7,
+    # 信号缓存会在粗粒度特征一致时复用最长 1 小时的模型结论，同样属于交易行为变化，默认关闭
+    'signal_cache_enabled': False,
+    # 规则快路径会跳过模型直接下单，属于交易行为变化，默认关闭；关闭时仍按影子模式统计命中率
+    'fast_path_enabled': False,
+    'fast_path_min_strength': 0.75,
 }
 
 DEFAULT_BTC_SPOT_BREAKOUT_CONFIG = {
@@ -161,11 +172,26 @@ class ConfigValidationError(ValueError):
 
 
 def load_config(config_file):
+    """读取并解析 config.yaml；文件未变化时复用上一次的解析结果。
+
+    缓存以绝对路径、修改时间和文件大小为键，部署配置页改写文件后会重新解析；
+    返回深拷贝，调用方修改结果不会污染缓存。
+    """
+    config_path = os.path.abspath(config_file)
     try:
-        with open(config_file, 'r', encoding='utf-8') as file:
-            return yaml.safe_load(file) or {}
+        stat = os.stat(config_path)
     except FileNotFoundError as exc:
-        raise ConfigValidationError(f"配置文件不存在：{os.path.abspath(config_file)}") from exc
+        raise ConfigValidationError(f"配置文件不存在：{config_path}") from exc
+    return copy.deepcopy(_load_config_cached(config_path, stat.st_mtime_ns, stat.st_size))
+
+
+@functools.lru_cache(maxsize=1)
+def _load_config_cached(config_path, mtime_ns, size):
+    try:
+        with open(config_path, 'r', encoding='utf-8') as file:
+            return yaml.load(file, Loader=_YamlLoader) or {}
+    except FileNotFoundError as exc:
+        raise ConfigValidationError(f"配置文件不存在：{config_path}") from exc
     except yaml.YAMLError as exc:
         raise ConfigValidationError(f"config.yaml YAML 格式错误：{exc}") from exc
 
@@ -280,11 +306,8 @@ class Config:
         else:
             config_file = str(config_source)
             self.config_path = os.path.abspath(config_file)
-            if os.path.exists(config_file):
-                logging.info("配置文件存在，绝对路径：%s", self.config_path)
-            else:
-                logging.info("%s配置文件不存在", config_file)
             self.config = load_config(config_file)
+            logging.info("配置文件存在，绝对路径：%s", self.config_path)
         if mode not in {'web', 'task_runtime'}:
             raise ConfigValidationError("Config mode 只支持 web 或 task_runtime")
         self.mode = mode
@@ -331,6 +354,22 @@ class Config:
             self.proxy_url = _require_non_empty_string(self.proxy_url, 'app.http_client.proxy_url')
         elif self.proxy_url is not None and not isinstance(self.proxy_url, str):
             raise ConfigValidationError("配置项 app.http_client.proxy_url 必须是字符串")
+        # AI 接口 HTTP 连接池上限；缺省时放宽 httpx 默认的 100 / 20，避免多交易对并发时先卡在本地连接池。
+        self.http_max_connections = _require_positive_int(
+            http_client_cfg.get('max_connections', 512),
+            'app.http_client.max_connections',
+        )
+        self.http_max_keepalive_connections = _require_positive_int(
+            http_client_cfg.get('max_keepalive_connections', 256),
+            'app.http_client.max_keepalive_connections',
+        )
+        if self.http_max_keepalive_connections > self.http_max_connections:
+            raise ConfigValidationError('配置项 app.http_client.max_keepalive_connections 不能大于 max_connections')
+        # 空闲 keep-alive 连接的保活秒数；应覆盖一个交易周期，下一周期的 AI 请求才能复用已建立的 TLS 连接。
+        self.http_keepalive_expiry = float(_require_positive_number(
+            http_client_cfg.get('keepalive_expiry', 60),
+            'app.http_client.keepalive_expiry',
+        ))
 
         exchange_raw = app_cfg.get('exchange')
         if self.mode == 'task_runtime':
@@ -634,6 +673,20 @@ class Config:
             self.trade_strategy_gpt_config.get('min_confidence'),
             'app.trade.strategy.gpt.min_confidence',
         )
+        _require_bool(
+            self.trade_strategy_gpt_config.get('signal_cache_enabled'),
+            'app.trade.strategy.gpt.signal_cache_enabled',
+        )
+        _require_bool(
+            self.trade_strategy_gpt_config.get('fast_path_enabled'),
+            'app.trade.strategy.gpt.fast_path_enabled',
+        )
+        fast_path_min_strength = _require_positive_number(
+            self.trade_strategy_gpt_config.get('fast_path_min_strength'),
+            'app.trade.strategy.gpt.fast_path_min_strength',
+        )
+        if fast_path_min_strength >= 1:
+            raise ConfigValidationError('配置项 app.trade.strategy.gpt.fast_path_min_strength 必须小于 1')
 
         btc_spot_cfg = self.trade_strategy_btc_spot_config
         for key in ('donchian_entry', 'donchian_exit', 'ema_period', 'ema_slope_lookback', 'atr_period', 'volume_ma_period'):
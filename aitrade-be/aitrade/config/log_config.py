@@ -1,6 +1,11 @@
+import atexit
 import datetime
 import logging
 import os
+import queue
+import sys
+from logging.handlers import QueueHandler
+from logging.handlers import QueueListener
 from logging.handlers import TimedRotatingFileHandler
 
 import colorlog
@@ -11,15 +16,40 @@ from .path_utils import resolve_default_data_root_dir
 from .path_utils import resolve_default_log_dir
 from .path_utils import resolve_log_dir as resolve_log_dir_from_data_root
 
+# 日志处理器只允许初始化一次；重复调用 config_log 会导致每行日志被重复写出。
+_LOG_CONFIGURED = False
+# 记录本模块安装的 (logger, handler)，重新配置时只移除这些处理器，不影响 uvicorn、pytest 等外部安装的处理器。
+_INSTALLED_HANDLERS: list[tuple[logging.Logger, logging.Handler]] = []
+
+
+def _install_handler(target: logging.Logger, handler: logging.Handler) -> None:
+    target.addHandler(handler)
+    _INSTALLED_HANDLERS.append((target, handler))
+
+
+def _remove_installed_handlers() -> None:
+    while _INSTALLED_HANDLERS:
+        target, handler = _INSTALLED_HANDLERS.pop()
+        target.removeHandler(handler)
+
+
+def _warn_before_logging(message: str) -> None:
+    # 这里的配置读取发生在 config_log 安装处理器之前，logging 尚不可用，直接写标准错误。
+    sys.stderr.write(f'[WARN] {message}\n')
+
+
+def _read_app_config(config_file: str) -> dict:
+    if not os.path.exists(config_file):
+        return {}
+    with open(config_file, 'r', encoding='utf-8') as file:
+        config_data = yaml.safe_load(file) or {}
+    return config_data.get('app') or {}
+
 
 def resolve_log_dir(config_file: str = './config.yaml') -> str:
     default_log_dir = resolve_default_log_dir()
     try:
-        if not os.path.exists(config_file):
-            return default_log_dir
-        with open(config_file, 'r', encoding='utf-8') as file:
-            config_data = yaml.safe_load(file) or {}
-        app_cfg = config_data.get('app') or {}
+        app_cfg = _read_app_config(config_file)
         data_root_dir = app_cfg.get('data_root_dir')
         if isinstance(data_root_dir, str) and data_root_dir.strip():
             return resolve_log_dir_from_data_root(data_root_dir)
@@ -29,11 +59,35 @@ def resolve_log_dir(config_file: str = './config.yaml') -> str:
         return normalize_filesystem_path(log_dir)
     except Exception as exc:
         fallback_root = resolve_default_data_root_dir()
-        print(f'[WARN] 读取日志目录配置失败，回退到默认目录 {default_log_dir}（data_root_dir 默认 {fallback_root}）: {exc}')
+        _warn_before_logging(f'读取日志目录配置失败，回退到默认目录 {default_log_dir}（data_root_dir 默认 {fallback_root}）: {exc}')
         return default_log_dir
 
 
+def resolve_console_log_level(config_file: str = './config.yaml') -> int:
+    # 与 app.web.debug 保持一致（默认 true）；关闭调试后控制台只输出 INFO 及以上，
+    # DEBUG 明细仍完整写入日志文件，同时省去彩色格式化大段 DEBUG 内容的开销。
+    try:
+        web_cfg = _read_app_config(config_file).get('web') or {}
+        debug = web_cfg.get('debug', True)
+    except Exception as exc:
+        _warn_before_logging(f'读取控制台日志级别配置失败，回退到 DEBUG: {exc}')
+        return logging.DEBUG
+    return logging.DEBUG if debug is not False else logging.INFO
+
+
 def config_log(config_file: str = './config.yaml'):
+    global _LOG_CONFIGURED
+    if _LOG_CONFIGURED:
+        logging.debug('日志已初始化，跳过重复配置')
+        return
+
+    # 格式串只用到时间、级别、文件名与消息；关闭线程 / 进程 / 协程任务字段的采集，
+    # 每条 LogRecord 构造时不再查询 threading、os 与 asyncio 状态。
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+    logging.logAsyncioTasks = False
+
     log_dir = resolve_log_dir(config_file)
     if not os.path.exists(log_dir):
         os.makedirs(log_dir)
@@ -41,16 +95,15 @@ def config_log(config_file: str = './config.yaml'):
     # 设置日志文件名，包含日期和时间
     log_file = datetime.datetime.now().strftime("%Y-%m-%d-%H.log")
     logout = os.path.join(log_dir, log_file)
-    print("日志文件路径: " + logout)
 
-    # 配置文件日志处理器
-    file_handler = TimedRotatingFileHandler(logout, when="H", interval=1, backupCount=72)  # 每小时生成一个文件，保留72个文件（3天）
+    # 配置文件日志处理器；delay=True 推迟到首条记录写出时才打开文件，由后台监听线程完成
+    file_handler = TimedRotatingFileHandler(logout, when="H", interval=1, backupCount=72, delay=True)  # 每小时生成一个文件，保留72个文件（3天）
     file_handler.setFormatter(logging.Formatter('%(asctime)s-[%(levelname)s]-%(filename)s: %(message)s'))
     file_handler.setLevel(logging.DEBUG)
 
     # 配置控制台日志处理器
     console_handler = logging.StreamHandler()
-    console_handler.setLevel(logging.DEBUG)
+    console_handler.setLevel(resolve_console_log_level(config_file))
 
     # 创建 ColorFormatter 实例，设置不同级别日志的颜色
     formatter = colorlog.ColoredFormatter(
@@ -71,19 +124,35 @@ def config_log(config_file: str = './config.yaml'):
     # 创建专门用于交易日志的处理器
     trade_log_file = datetime.datetime.now().strftime("trade_%Y-%m-%d-%H.log")
     trade_logout = os.path.join(log_dir, trade_log_file)
-    trade_file_handler = TimedRotatingFileHandler(trade_logout, when="H", interval=1, backupCount=72)
+    trade_file_handler = TimedRotatingFileHandler(trade_logout, when="H", interval=1, backupCount=72, delay=True)
     trade_file_handler.setFormatter(logging.Formatter('%(asctime)s-[%(levelname)s]-%(filename)s: %(message)s'))
     trade_file_handler.setLevel(logging.INFO)
     
+    # 交易线程里的日志调用只做一次入队，落盘、控制台输出与按小时轮转都交给后台监听线程，
+    # 避免磁盘 I/O 阻塞交易主循环；交易日志与系统日志各用一条队列，保持原有的分流关系。
+    trade_queue = queue.Queue(-1)
+    trade_listener = QueueListener(trade_queue, trade_file_handler, respect_handler_level=True)
+
     # 创建交易日志记录器并添加处理器
+    _remove_installed_handlers()
     trade_logger = logging.getLogger('trade')
-    trade_logger.addHandler(trade_file_handler)
+    _install_handler(trade_logger, QueueHandler(trade_queue))
     trade_logger.setLevel(logging.INFO)
     # 防止传播到根日志记录器，避免重复记录
     trade_logger.propagate = False
 
+    root_queue = queue.Queue(-1)
+    root_listener = QueueListener(root_queue, file_handler, console_handler, respect_handler_level=True)
+
     # 创建日志记录器并添加处理器
     logger = logging.getLogger('')
-    logger.addHandler(file_handler)
-    logger.addHandler(console_handler)
-    logger.setLevel(logging.DEBUG)
\ No newline at end of file
+    _install_handler(logger, QueueHandler(root_queue))
+    logger.setLevel(logging.DEBUG)
+
+    root_listener.start()
+    trade_listener.start()
+    # 进程退出时先停止监听线程，确保队列中剩余日志全部写出。
+    atexit.register(trade_listener.stop)
+    atexit.register(root_listener.stop)
+    _LOG_CONFIGURED = True
+    logging.info("日志文件路径: %s", logout)
\ No newline at end of file
@@ -10,6 +10,7 @@ SQLITE_FILENAME = 'trades.sqlite3'
 LOG_DIRNAME = 'logs'
 BACKTEST_DATA_DIRNAME = 'backtest-data'
 FREQTRADE_USER_DATA_DIRNAME = 'freqtrade-user-data'
+OHLCV_CACHE_DIRNAME = 'ohlcv-cache'
 
 
 def resolve_aitrade_home() -> Path:
@@ -39,6 +40,11 @@ def resolve_freqtrade_user_data_dir(data_root_dir: str | None = None) -> str:
     return str((root / FREQTRADE_USER_DATA_DIRNAME).resolve())
 
 
+def resolve_ohlcv_cache_dir(data_root_dir: str | None = None) -> str:
+    root = Path(resolve_data_root_dir(data_root_dir))
+    return str((root / OHLCV_CACHE_DIRNAME).resolve())
+
+
 def resolve_log_dir(data_root_dir: str | None = None) -> str:
     root = Path(resolve_data_root_dir(data_root_dir))
     return str((root / LOG_DIRNAME).resolve())
@@ -5,6 +5,7 @@ from datetime import datetime, timezone
 from typing import Any
 from typing import Callable
 
+from ..trading_system.market_series import MarketSeries
 from ..strategies.btc_spot_breakout_strategy import BTCSpotBreakoutStrategy
 from ..strategies.btc_spot_trend_breakout_strategy import BTCSpotTrendBreakoutStrategy
 
@@ -59,11 +60,6 @@ class BacktestEngine:
         equity_curve: list[float] = []
 
         timestamps: list[str] = []
-        opens: list[float] = []
-        highs: list[float] = []
-        lows: list[float] = []
-        closes: list[float] = []
-        volumes: list[float] = []
 
         filtered_rows = []
         for row in primary_bars:
@@ -75,24 +71,26 @@ class BacktestEngine:
                 continue
             filtered_rows.append((row, bar_time))
         total_bars = len(filtered_rows)
+        # 主周期 K 线在进入逐根循环前一次性转换成连续的 float64 列，每根 K 线只取前缀切片视图传给策略，
+        # 不再维护逐根追加的 Python 列表，策略里的 pd.Series(...) 也不必每根都把整段历史重新转换一遍。
+        primary_rows = [row for row, _ in filtered_rows]
+        series = MarketSeries.from_ohlcv(primary_rows)
+        closes = series.closes[:0]
         processed_bars = 0
         progress_interval = 50
 
         for row, bar_time in filtered_rows:
-            open_price = float(row[1])
             high_price = float(row[2])
-            low_price = float(row[3])
             close_price = float(row[4])
-            volume = float(row[5])
             decision_ts = int(row[0])
 
             processed_bars += 1
             timestamps.append(bar_time)
-            opens.append(open_price)
-            highs.append(high_price)
-            lows.append(low_price)
-            closes.append(close_price)
-            volumes.append(volume)
+            opens = series.opens[:processed_bars]
+            highs = series.highs[:processed_bars]
+            lows = series.lows[:processed_bars]
+            closes = series.closes[:processed_bars]
+            volumes = series.volumes[:processed_bars]
 
             if on_progress and (
                 processed_bars == 1
@@ -118,7 +116,7 @@ class BacktestEngine:
                 'lows': lows,
                 'closes': closes,
                 'volumes': volumes,
-                'ohlcv': [item[0] for item in filtered_rows[:processed_bars]],
+                'ohlcv': primary_rows[:processed_bars],
             }
             contexts = {}
             enough_context = True
@@ -228,8 +226,8 @@ class BacktestEngine:
             if peak_equity > 0:
                 max_drawdown = max(max_drawdown, (peak_equity - equity) / peak_equity)
 
-        if position is not None and closes:
-            close_price = closes[-1]
+        if position is not None and len(closes):
+            close_price = float(closes[-1])
             filled_price = close_price * (1 - self.slippage_rate)
             gross = position['amount'] * filled_price
             fee = gross * self.fee_rate
@@ -308,19 +306,10 @@ class BacktestEngine:
     @staticmethod
     def _build_context_market_data(rows: list[list[Any]], decision_ts: int) -> dict[str, Any]:
         filtered_rows = [row for row in rows if isinstance(row, list) and len(row) >= 6 and int(row[0]) <= decision_ts]
-        timestamps = [int(item[0]) for item in filtered_rows]
-        opens = [float(item[1]) for item in filtered_rows]
-        highs = [float(item[2]) for item in filtered_rows]
-        lows = [float(item[3]) for item in filtered_rows]
-        closes = [float(item[4]) for item in filtered_rows]
-        volumes = [float(item[5]) for item in filtered_rows]
+        # 一次二维 float64 转换后按列切出，与实盘行情一样下发连续数组，不再逐列遍历行列表装箱
+        series = MarketSeries.from_ohlcv(filtered_rows)
         return {
-            'timestamps': timestamps,
-            'opens': opens,
-            'highs': highs,
-            'lows': lows,
-            'closes': closes,
-            'volumes': volumes,
+            **series.to_market_fields(),
             'ohlcv': filtered_rows,
-            'price': closes[-1] if closes else None,
+            'price': float(series.closes[-1]) if len(series) else None,
         }
@@ -7,7 +7,7 @@ GPT信号生成模块
 - MarketAnalyzer: 市场环境分析器，评估整体市场环境
 - PromptBuilder: AI提示词构建器，构建发送给AI模型的提示词
 - ResponseParser: AI响应解析器，解析AI模型的响应
-- ResponseParser: AI响应解析器，解析AI模型的响应
+- client_factory: AI客户端工厂，统一创建并共享底层HTTP连接池
 
 整个流程如下：
 1. TechnicalAnalyzer 分析技术指标
@@ -17,6 +17,20 @@ GPT信号生成模块
 5. ResponseParser 解析AI响应并生成交易信号
 """
 
-from .signal_generator import SignalGenerator
+from importlib import import_module
+
+__all__ = ['SignalGenerator']
+
+# 行情获取、风控等模块只用到 numeric_kernels / technical_analyzer；按需导入 SignalGenerator，
+# 避免它们为此连带加载 openai、httpx 等 AI 客户端依赖。
+_MODULE_MAP = {
+    'SignalGenerator': '.signal_generator',
+}
+
 
-__all__ = ['SignalGenerator']
\ No newline at end of file
+def __getattr__(name):
+    module_name = _MODULE_MAP.get(name)
+    if module_name is None:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    module = import_module(module_name, __name__)
+    return getattr(module, name)
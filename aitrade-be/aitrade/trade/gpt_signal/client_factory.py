@@ -0,0 +1,143 @@
+"""
+AI 客户端工厂
+
+集中创建 OpenAI 兼容的同步 / 异步客户端。同步客户端底层的 HTTP 连接池按代理地址
+在进程级共享，复用 keep-alive 的 TCP/TLS 连接；异步客户端由信号生成器按事件循环复用并负责关闭。
+"""
+
+import atexit
+import importlib.util
+import logging
+import threading
+from typing import Dict, Tuple
+
+import httpx
+import openai
+
+logger = logging.getLogger(__name__)
+
+# 同一进程内可能并发运行多条 GPT 任务；HTTP 连接池按代理地址与连接上限在进程级共享，
+# 复用 keep-alive 的 TCP/TLS 连接，避免每个任务、每次调用都重新握手。
+# httpx 默认只允许 100 个连接、20 个 keep-alive 连接，多交易对并发时会先于服务端限流成为瓶颈，
+# 因此默认上限放宽，实际值可通过 app.http_client.max_connections / max_keepalive_connections 配置。
+DEFAULT_MAX_CONNECTIONS = 512
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 256
+# 空闲连接保活时长；交易周期至少一分钟，过短的保活会让每个周期的首个请求都重新做 TLS 握手。
+DEFAULT_KEEPALIVE_EXPIRY_SECONDS = 60.0
+# OpenAI / DeepSeek 端点都支持 HTTP/2；httpx 需要额外的 h2 包才能协商 HTTP/2，缺失时回退 HTTP/1.1。
+_HTTP2_ENABLED = importlib.util.find_spec('h2') is not None
+_HTTP_CLIENTS: Dict[Tuple[str, int, int, float], httpx.Client] = {}
+_HTTP_CLIENTS_LOCK = threading.Lock()
+
+
+def _build_limits(
+    max_connections: int,
+    max_keepalive_connections: int,
+    keepalive_expiry: float = DEFAULT_KEEPALIVE_EXPIRY_SECONDS,
+) -> httpx.Limits:
+    return httpx.Limits(
+        max_connections=max_connections,
+        max_keepalive_connections=max_keepalive_connections,
+        keepalive_expiry=keepalive_expiry,
+    )
+
+
+def _get_shared_http_client(
+    proxy_url: str | None,
+    max_connections: int = DEFAULT_MAX_CONNECTIONS,
+    max_keepalive_connections: int = DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+    keepalive_expiry: float = DEFAULT_KEEPALIVE_EXPIRY_SECONDS,
+) -> httpx.Client:
+    cache_key = (proxy_url or '', max_connections, max_keepalive_connections, float(keepalive_expiry))
+    with _HTTP_CLIENTS_LOCK:
+        http_client = _HTTP_CLIENTS.get(cache_key)
+        if http_client is None or http_client.is_closed:
+            if proxy_url:
+                logger.info("创建共享 AI HTTP 连接池，使用代理: %s http2=%s", proxy_url, _HTTP2_ENABLED)
+            else:
+                logger.info("创建共享 AI HTTP 连接池，不使用代理 http2=%s", _HTTP2_ENABLED)
+            if not _HTTP2_ENABLED:
+                logger.debug("当前环境未安装 h2，AI HTTP 连接池回退为 HTTP/1.1")
+            http_client = httpx.Client(
+                proxy=proxy_url or None,
+                timeout=30.0,
+                limits=_build_limits(max_connections, max_keepalive_connections, keepalive_expiry),
+                http2=_HTTP2_ENABLED,
+            )
+            _HTTP_CLIENTS[cache_key] = http_client
+        else:
+            logger.debug("复用共享 AI HTTP 连接池: proxy_enabled=%s", bool(proxy_url))
+        return http_client
+
+
+@atexit.register
+def _close_shared_http_clients() -> None:
+    with _HTTP_CLIENTS_LOCK:
+        for http_client in _HTTP_CLIENTS.values():
+            try:
+                http_client.close()
+            except Exception as exc:
+                logger.debug("关闭共享 AI HTTP 连接池失败: %s", exc)
+        _HTTP_CLIENTS.clear()
+
+
+def build_request_timeout(request_timeout: float) -> httpx.Timeout:
+    """按单次请求超时派生分阶段超时：读超时等于 request_timeout，建连与取连接池槽位快速失败。"""
+    return httpx.Timeout(
+        request_timeout,
+        connect=min(5.0, request_timeout),
+        write=min(10.0, request_timeout),
+        pool=min(5.0, request_timeout),
+    )
+
+
+def create_client(
+    api_key: str,
+    base_url: str,
+    proxy_url: str | None = None,
+    request_timeout: float = 20.0,
+    max_retries: int = 2,
+    max_connections: int = DEFAULT_MAX_CONNECTIONS,
+    max_keepalive_connections: int = DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+    keepalive_expiry: float = DEFAULT_KEEPALIVE_EXPIRY_SECONDS,
+) -> openai.OpenAI:
+    """创建同步客户端；OpenAI 客户端本身很轻，底层连接池共享，不要单独关闭其 http_client。"""
+    return openai.OpenAI(
+        api_key=api_key,
+        base_url=base_url,
+        http_client=_get_shared_http_client(proxy_url, max_connections, max_keepalive_connections, keepalive_expiry),
+        # 客户端级超时会逐请求覆盖共享连接池的默认超时，卡住的请求尽快交给 SDK 重试。
+        timeout=build_request_timeout(request_timeout),
+        max_retries=max_retries,
+    )
+
+
+def create_async_client(
+    api_key: str,
+    base_url: str,
+    proxy_url: str | None = None,
+    max_connections: int = DEFAULT_MAX_CONNECTIONS,
+    max_keepalive_connections: int = DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+    http2: bool = True,
+    request_timeout: float = 20.0,
+    max_retries: int = 2,
+    keepalive_expiry: float = DEFAULT_KEEPALIVE_EXPIRY_SECONDS,
+) -> openai.AsyncOpenAI:
+    """创建异步客户端；其 HTTP 连接池绑定创建时的事件循环，调用方负责复用与关闭。"""
+    http2_enabled = http2 and _HTTP2_ENABLED
+    if http2 and not _HTTP2_ENABLED:
+        logger.debug("当前环境未安装 h2，异步 AI 客户端回退为 HTTP/1.1")
+    timeout = build_request_timeout(request_timeout)
+    return openai.AsyncOpenAI(
+        api_key=api_key,
+        base_url=base_url,
+        # 批量并发请求在 HTTP/2 下可复用同一条 TLS 连接多路复用，减少扇出时的握手开销。
+        http_client=httpx.AsyncClient(
+            proxy=proxy_url or None,
+            timeout=timeout,
+            limits=_build_limits(max_connections, max_keepalive_connections, keepalive_expiry),
+            http2=http2_enabled,
+        ),
+        timeout=timeout,
+        max_retries=max_retries,
+    )
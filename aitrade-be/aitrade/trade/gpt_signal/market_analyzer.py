@@ -1,6 +1,14 @@
 import numpy as np
 import logging
 
+from .numeric_kernels import market_context_stats
+from .technical_analyzer import get_cached_array
+
+logger = logging.getLogger(__name__)
+
+# 年化系数是常量，模块加载时计算一次，避免每次评估都调用 np.sqrt。
+_ANNUALIZATION = float(np.sqrt(365))
+
 
 class MarketAnalyzer:
     """市场环境分析器
@@ -22,30 +30,29 @@ class MarketAnalyzer:
         Returns:
             dict: 包含市场环境评估结果的字典
         """
-        logging.info("开始评估市场整体环境")
-        closes = market_data.get('closes', [])
-        volumes = market_data.get('volumes', [])
+        logger.info("开始评估市场整体环境")
+        closes = get_cached_array(market_data, 'closes')
         current_price = market_data.get('price', 0)
         
         if len(closes) < 20:
-            logging.warning("市场数据不足20个点，无法准确评估市场环境")
+            logger.warning("市场数据不足20个点，无法准确评估市场环境")
             return {'volatility': 'unknown', 'trend': 'unknown', 'details': '数据不足'}
 
         # 波动率分析 - 计算年化波动率
-        logging.debug("计算市场波动率")
-        returns = [closes[i] / closes[i - 1] - 1 for i in range(1, len(closes))]
-        volatility = np.std(returns) * np.sqrt(365)  # 年化波动率
+        logger.debug("计算市场波动率")
+        returns_std, price_change = market_context_stats(closes, float(current_price))
+        volatility = float(returns_std) * _ANNUALIZATION  # 年化波动率
 
         # 根据波动率水平分类市场
         volatility_level = 'high' if volatility > 0.8 else 'medium' if volatility > 0.4 else 'low'
-        logging.debug(f"波动率计算完成: {volatility:.4f}，水平: {volatility_level}")
+        logger.debug("波动率计算完成: %.4f，水平: %s", volatility, volatility_level)
 
         # 趋势强度分析 - 基于价格变化百分比
-        logging.debug("分析市场趋势强度")
-        price_change = (current_price - closes[0]) / closes[0]
+        logger.debug("分析市场趋势强度")
+        price_change = float(price_change)
         trend_strength = 'strong' if abs(price_change) > 0.1 else 'moderate' if abs(price_change) > 0.05 else 'weak'
         trend_direction = 'up' if price_change > 0 else 'down' if price_change < 0 else 'flat'
-        logging.debug(f"价格变化: {price_change*100:.2f}%，趋势强度: {trend_strength}，方向: {trend_direction}")
+        logger.debug("价格变化: %.2f%%，趋势强度: %s，方向: %s", price_change * 100, trend_strength, trend_direction)
 
         result = {
             'volatility': volatility_level,
@@ -55,5 +62,5 @@ class MarketAnalyzer:
             'details': f'市场{trend_direction}趋势{trend_strength}, 波动率{volatility_level}'
         }
         
-        logging.info(f"市场环境评估完成: {result['details']}")
+        logger.info("市场环境评估完成: %s", result['details'])
         return result
\ No newline at end of file
@@ -0,0 +1,389 @@
+"""
+数值计算内核
+
+把技术分析与市场环境评估中的纯数值部分收敛为只接收 `float64` 数组的函数，
+字符串分类、阈值判断等业务逻辑仍留在各分析器的 Python 包装层中。
+
+如果运行环境安装了 numba，这些内核会以 `@njit(cache=True)` 编译并缓存到磁盘；
+numba 不在默认锁定依赖中，缺失时直接按 NumPy 向量化实现执行，结果保持一致。
+一阶线性递推 `decayed_cumsum` 在装有 scipy 时交给 `scipy.signal.lfilter` 在 C 层逐点完成。
+"""
+
+import logging
+import math
+import time
+from typing import NamedTuple
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # numba 为可选加速依赖
+    njit = None
+
+try:
+    from scipy.signal import lfilter
+except ImportError:  # scipy 为可选加速依赖
+    lfilter = None
+
+logger = logging.getLogger(__name__)
+
+NUMBA_ENABLED = njit is not None
+
+
+def _jit(func):
+    if njit is None:
+        return func
+    return njit(cache=True, fastmath=True)(func)
+
+
+if NUMBA_ENABLED:
+    logger.debug("检测到 numba，数值计算内核启用 JIT 编译")
+
+
+@_jit
+def market_context_stats(closes, current_price):
+    """返回 (对数收益率标准差, 相对首根K线的价格变化比例)。
+
+    K 线级别的收益率很小，对数收益率与简单收益率的波动率几乎一致，
+    但可以用一次减法代替逐项除法，且只需在对数序列上做一次差分。
+    """
+    log_returns = np.diff(np.log(closes))
+    return log_returns.std(), (current_price - closes[0]) / closes[0]
+
+
+@_jit
+def moving_average_pair(closes, short_period, long_period):
+    """返回 (短期均值, 长期均值)，均取序列末尾窗口。"""
+    return closes[-short_period:].mean(), closes[-long_period:].mean()
+
+
+@_jit
+def recent_and_previous_mean(values, window):
+    """返回 (最近 window 期均值, 再往前 window 期均值)。"""
+    size = values.shape[0]
+    return values[size - window:].mean(), values[size - 2 * window:size - window].mean()
+
+
+@_jit
+def rsi_from_averages(up, down):
+    """由平均涨幅 / 跌幅得到 RSI：100 * up / (up + down)，与 100 - 100 / (1 + up / down) 等价。
+
+    只有跌幅为 0 时为 100，涨跌都为 0（价格不变）时按 TA-Lib 的约定取 0，不再给分母加 1e-10 偏置。
+    """
+    total = up + down
+    return 100.0 * up / total if total > 0.0 else 0.0
+
+
+@_jit
+def wilder_rsi(prices, period):
+    """按 Wilder 平滑逐点递推 RSI，返回长度为 len(prices) - period 的数组。
+
+    递推存在前后依赖，无法再向量化；编译后整段循环在本地代码中完成。
+    未安装 numba 时不要在热路径调用它，TechnicalAnalyzer 会改走 `decayed_cumsum` 的分块向量化实现。
+    """
+    n = prices.shape[0] - 1
+    out = np.empty(max(n - period + 1, 1), dtype=np.float64)
+    up = 0.0
+    down = 0.0
+    for i in range(min(period, n)):
+        delta = prices[i + 1] - prices[i]
+        # 与递推部分一致用条件选择而非 if/else 分支，涨跌方向随机时不会产生分支预测失败
+        up += delta if delta > 0 else 0.0
+        down += -delta if delta < 0 else 0.0
+    up /= period
+    down /= period
+    out[0] = rsi_from_averages(up, down)
+    for i in range(period, n):
+        delta = prices[i + 1] - prices[i]
+        gain = delta if delta > 0 else 0.0
+        loss = -delta if delta < 0 else 0.0
+        up = (up * (period - 1) + gain) / period
+        down = (down * (period - 1) + loss) / period
+        out[i - period + 1] = rsi_from_averages(up, down)
+    return out
+
+
+@_jit
+def wilder_averages(prices, period):
+    """返回序列末尾的 Wilder 平均涨幅与平均跌幅 (up, down)，种子与递推规则同 `wilder_rsi`。
+
+    只保留两个标量、不分配输出数组，供 RSI 增量状态在长窗口上一次性回填。
+    """
+    n = prices.shape[0] - 1
+    up = 0.0
+    down = 0.0
+    for i in range(min(period, n)):
+        delta = prices[i + 1] - prices[i]
+        # 与递推部分一致用条件选择而非 if/else 分支，涨跌方向随机时不会产生分支预测失败
+        up += delta if delta > 0 else 0.0
+        down += -delta if delta < 0 else 0.0
+    up /= period
+    down /= period
+    for i in range(period, n):
+        delta = prices[i + 1] - prices[i]
+        gain = delta if delta > 0 else 0.0
+        loss = -delta if delta < 0 else 0.0
+        up = (up * (period - 1) + gain) / period
+        down = (down * (period - 1) + loss) / period
+    return up, down
+
+
+@_jit
+def ema_adjusted(values, span):
+    """逐点计算与 pandas `Series.ewm(span=span).mean()`（默认 adjust=True）一致的 EMA。
+
+    adjust=True 的 EMA 等于两个累加量之比：num = x + (1 - alpha) * num，
+    den = 1 + (1 - alpha) * den，单次遍历即可得到整条序列，不需要构造 pandas 对象。
+    """
+    decay = 1.0 - 2.0 / (span + 1.0)
+    out = np.empty(values.shape[0], dtype=np.float64)
+    num = 0.0
+    den = 0.0
+    for i in range(values.shape[0]):
+        num = values[i] + decay * num
+        den = 1.0 + decay * den
+        out[i] = num / den
+    return out
+
+
+@_jit
+def macd_tail(closes):
+    """返回 (上一根 MACD, 当前 MACD, 上一根信号线, 当前信号线)，与 `ema_adjusted` 组合出的整条序列末尾两点一致。
+
+    三条 EMA 只保留标量累加量逐根推进，不再为只读末尾两点分配 MACD 线与信号线数组。
+    """
+    fast_decay = 1.0 - 2.0 / 13.0
+    slow_decay = 1.0 - 2.0 / 27.0
+    signal_decay = 1.0 - 2.0 / 10.0
+    fast_num = fast_den = slow_num = slow_den = signal_num = signal_den = 0.0
+    macd = signal = prev_macd = prev_signal = 0.0
+    for i in range(closes.shape[0]):
+        x = closes[i]
+        fast_num = x + fast_decay * fast_num
+        fast_den = 1.0 + fast_decay * fast_den
+        slow_num = x + slow_decay * slow_num
+        slow_den = 1.0 + slow_decay * slow_den
+        prev_macd = macd
+        prev_signal = signal
+        macd = fast_num / fast_den - slow_num / slow_den
+        signal_num = macd + signal_decay * signal_num
+        signal_den = 1.0 + signal_decay * signal_den
+        signal = signal_num / signal_den
+    return prev_macd, macd, prev_signal, signal
+
+
+@_jit
+def ema_unadjusted_last(values, span):
+    """返回与 pandas `ewm(span=span, adjust=False).mean()` 最后一个值一致的 EMA，只保留一个标量。"""
+    if values.shape[0] == 0:
+        return 0.0
+    alpha = 2.0 / (span + 1.0)
+    ema = values[0]
+    for i in range(1, values.shape[0]):
+        ema += alpha * (values[i] - ema)
+    return ema
+
+
+@_jit
+def macd_histogram_unadjusted(closes):
+    """返回与 pandas `ewm(span=..., adjust=False)` 组合出的 MACD 柱（12/26/9）最后一个值。
+
+    规则策略只读柱值末尾一点：三条递推 EMA 在同一次遍历中推进，不再构造三个 Series 与 EWM 对象。
+    """
+    if closes.shape[0] == 0:
+        return 0.0
+    fast_alpha = 2.0 / 13.0
+    slow_alpha = 2.0 / 27.0
+    signal_alpha = 2.0 / 10.0
+    fast = slow = closes[0]
+    signal = 0.0
+    for i in range(1, closes.shape[0]):
+        x = closes[i]
+        fast += fast_alpha * (x - fast)
+        slow += slow_alpha * (x - slow)
+        signal += signal_alpha * (fast - slow - signal)
+    return fast - slow - signal
+
+
+def decayed_cumsum(values, decay, out=None):
+    """返回 s[t] = values[t] + decay * s[t-1]（s[-1] = 0）的整条序列，纯 NumPy 分块向量化实现。
+
+    块内有闭式解 s[i] = decay^i * cumsum(values[k] / decay^k)[i] + decay^(i+1) * carry，
+    块长按 decay 限制在 decay^-(m-1) 不超过 1e150，避免放大系数溢出；块与块之间只传递一个标量。
+    所有一阶线性递推的 EMA（adjust=True 的分子、Wilder 平滑）都可以化成这个形式。
+    out 可以传入 values 本身原地写回：每块都先算出 values / decay^k 的临时结果再写入。
+    装有 scipy 时直接用 IIR 滤波器 y[t] = x[t] + decay * y[t-1] 逐点递推，不再分块。
+    """
+    values = np.asarray(values, dtype=np.float64)
+    if out is None:
+        out = np.empty(values.shape[0], dtype=np.float64)
+    if decay <= 0.0:
+        out[:] = values
+        return out
+    if lfilter is not None:
+        out[:] = lfilter([1.0], [1.0, -decay], values)
+        return out
+    block = 256 if decay >= 1.0 else max(1, min(256, int(150.0 * math.log(10.0) / -math.log(decay)) + 1))
+    carry = 0.0
+    for start in range(0, values.shape[0], block):
+        chunk = values[start:start + block]
+        powers = decay ** np.arange(chunk.shape[0], dtype=np.float64)
+        segment = out[start:start + chunk.shape[0]]
+        np.cumsum(chunk / powers, out=segment)
+        segment *= powers
+        segment += (carry * decay) * powers
+        carry = segment[-1]
+    return out
+
+
+def _ema_adjusted_numpy(values, span):
+    decay = 1.0 - 2.0 / (span + 1.0)
+    numerator = decayed_cumsum(values, decay)
+    # 分母 den_t = 1 + decay * den_{t-1} 有闭式解 (1 - decay^(t+1)) / (1 - decay)
+    steps = np.arange(1, numerator.shape[0] + 1, dtype=np.float64)
+    denominator = (1.0 - decay ** steps) / (1.0 - decay) if decay > 0.0 else np.ones_like(numerator)
+    return numerator / denominator
+
+
+def _ema_unadjusted_numpy(values, span):
+    # adjust=False 的 EMA y[t] = decay * y[t-1] + alpha * x[t]、y[0] = x[0]，把首项换成 x[0] 后即 decayed_cumsum
+    alpha = 2.0 / (span + 1.0)
+    weighted = values * alpha
+    weighted[0] = values[0]
+    return decayed_cumsum(weighted, 1.0 - alpha, out=weighted)
+
+
+def _ema_unadjusted_last_numpy(values, span):
+    values = np.asarray(values, dtype=np.float64)
+    if values.shape[0] == 0:
+        return 0.0
+    return float(_ema_unadjusted_numpy(values, span)[-1])
+
+
+def _macd_histogram_unadjusted_numpy(closes):
+    closes = np.asarray(closes, dtype=np.float64)
+    if closes.shape[0] == 0:
+        return 0.0
+    macd_line = _ema_unadjusted_numpy(closes, 12)
+    macd_line -= _ema_unadjusted_numpy(closes, 26)
+    return float(macd_line[-1] - _ema_unadjusted_numpy(macd_line, 9)[-1])
+
+
+if not NUMBA_ENABLED:
+    # 逐点循环只在编译后才划算；纯 Python 环境下改用分块向量化的等价实现。
+    ema_adjusted = _ema_adjusted_numpy
+    macd_histogram_unadjusted = _macd_histogram_unadjusted_numpy
+    ema_unadjusted_last = _ema_unadjusted_last_numpy
+
+
+class IndicatorBundle(NamedTuple):
+    """单次遍历收盘价 / 成交量得到的全部指标标量。"""
+
+    rsi: float
+    prev_macd: float
+    macd: float
+    prev_signal: float
+    signal: float
+    short_ma: float
+    long_ma: float
+    recent_volume: float
+    previous_volume: float
+
+
+@_jit
+def _fused_indicators(closes, volumes, rsi_period, short_period, long_period, volume_window):
+    n = closes.shape[0]
+    fast_decay = 1.0 - 2.0 / 13.0
+    slow_decay = 1.0 - 2.0 / 27.0
+    signal_decay = 1.0 - 2.0 / 10.0
+    fast_num = fast_den = slow_num = slow_den = signal_num = signal_den = 0.0
+    macd = signal = prev_macd = prev_signal = 0.0
+    up = down = 0.0
+    short_sum = long_sum = 0.0
+    short_start = n - short_period
+    long_start = n - long_period
+    for i in range(n):
+        x = closes[i]
+        # MACD：三条 adjust=True EMA 同步推进，只保留最后两根的值用于判断交叉
+        fast_num = x + fast_decay * fast_num
+        fast_den = 1.0 + fast_decay * fast_den
+        slow_num = x + slow_decay * slow_num
+        slow_den = 1.0 + slow_decay * slow_den
+        prev_macd = macd
+        prev_signal = signal
+        macd = fast_num / fast_den - slow_num / slow_den
+        signal_num = macd + signal_decay * signal_num
+        signal_den = 1.0 + signal_decay * signal_den
+        signal = signal_num / signal_den
+        # 均线：只累加末尾窗口
+        if i >= short_start:
+            short_sum += x
+        if i >= long_start:
+            long_sum += x
+        # RSI：前 rsi_period 个差分求和作种子，之后按 Wilder 平滑递推
+        if i > 0:
+            delta = x - closes[i - 1]
+            gain = delta if delta > 0 else 0.0
+            loss = -delta if delta < 0 else 0.0
+            if i <= rsi_period:
+                up += gain
+                down += loss
+                if i == rsi_period:
+                    up /= rsi_period
+                    down /= rsi_period
+            else:
+                up = (up * (rsi_period - 1) + gain) / rsi_period
+                down = (down * (rsi_period - 1) + loss) / rsi_period
+    if n - 1 < rsi_period:
+        up /= rsi_period
+        down /= rsi_period
+    rsi = rsi_from_averages(up, down)
+
+    recent_volume = previous_volume = 0.0
+    m = volumes.shape[0]
+    if m >= 2 * volume_window:
+        for j in range(m - 2 * volume_window, m - volume_window):
+            previous_volume += volumes[j]
+        for j in range(m - volume_window, m):
+            recent_volume += volumes[j]
+        recent_volume /= volume_window
+        previous_volume /= volume_window
+    return (
+        rsi, prev_macd, macd, prev_signal, signal,
+        short_sum / short_period, long_sum / long_period, recent_volume, previous_volume,
+    )
+
+
+def compute_all_indicators(closes, volumes, rsi_period=14, short_period=10, long_period=20, volume_window=5):
+    """一次遍历 closes 同时得到 RSI、MACD、短长均线与前后成交量均值，避免多次扫描与临时数组。
+
+    数据长度不足的指标会返回占位值，调用方仍需按各自的最小长度规则判断是否可用。
+    """
+    values = _fused_indicators(closes, volumes, rsi_period, short_period, long_period, volume_window)
+    return IndicatorBundle(*(float(value) for value in values))
+
+
+def warm_up() -> None:
+    """用小数组调用每个编译内核一次，提前完成 JIT 编译或磁盘缓存加载。
+
+    参数类型与生产调用一致（C 连续的 float64 数组、整数周期），预热得到的特化版本可直接复用。
+    导入本模块时不会自动预热，由交易机器人启动时显式调用；Web 服务与测试只导入模块时不承担编译耗时。
+    未安装 numba 时直接返回。
+    """
+    if not NUMBA_ENABLED:
+        return
+    started = time.perf_counter()
+    prices = np.linspace(1.0, 2.0, 32)
+    rsi_from_averages(1.0, 1.0)
+    market_context_stats(prices, 2.0)
+    moving_average_pair(prices, 10, 20)
+    recent_and_previous_mean(prices, 5)
+    wilder_rsi(prices, 14)
+    wilder_averages(prices, 14)
+    ema_adjusted(prices, 12)
+    macd_tail(prices)
+    macd_histogram_unadjusted(prices)
+    ema_unadjusted_last(prices, 20)
+    _fused_indicators(prices, prices, 14, 10, 20, 5)
+    logger.debug("数值计算内核预热完成，耗时 %.3fs", time.perf_counter() - started)
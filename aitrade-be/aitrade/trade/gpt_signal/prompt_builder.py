@@ -1,4 +1,35 @@
 import logging
+from datetime import datetime
+from datetime import timezone
+
+logger = logging.getLogger(__name__)
+
+
+# 模型只需要数值和分类结论，不需要中文标签与排版；字段统一压缩成 `键=值` 单行格式，
+# 字段含义和输出 JSON 结构放在固定的系统提示词中，每次请求只发送这一行特征。
+# 字段按变化频率从低到高排列：相邻周期的分类结论经常相同，放在前面可以延长与上一次请求的
+# 公共前缀，命中服务端前缀缓存；每次都会变化的价格和时间放在最后，时间只保留到分钟。
+_ANALYSIS_PROMPT_TEMPLATE = (
+    "bias={signal_bias}:{overall_strength:.2f};"
+    "bull={bullish_signals};bear={bearish_signals};"
+    "mkt={volatility}:{trend_strength}:{trend_direction}:{price_change_pct:.2f};"
+    "pt={price_trend}:{price_trend_strength:.2f};"
+    "macd={macd_trend}:{macd_momentum:.2f}:{macd_crossover};"
+    "vol={volume_trend};"
+    "rsi={rsi_value:.1f}:{rsi_condition}:{rsi_strength:.2f};"
+    "price={price};ts={timestamp}"
+)
+
+
+def _format_prompt_timestamp(market_data):
+    """返回精确到分钟的时间文本；实盘行情只带 K 线毫秒时间戳，到构建提示词时才格式化为 UTC 时间。"""
+    timestamp = market_data.get('timestamp')
+    if timestamp is None:
+        timestamp_ms = market_data.get('timestamp_ms')
+        if timestamp_ms is None:
+            return 'N/A'
+        return datetime.fromtimestamp(timestamp_ms / 1000, tz=timezone.utc).strftime('%Y-%m-%dT%H:%M')
+    return str(timestamp)[:16]
 
 
 class PromptBuilder:
@@ -23,64 +54,34 @@ class PromptBuilder:
         Returns:
             str: 构建完成的提示词字符串
         """
-        logging.info("开始构建AI分析提示词")
+        logger.info("开始构建AI分析提示词")
         
-        # 构建完整的分析提示词
-        prompt = f"""
-        请基于以下市场数据提供专业的交易分析：
-
-        【市场概况】
-        - 当前价格: {market_data.get('price', 'N/A')}
-        - 时间: {market_data.get('timestamp', 'N/A')}
-        - 市场状态: {market_context['details']}
-
-        【技术指标详情】
-        RSI指标:
-        - 数值: {technical_analysis['rsi']['value']:.1f}
-        - 状态: {technical_analysis['rsi']['condition']}
-        - 强度: {technical_analysis['rsi']['strength']:.2f}
-        - 说明: {technical_analysis['rsi']['details']}
-
-        MACD指标:
-        - 趋势: {technical_analysis['macd']['trend']}
-        - 动量: {technical_analysis['macd']['momentum']:.2f}
-        - 交叉信号: {technical_analysis['macd']['crossover']}
-        - 说明: {technical_analysis['macd']['details']}
-
-        价格趋势:
-        - 方向: {technical_analysis['price_trend']['trend']}
-        - 强度: {technical_analysis['price_trend']['strength']:.2f}
-        - 说明: {technical_analysis['price_trend']['details']}
-
-        成交量:
-        - 趋势: {technical_analysis['volume']['trend']}
-        - 说明: {technical_analysis['volume']['details']}
-
-        【信号汇总】
-        - 看涨信号数量: {technical_analysis['bullish_signals']}
-        - 看跌信号数量: {technical_analysis['bearish_signals']}
-        - 总体偏向: {technical_analysis['signal_bias']}
-        - 信号强度: {technical_analysis['overall_strength']:.2f}
-
-        【分析要求】
-        请基于以上数据：
-        1. 评估当前市场多空力量对比
-        2. 识别主要的技术信号和矛盾点
-        3. 给出具体的交易建议和置信度
-        4. 设置合理的风险参数
-
-        请以JSON格式输出分析结果：
-        {{
-            "action": "buy/sell/hold",
-            "confidence": 0.0-1.0,
-            "reason": "详细的分析理由，包括支持信号和风险因素",
-            "stop_loss_pct": 0.02-0.08,
-            "take_profit_pct": 0.04-0.15,
-            "expected_risk_reward": 1.5-3.0,
-            "validity_period_hours": 1-24,
-            "key_conditions": ["主要依赖的条件1", "条件2"]
-        }}
-        """
+        # 只组装一次扁平字段表，再套用模块级单行模板；各指标的中文说明文字不再发送给模型。
+        rsi = technical_analysis['rsi']
+        macd = technical_analysis['macd']
+        price_trend = technical_analysis['price_trend']
+        volume = technical_analysis['volume']
+        prompt = _ANALYSIS_PROMPT_TEMPLATE.format_map({
+            'price': market_data.get('price', 'N/A'),
+            'timestamp': _format_prompt_timestamp(market_data),
+            'volatility': market_context.get('volatility', 'unknown'),
+            'trend_strength': market_context.get('trend_strength', 'unknown'),
+            'trend_direction': market_context.get('trend_direction', 'unknown'),
+            'price_change_pct': float(market_context.get('price_change_pct', 0.0)),
+            'rsi_value': rsi['value'],
+            'rsi_condition': rsi['condition'],
+            'rsi_strength': rsi['strength'],
+            'macd_trend': macd['trend'],
+            'macd_momentum': macd['momentum'],
+            'macd_crossover': macd['crossover'],
+            'price_trend': price_trend['trend'],
+            'price_trend_strength': price_trend['strength'],
+            'volume_trend': volume['trend'],
+            'bullish_signals': technical_analysis['bullish_signals'],
+            'bearish_signals': technical_analysis['bearish_signals'],
+            'signal_bias': technical_analysis['signal_bias'],
+            'overall_strength': technical_analysis['overall_strength'],
+        })
 
-        logging.debug("AI分析提示词构建完成")
-        return prompt
\ No newline at end of file
+        logger.debug("AI分析提示词构建完成")
+        return prompt
@@ -1,7 +1,15 @@
 import logging
-from typing import Dict, Any, Optional
+from typing import Dict, Any
 import json
-import re
+
+try:
+    import orjson
+except ImportError:  # orjson 仅随 freqtrade 间接安装，缺失时回退标准库 json
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+_JSON_DECODER = json.JSONDecoder()
 
 
 class ResponseParser:
@@ -26,21 +34,19 @@ class ResponseParser:
         Returns:
             Dict[str, Any]: 包含解析后信号的字典
         """
-        logging.info("开始解析AI模型响应")
+        logger.info("开始解析AI模型响应")
         try:
             # 尝试提取JSON部分
-            logging.debug("尝试从响应中提取JSON数据")
+            logger.debug("尝试从响应中提取JSON数据")
             json_start = response_text.find('{')
-            json_end = response_text.rfind('}') + 1
 
-            if json_start >= 0 and json_end > json_start:
-                json_str = response_text[json_start:json_end]
-                logging.debug("找到JSON格式数据，尝试解析")
-                signal = json.loads(json_str)
-                logging.info("AI响应解析成功")
+            if json_start >= 0:
+                logger.debug("找到JSON格式数据，尝试解析")
+                signal = ResponseParser._decode_json_object(response_text, json_start)
+                logger.info("AI响应解析成功")
             else:
                 # 如果没有找到JSON，使用默认值
-                logging.warning("未找到JSON格式数据，使用默认信号")
+                logger.warning("未找到JSON格式数据，使用默认信号")
                 signal = {
                     "action": "hold",
                     "confidence": 0.5,
@@ -56,7 +62,7 @@ class ResponseParser:
 
         except json.JSONDecodeError as e:
             # JSON解析错误时返回默认信号
-            logging.error(f"JSON解析失败: {e}")
+            logger.error("JSON解析失败: %s", e)
             return {
                 "action": "hold",
                 "confidence": 0.5,
@@ -69,7 +75,7 @@ class ResponseParser:
             }
         except Exception as e:
             # 出现其他异常时返回默认信号
-            logging.error(f"解析响应时出现未知错误: {e}")
+            logger.error("解析响应时出现未知错误: %s", e)
             return {
                 "action": "hold",
                 "confidence": 0.5,
@@ -82,36 +88,61 @@ class ResponseParser:
             }
 
     @staticmethod
-    def validate_signal(parsed_result: Dict[str, Any]) -> bool:
+    def _decode_json_object(response_text: str, json_start: int) -> Dict[str, Any]:
+        # 快路径：模型通常只返回 JSON 或代码块包裹的 JSON，直接截到最后一个 '}' 交给 orjson 解析。
+        json_end = response_text.rfind('}') + 1
+        if orjson is not None and json_end > json_start:
+            try:
+                return orjson.loads(response_text[json_start:json_end])
+            except orjson.JSONDecodeError:
+                logger.debug("整段 JSON 解析失败，改为从首个 '{' 起单次扫描解析")
+        # 兜底：raw_decode 从首个 '{' 起在 C 层单次扫描到对象结束，容忍 JSON 之后追加的说明文字。
+        signal, _ = _JSON_DECODER.raw_decode(response_text, json_start)
+        return signal
+
+    @staticmethod
+    def validate_signal(parsed_result: Dict[str, Any], technical_analysis: Dict[str, Any] | None = None) -> bool:
         """
         验证解析后的信号是否有效
         
-        检查解析后的信号是否包含必要的字段且值在合理范围内。
+        检查解析后的信号是否包含必要的字段且值在合理范围内；
+        如果传入技术分析结果，还会复用其中预先计算好的 RSI 极端拦截标记。
         
         Args:
             parsed_result (Dict[str, Any]): 解析后的信号结果
+            technical_analysis (Dict[str, Any] | None): 技术分析结果，可选
             
         Returns:
             bool: 如果信号有效返回True，否则返回False
         """
-        logging.info("开始验证解析后的信号")
+        logger.info("开始验证解析后的信号")
         action = parsed_result.get('action', '')
         confidence = parsed_result.get('confidence', 0)
         
         # 验证操作建议是否有效
         valid_action = action in ['buy', 'sell', 'hold']
         if not valid_action:
-            logging.warning(f"无效的操作建议: {action}")
+            logger.warning("无效的操作建议: %s", action)
         
         # 验证置信度是否在有效范围内
         valid_confidence = 0 <= confidence <= 1
         if not valid_confidence:
-            logging.warning(f"置信度超出有效范围: {confidence}")
+            logger.warning("置信度超出有效范围: %s", confidence)
         
-        is_valid = valid_action and valid_confidence
+        # 直接读取技术分析阶段给出的布尔标记，不在校验阶段重新解析 RSI 明细。
+        blocked = False
+        if technical_analysis:
+            if action == 'buy' and technical_analysis.get('buy_blocked'):
+                blocked = True
+                logger.warning("RSI 处于极端超买区域，拦截买入信号")
+            elif action == 'sell' and technical_analysis.get('sell_blocked'):
+                blocked = True
+                logger.warning("RSI 处于极端超卖区域，拦截卖出信号")
+
+        is_valid = valid_action and valid_confidence and not blocked
         if is_valid:
-            logging.info("信号验证通过")
+            logger.info("信号验证通过")
         else:
-            logging.warning("信号验证失败")
+            logger.warning("信号验证失败")
             
         return is_valid
\ No newline at end of file
@@ -1,13 +1,129 @@
+import asyncio
+import copy
+import hashlib
 import logging
-from typing import Any, Dict
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Tuple
 
-import httpx
 import openai
 
+try:
+    import xxhash
+except ImportError:  # xxhash 为可选加速依赖，缺失时使用标准库 blake2b
+    xxhash = None
+
+from .client_factory import (
+    DEFAULT_MAX_CONNECTIONS,
+    DEFAULT_KEEPALIVE_EXPIRY_SECONDS,
+    DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+    create_async_client,
+    create_client,
+)
 from .market_analyzer import MarketAnalyzer
 from .prompt_builder import PromptBuilder
 from .response_parser import ResponseParser
-from .technical_analyzer import TechnicalAnalyzer
+from .technical_analyzer import SymbolIndicatorState, TechnicalAnalyzer
+
+logger = logging.getLogger(__name__)
+
+# 系统提示词作为固定前缀放在模块级常量中，保证每次请求逐字节一致，
+# 以便 DeepSeek / OpenAI 的前缀缓存命中，降低重复 prefill 的耗时与计费。
+# 用户消息只携带 PromptBuilder 生成的单行 `键=值` 特征，字段含义与输出结构都在这里说明。
+_ANALYSIS_PRINCIPLES = "你是量化交易分析师。原则：至少2个指标同向才交易；不确定时hold；不逆势；按概率决策。\n"
+_FEATURE_LEGEND = (
+    "输入为单行特征，字段含义：bias=总体偏向:信号强度;bull/bear=看涨/看跌信号数;"
+    "mkt=波动率:趋势强度:趋势方向:区间涨跌幅%;pt=价格趋势:强度;"
+    "macd=趋势:动量:交叉;vol=成交量趋势;rsi=值:状态:强度;price=当前价;ts=时间。\n"
+)
+_SIGNAL_SCHEMA = (
+    '{"action":"buy/sell/hold","confidence":0.0-1.0,"reason":"简要理由，含支持信号与风险",'
+    '"stop_loss_pct":0.02-0.08,"take_profit_pct":0.04-0.15,"expected_risk_reward":1.5-3.0,'
+    '"validity_period_hours":1-24,"key_conditions":["条件1","条件2"]}'
+)
+_SYSTEM_MESSAGE = {
+    "role": "system",
+    "content": _ANALYSIS_PRINCIPLES + _FEATURE_LEGEND + "只输出如下JSON，不要输出其他文字：\n" + _SIGNAL_SCHEMA,
+}
+
+# 模型采样温度；它和系统提示词一起进入信号缓存键，任一变化都不会复用旧结论。
+_TEMPERATURE = 0.1
+_SYSTEM_PROMPT_DIGEST = hashlib.blake2b(_SYSTEM_MESSAGE["content"].encode('utf-8'), digest_size=8).hexdigest()
+
+
+def _hash_cache_features(features: Tuple[Any, ...]) -> str:
+    """把分桶后的特征元组哈希成定长缓存键；xxh3 只需纳秒级，blake2b 作为无依赖回退。"""
+    payload = repr(features).encode('utf-8')
+    if xxhash is not None:
+        return xxhash.xxh3_128_hexdigest(payload)
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+# 相邻周期的量化市场状态经常完全一致，此时直接复用上一次的模型结论；
+# 缓存时长取信号自带的有效期，但不超过 1 小时，避免粗粒度键把过期判断沿用太久。
+_SIGNAL_CACHE_MAX_SIZE = 1024
+_SIGNAL_CACHE_MAX_TTL_SECONDS = 3600
+
+# 完整的信号 JSON 约 150~250 token；收到首个完整顶层 JSON 对象后即停止流式读取，
+# 模型偶尔追加的解释性文字不再等待，max_tokens 只作为异常情况下的上限保护。
+_MAX_COMPLETION_TOKENS = 300
+# 单次模型调用（含流式读取）的总时长上限 = request_timeout × 该系数。
+_STREAM_DEADLINE_FACTOR = 1.1
+
+# 规则快路径：本地指标高度一致（至少 3 个同向信号、无反向信号冲淡强度）时，低温度下模型几乎总是顺势给出同向结论，
+# 可直接按规则生成信号，不再请求模型；其余情况仍交给模型判断。它会改变实际下单行为，默认关闭。
+_FAST_PATH_MIN_SIGNALS = 3
+DEFAULT_FAST_PATH_MIN_STRENGTH = 0.75
+_FAST_PATH_MAX_CONFIDENCE = 0.9
+# 每评估多少次输出一次快路径命中率日志
+_FAST_PATH_STATS_LOG_INTERVAL = 50
+
+
+class _JsonObjectCloseDetector:
+    """增量扫描流式输出，判断首个顶层 JSON 对象是否已经闭合；字符串内的花括号不计数。"""
+
+    __slots__ = ('depth', 'started', 'in_string', 'escaped')
+
+    def __init__(self):
+        self.depth = 0
+        self.started = False
+        self.in_string = False
+        self.escaped = False
+
+    def feed(self, text: str) -> bool:
+        # 多数 token 是字段值或说明文字，不含任何会改变扫描状态的字符；先用 C 层的子串查找整块跳过，
+        # 只有真正包含引号、反斜杠或花括号的分片才逐字符推进状态机。
+        if not self.escaped:
+            if self.in_string:
+                if '"' not in text and '\\' not in text:
+                    return False
+            elif not self.started:
+                if '{' not in text:
+                    return False
+            elif '{' not in text and '}' not in text and '"' not in text:
+                return False
+        for char in text:
+            if self.in_string:
+                if self.escaped:
+                    self.escaped = False
+                elif char == '\\':
+                    self.escaped = True
+                elif char == '"':
+                    self.in_string = False
+            elif char == '{':
+                self.depth += 1
+                self.started = True
+            elif not self.started:
+                # 首个 '{' 之前的引号（例如 markdown 说明文字）不影响 JSON 扫描状态
+                continue
+            elif char == '"':
+                self.in_string = True
+            elif char == '}':
+                self.depth -= 1
+                if self.depth == 0:
+                    return True
+        return False
 
 
 class SignalGenerator:
@@ -19,26 +135,88 @@ class SignalGenerator:
         base_url: str = "https://api.deepseek.com/v1",
         proxy_url: str = None,
         model: str = "deepseek-chat",
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        max_keepalive_connections: int = DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry: float = DEFAULT_KEEPALIVE_EXPIRY_SECONDS,
+        http2: bool = True,
+        max_concurrency: int = 8,
+        request_timeout: float = 20.0,
+        max_retries: int = 2,
+        enable_cache: bool = False,
+        enable_fast_path: bool = False,
+        fast_path_min_strength: float = DEFAULT_FAST_PATH_MIN_STRENGTH,
     ):
         # 上层策略已经把 provider 差异收敛成最终 base_url，这里只负责创建 OpenAI 兼容客户端。
-        logging.info('初始化 GPT 信号生成器: model=%s custom_base_url=%s proxy_enabled=%s', model, bool(base_url), bool(proxy_url))
-        logging.debug("API基础URL: %s", base_url)
-        logging.debug("模型名称: %s", model)
-
-        if proxy_url:
-            logging.info("使用代理: %s", proxy_url)
-            http_client = httpx.Client(proxy=proxy_url, timeout=30.0)
-        else:
-            logging.info("不使用代理")
-            http_client = httpx.Client(timeout=30.0)
+        logger.info('初始化 GPT 信号生成器: model=%s custom_base_url=%s proxy_enabled=%s', model, bool(base_url), bool(proxy_url))
+        logger.debug("API基础URL: %s", base_url)
+        logger.debug("模型名称: %s", model)
 
         self.model = model
-        self.client = openai.OpenAI(
-            api_key=api_key,
-            base_url=base_url,
-            http_client=http_client,
+        self.api_key = api_key
+        self.base_url = base_url
+        self.proxy_url = proxy_url
+        # 单次请求超时取略高于常见响应耗时的值；流式读取另有总时长兜底，见 _call_ai_model。
+        self.request_timeout = float(request_timeout)
+        self.max_retries = max(0, int(max_retries))
+        self.max_connections = max_connections
+        self.max_keepalive_connections = max_keepalive_connections
+        self.keepalive_expiry = float(keepalive_expiry)
+        self.client = create_client(
+            api_key,
+            base_url,
+            proxy_url,
+            self.request_timeout,
+            self.max_retries,
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry,
         )
-        logging.info("GPT信号生成器初始化完成")
+        # 异步客户端在首次并发调用时按当前事件循环懒创建，之后跨批次复用同一连接池。
+        self.http2 = http2
+        self._async_client: openai.AsyncOpenAI | None = None
+        self._async_client_loop: asyncio.AbstractEventLoop | None = None
+        # 并发扇出时限制同时在途的模型请求数，避免触发服务端限流；信号量与异步客户端同属一个事件循环。
+        self.max_concurrency = max(1, int(max_concurrency))
+        self._async_semaphore: asyncio.Semaphore | None = None
+        self._signal_cache: OrderedDict[str, Tuple[float, Dict[str, Any]]] = OrderedDict()
+        # 同一把锁同时保护信号缓存与各项命中计数；同步调用可能经 asyncio.to_thread 落在工作线程上
+        self._signal_cache_lock = threading.Lock()
+        # 每个交易对一份指标增量状态（MACD 的 EMA、均线滚动窗口），稳态下每根新 K 线只做 O(1) 推进。
+        self._indicator_states: Dict[str, SymbolIndicatorState] = {}
+        # 复用模型结论会改变实际下单行为，默认关闭，由策略参数 signal_cache_enabled 显式开启
+        self.enable_cache = enable_cache
+        # 模型、采样温度与系统提示词在实例生命周期内不变，预先折叠成一个短摘要放进每个缓存键。
+        self._cache_key_prefix = _hash_cache_features((self.model, _TEMPERATURE, _SYSTEM_PROMPT_DIGEST))
+        self._cache_hits = 0
+        self._cache_misses = 0
+        # 关闭快路径时仍评估规则条件（影子模式），只统计不生效，用于开启前确认命中率
+        self.enable_fast_path = enable_fast_path
+        self.fast_path_min_strength = float(fast_path_min_strength)
+        self._fast_path_checks = 0
+        self._fast_path_hits = 0
+        self._model_calls = 0
+        logger.info("GPT信号生成器初始化完成")
+
+    def warm_up_connection(self) -> None:
+        """在后台线程请求一次模型列表，提前完成 DNS、TCP 与 TLS 握手。
+
+        连接建立后留在共享连接池中，首个真实信号请求不再承担建连耗时；该请求不消耗 token，
+        失败只记录日志，不影响后续正常调用。
+        """
+        def _warm_up():
+            started = time.monotonic()
+            try:
+                self.client.with_options(max_retries=0).models.list()
+                logger.info("AI 连接预热完成: elapsed=%.2fs", time.monotonic() - started)
+            except Exception as exc:
+                logger.warning(
+                    "AI 连接预热失败，首次信号请求将重新建连: base_url=%s proxy_enabled=%s error=%s",
+                    self.base_url,
+                    bool(self.proxy_url),
+                    self._format_error_message(exc),
+                )
+
+        threading.Thread(target=_warm_up, name='ai-connection-warmup', daemon=True).start()
 
     def _format_error_message(self, error: Exception) -> str:
         # 统一把底层 SDK、网络和代理错误收敛为更适合运维排查的中文信息。
@@ -54,79 +232,384 @@ class SignalGenerator:
         return raw_message
 
     def get_ai_signal(self, market_data: Dict[str, Any]) -> Dict[str, Any]:
-        logging.info("开始获取AI交易信号")
+        logger.info("开始获取AI交易信号")
+        try:
+            prompt, cache_key, tech_analysis = self._prepare_prompt(market_data)
+            fast_signal = self._build_fast_path_signal(tech_analysis)
+            if fast_signal is not None:
+                return fast_signal
+            cached_signal = self._get_cached_signal(cache_key)
+            if cached_signal is not None:
+                return cached_signal
+
+            logger.info("调用AI模型进行分析")
+            self._count_model_call()
+            response = self._call_ai_model(prompt)
+            logger.debug("AI模型调用完成")
+
+            return self._finalize_signal(response, cache_key, tech_analysis)
+        except Exception as e:
+            # AI 链路失败时返回默认信号而不是继续抛异常，避免单次模型故障直接中断整轮交易循环。
+            return self._handle_signal_error(e)
+
+    async def get_ai_signal_async(
+        self,
+        market_data: Dict[str, Any],
+        async_client: openai.AsyncOpenAI | None = None,
+    ) -> Dict[str, Any]:
+        logger.info("开始异步获取AI交易信号: symbol=%s", market_data.get('symbol'))
         try:
-            # 先在本地完成技术分析与市场环境摘要，尽量减少直接交给模型的原始数据噪音。
-            logging.info("执行技术分析")
-            tech_analysis = TechnicalAnalyzer.perform_technical_analysis(market_data)
-            logging.debug(
+            # 即使调用方自带客户端，也要先确保当前事件循环的共享客户端与并发信号量已就绪。
+            shared_client = self._get_async_client()
+            if async_client is None:
+                async_client = shared_client
+            # 本地分析与提示词构建是纯 CPU 工作，放在 await 之前完成，只有模型调用让出事件循环。
+            prompt, cache_key, tech_analysis = self._prepare_prompt(market_data)
+            fast_signal = self._build_fast_path_signal(tech_analysis)
+            if fast_signal is not None:
+                return fast_signal
+            cached_signal = self._get_cached_signal(cache_key)
+            if cached_signal is not None:
+                return cached_signal
+
+            logger.info("异步调用AI模型进行分析: symbol=%s", market_data.get('symbol'))
+            self._count_model_call()
+            async with self._async_semaphore:
+                response = await self._call_ai_model_async(async_client, prompt)
+            logger.debug("AI模型异步调用完成: symbol=%s", market_data.get('symbol'))
+
+            return self._finalize_signal(response, cache_key, tech_analysis)
+        except Exception as e:
+            return self._handle_signal_error(e)
+
+    async def get_ai_signals_batch(self, market_data_list: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """并发获取多个交易对的 AI 信号，总耗时约等于最慢的一次模型调用，而不是逐个累加。"""
+        logger.info("开始批量获取AI交易信号: count=%s", len(market_data_list))
+        async_client = self._get_async_client()
+        results = await asyncio.gather(
+            *(self.get_ai_signal_async(market_data, async_client) for market_data in market_data_list),
+            return_exceptions=True,
+        )
+        # get_ai_signal_async 内部已兜底；这里再防一层，单个交易对的意外异常不影响其余结果。
+        signals = [
+            self._handle_signal_error(result) if isinstance(result, BaseException) else result
+            for result in results
+        ]
+        logger.info("批量获取AI交易信号完成: count=%s", len(signals))
+        return signals
+
+    def _get_async_client(self) -> openai.AsyncOpenAI:
+        # httpx.AsyncClient 的连接绑定创建时的事件循环；同一循环内复用，换了循环（例如再次 asyncio.run）才重建。
+        loop = asyncio.get_running_loop()
+        if self._async_client is None or self._async_client_loop is not loop:
+            if self._async_client is not None:
+                logger.debug("事件循环已变化，重新创建异步 AI 客户端")
+            self._async_client = create_async_client(
+                self.api_key,
+                self.base_url,
+                self.proxy_url,
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_keepalive_connections,
+                http2=self.http2,
+                request_timeout=self.request_timeout,
+                max_retries=self.max_retries,
+                keepalive_expiry=self.keepalive_expiry,
+            )
+            self._async_client_loop = loop
+            self._async_semaphore = asyncio.Semaphore(self.max_concurrency)
+            logger.info(
+                "创建异步 AI 客户端: max_connections=%s max_keepalive_connections=%s max_concurrency=%s",
+                self.max_connections,
+                self.max_keepalive_connections,
+                self.max_concurrency,
+            )
+        return self._async_client
+
+    async def aclose(self) -> None:
+        """关闭异步 AI 客户端的连接池；需在创建它的事件循环中调用。"""
+        async_client, self._async_client, self._async_client_loop = self._async_client, None, None
+        if async_client is not None:
+            await async_client.close()
+            logger.info("异步 AI 客户端已关闭")
+
+    def _prepare_prompt(self, market_data: Dict[str, Any]) -> Tuple[str, str, Dict[str, Any]]:
+        # 先在本地完成技术分析与市场环境摘要，尽量减少直接交给模型的原始数据噪音。
+        logger.info("执行技术分析")
+        tech_analysis = TechnicalAnalyzer.perform_technical_analysis(market_data, self._get_indicator_state(market_data))
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+        if debug_enabled:
+            logger.debug(
                 "技术分析完成，看涨信号: %s, 看跌信号: %s",
                 tech_analysis.get('bullish_signals', 0),
                 tech_analysis.get('bearish_signals', 0),
             )
 
-            logging.info("评估市场环境")
-            market_context = MarketAnalyzer.assess_market_context(market_data)
-            logging.debug("市场环境评估完成: %s", market_context['details'])
+        logger.info("评估市场环境")
+        market_context = MarketAnalyzer.assess_market_context(market_data)
+        if debug_enabled:
+            logger.debug("市场环境评估完成: %s", market_context['details'])
 
-            logging.info("构建AI分析提示词")
-            prompt = PromptBuilder.build_analysis_prompt(market_data, tech_analysis, market_context)
-            logging.debug("提示词构建完成")
+        logger.info("构建AI分析提示词")
+        prompt = PromptBuilder.build_analysis_prompt(market_data, tech_analysis, market_context)
+        logger.debug("提示词构建完成")
+        return prompt, self._build_cache_key(market_data, tech_analysis, market_context), tech_analysis
 
-            logging.info("调用AI模型进行分析")
-            response = self._call_ai_model(prompt)
-            logging.debug("AI模型调用完成")
+    def _get_indicator_state(self, market_data: Dict[str, Any]) -> SymbolIndicatorState | None:
+        symbol = market_data.get('symbol')
+        # 实盘行情的 timestamps 是 ndarray，不能直接按真值判空
+        timestamps = market_data.get('timestamps')
+        if not symbol or timestamps is None or len(timestamps) == 0:
+            return None
+        state = self._indicator_states.get(symbol)
+        if state is None:
+            state = self._indicator_states[symbol] = SymbolIndicatorState()
+        return state
 
-            # 即便模型返回了文本，也必须先经过解析与结构校验，不能直接把自然语言结果交给执行层。
-            logging.info("解析AI模型响应")
-            signal = ResponseParser.parse_response(response)
-            logging.debug("响应解析完成，建议操作: %s", signal.get('action', 'N/A'))
+    def _build_cache_key(self, market_data: Dict[str, Any], tech_analysis: Dict[str, Any], market_context: Dict[str, Any]) -> str:
+        # 只取对模型结论有决定意义的分桶特征，RSI 取整、MACD 只看方向，避免微小价格抖动导致缓存失效。
+        rsi_value = float(tech_analysis['rsi']['value'])
+        features = (
+            self._cache_key_prefix,
+            market_data.get('symbol'),
+            round(rsi_value),
+            tech_analysis['macd']['trend'],
+            tech_analysis['macd']['crossover'],
+            tech_analysis['price_trend']['trend'],
+            tech_analysis['volume']['trend'],
+            market_context.get('volatility'),
+            market_context.get('trend_direction'),
+        )
+        return _hash_cache_features(features)
 
-            logging.info("验证解析后的信号")
-            if not ResponseParser.validate_signal(signal):
-                logging.warning("信号验证失败，使用默认信号")
-                signal = self._get_default_signal()
+    def _get_cached_signal(self, cache_key: str) -> Dict[str, Any] | None:
+        if not self.enable_cache:
+            return None
+        with self._signal_cache_lock:
+            entry = self._signal_cache.get(cache_key)
+            if entry is not None and entry[0] <= time.monotonic():
+                del self._signal_cache[cache_key]
+                entry = None
+            if entry is None:
+                self._cache_misses += 1
             else:
-                logging.info("信号验证通过")
+                self._signal_cache.move_to_end(cache_key)
+                self._cache_hits += 1
+            hits, misses = self._cache_hits, self._cache_misses
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("AI信号缓存统计: hits=%s misses=%s hit_rate=%.1f%%", hits, misses, hits * 100.0 / (hits + misses))
+        if entry is None:
+            return None
+        signal = entry[1]
+        logger.info("命中AI信号缓存，跳过模型调用: %s (置信度: %.2f)", signal['action'], signal['confidence'])
+        # 上层策略会就地补充字段，必须返回副本，不能污染缓存中的原始信号。
+        return copy.deepcopy(signal)
 
-            logging.info("AI交易信号获取完成: %s (置信度: %.2f)", signal['action'], signal['confidence'])
-            return signal
-        except Exception as e:
-            # AI 链路失败时返回默认信号而不是继续抛异常，避免单次模型故障直接中断整轮交易循环。
-            logging.debug("AI 原始异常: %s", e)
-            logging.error("获取AI交易信号时发生错误: %s", self._format_error_message(e))
-            logging.info("使用默认信号")
-            return self._get_default_signal()
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """返回信号缓存与规则快路径的命中统计，供任务状态或排障日志使用。"""
+        with self._signal_cache_lock:
+            hits, misses, size = self._cache_hits, self._cache_misses, len(self._signal_cache)
+            fast_path_checks, fast_path_hits, model_calls = self._fast_path_checks, self._fast_path_hits, self._model_calls
+        total = hits + misses
+        return {
+            'enabled': self.enable_cache,
+            'hits': hits,
+            'misses': misses,
+            'hit_rate': (hits / total) if total else 0.0,
+            'size': size,
+            'fast_path_enabled': self.enable_fast_path,
+            'fast_path_checks': fast_path_checks,
+            'fast_path_hits': fast_path_hits,
+            'fast_path_hit_rate': (fast_path_hits / fast_path_checks) if fast_path_checks else 0.0,
+            'model_calls': model_calls,
+        }
+
+    def _count_model_call(self) -> None:
+        with self._signal_cache_lock:
+            self._model_calls += 1
+
+    def _build_fast_path_signal(self, tech_analysis: Dict[str, Any]) -> Dict[str, Any] | None:
+        """本地指标高度一致且未被 RSI 极端区域拦截时，按规则直接给出同向信号；否则返回 None 交给模型。
+
+        未开启快路径时同样评估并统计命中次数，但始终返回 None。
+        """
+        if not tech_analysis:
+            return None
+        signal = self._match_fast_path(tech_analysis)
+        with self._signal_cache_lock:
+            self._fast_path_checks += 1
+            if signal is not None:
+                self._fast_path_hits += 1
+            checks, hits, model_calls = self._fast_path_checks, self._fast_path_hits, self._model_calls
+        if checks % _FAST_PATH_STATS_LOG_INTERVAL == 0:
+            logger.info(
+                "规则快路径统计: enabled=%s checks=%s hits=%s hit_rate=%.2f%% model_calls=%s",
+                self.enable_fast_path,
+                checks,
+                hits,
+                100.0 * hits / checks,
+                model_calls,
+            )
+        if signal is None:
+            return None
+        if not self.enable_fast_path:
+            logger.debug("规则快路径未开启，影子命中不生效: %s (置信度: %.2f)", signal['action'], signal['confidence'])
+            return None
+        logger.info(
+            "技术信号高度一致，跳过模型调用: %s (置信度: %.2f) fast_path_hits=%s model_calls=%s",
+            signal['action'],
+            signal['confidence'],
+            hits,
+            model_calls,
+        )
+        return signal
+
+    def _match_fast_path(self, tech_analysis: Dict[str, Any]) -> Dict[str, Any] | None:
+        bias = tech_analysis.get('signal_bias')
+        strength = float(tech_analysis.get('overall_strength', 0.0))
+        if bias == 'bullish':
+            action, concordant, blocked = 'buy', tech_analysis.get('bullish_signals', 0), tech_analysis.get('buy_blocked')
+        elif bias == 'bearish':
+            action, concordant, blocked = 'sell', tech_analysis.get('bearish_signals', 0), tech_analysis.get('sell_blocked')
+        else:
+            return None
+        if concordant < _FAST_PATH_MIN_SIGNALS or strength <= self.fast_path_min_strength or blocked:
+            return None
+
+        return {
+            "action": action,
+            "confidence": min(_FAST_PATH_MAX_CONFIDENCE, strength),
+            "reason": f"规则快路径：{concordant} 个技术信号同向（{bias}），信号强度 {strength:.2f}",
+            "stop_loss_pct": 0.05,
+            "take_profit_pct": 0.1,
+            "expected_risk_reward": 2.0,
+            "validity_period_hours": 1,
+            "key_conditions": ["规则快路径"],
+        }
+
+    def _store_cached_signal(self, cache_key: str, signal: Dict[str, Any]) -> None:
+        if not self.enable_cache:
+            return
+        try:
+            validity_seconds = float(signal.get('validity_period_hours', 1)) * 3600
+        except (TypeError, ValueError):
+            validity_seconds = 3600
+        ttl_seconds = min(max(validity_seconds, 0.0), _SIGNAL_CACHE_MAX_TTL_SECONDS)
+        if ttl_seconds <= 0:
+            return
+        with self._signal_cache_lock:
+            self._signal_cache[cache_key] = (time.monotonic() + ttl_seconds, copy.deepcopy(signal))
+            self._signal_cache.move_to_end(cache_key)
+            while len(self._signal_cache) > _SIGNAL_CACHE_MAX_SIZE:
+                self._signal_cache.popitem(last=False)
+        logger.debug("AI信号已写入缓存: ttl_seconds=%.0f cache_size=%s", ttl_seconds, len(self._signal_cache))
+
+    def _finalize_signal(
+        self,
+        response: str,
+        cache_key: str | None = None,
+        tech_analysis: Dict[str, Any] | None = None,
+    ) -> Dict[str, Any]:
+        # 即便模型返回了文本，也必须先经过解析与结构校验，不能直接把自然语言结果交给执行层。
+        logger.info("解析AI模型响应")
+        signal = ResponseParser.parse_response(response)
+        logger.debug("响应解析完成，建议操作: %s", signal.get('action', 'N/A'))
+
+        logger.info("验证解析后的信号")
+        if not ResponseParser.validate_signal(signal, tech_analysis):
+            logger.warning("信号验证失败，使用默认信号")
+            signal = self._get_default_signal()
+        else:
+            logger.info("信号验证通过")
+            # 只缓存通过校验的模型结论；兜底默认信号不入缓存，下一轮仍会重新请求模型。
+            if cache_key is not None:
+                self._store_cached_signal(cache_key, signal)
+
+        logger.info("AI交易信号获取完成: %s (置信度: %.2f)", signal['action'], signal['confidence'])
+        return signal
+
+    def _handle_signal_error(self, error: Exception) -> Dict[str, Any]:
+        logger.debug("AI 原始异常: %s", error)
+        logger.error("获取AI交易信号时发生错误: %s", self._format_error_message(error))
+        logger.info("使用默认信号")
+        return self._get_default_signal()
+
+    @staticmethod
+    def _build_messages(prompt: str) -> List[Dict[str, str]]:
+        return [_SYSTEM_MESSAGE, {"role": "user", "content": prompt}]
 
     def _call_ai_model(self, prompt: str) -> str:
-        logging.debug('开始调用AI模型: model=%s prompt_length=%s', self.model, len(prompt))
-        response = self.client.chat.completions.create(
+        logger.debug('开始调用AI模型: model=%s prompt_length=%s', self.model, len(prompt))
+        stream = self.client.chat.completions.create(
             model=self.model,
-            messages=[
-                {
-                    "role": "system",
-                    "content": """你是一个专业的量化交易分析师。请基于提供的市场数据和技术指标进行综合分析，给出理性的交易建议。
-
-分析原则：
-1. 多重验证：至少需要2个以上技术指标支持同一方向
-2. 风险优先：优先考虑风险管理，避免在不确定时交易
-3. 趋势跟随：尊重当前趋势，不逆势操作
-4. 概率思维：基于历史统计概率做出决策
-""",
-                },
-                {"role": "user", "content": prompt},
-            ],
-            temperature=0.1,
-            max_tokens=500,
+            messages=self._build_messages(prompt),
+            temperature=_TEMPERATURE,
+            max_tokens=_MAX_COMPLETION_TOKENS,
+            stream=True,
         )
 
-        result = response.choices[0].message.content
-        logging.debug('AI模型调用完成: response_length=%s', len(result or ''))
+        detector = _JsonObjectCloseDetector()
+        parts: List[str] = []
+        # 读超时只约束相邻两个分片的间隔；模型持续慢速吐字时用总时长兜底，避免长期占用连接池槽位。
+        deadline_seconds = self.request_timeout * _STREAM_DEADLINE_FACTOR
+        deadline = time.monotonic() + deadline_seconds
+        try:
+            for chunk in stream:
+                if self._collect_stream_chunk(chunk, parts, detector):
+                    logger.debug('AI响应JSON已闭合，提前结束流式读取')
+                    break
+                if time.monotonic() > deadline:
+                    raise TimeoutError(f'AI 流式响应超过 {deadline_seconds:.0f} 秒仍未完成')
+        finally:
+            # 提前 break 时关闭底层响应，服务端随即停止生成，连接归还连接池。
+            stream.close()
+
+        result = ''.join(parts)
+        logger.debug('AI模型调用完成: response_length=%s', len(result))
         return result
 
+    async def _call_ai_model_async(self, async_client: openai.AsyncOpenAI, prompt: str) -> str:
+        logger.debug('开始异步调用AI模型: model=%s prompt_length=%s', self.model, len(prompt))
+        # 与同步路径相同的总时长兜底：wait_for 超时会取消读取协程，finally 中关闭流释放连接。
+        result = await asyncio.wait_for(
+            self._read_ai_stream_async(async_client, prompt),
+            timeout=self.request_timeout * _STREAM_DEADLINE_FACTOR,
+        )
+        logger.debug('AI模型异步调用完成: response_length=%s', len(result))
+        return result
+
+    async def _read_ai_stream_async(self, async_client: openai.AsyncOpenAI, prompt: str) -> str:
+        stream = await async_client.chat.completions.create(
+            model=self.model,
+            messages=self._build_messages(prompt),
+            temperature=_TEMPERATURE,
+            max_tokens=_MAX_COMPLETION_TOKENS,
+            stream=True,
+        )
+
+        detector = _JsonObjectCloseDetector()
+        parts: List[str] = []
+        try:
+            async for chunk in stream:
+                if self._collect_stream_chunk(chunk, parts, detector):
+                    logger.debug('AI响应JSON已闭合，提前结束异步流式读取')
+                    break
+        finally:
+            await stream.close()
+        return ''.join(parts)
+
+    @staticmethod
+    def _collect_stream_chunk(chunk: Any, parts: List[str], detector: _JsonObjectCloseDetector) -> bool:
+        if not chunk.choices:
+            return False
+        content = chunk.choices[0].delta.content
+        if not content:
+            return False
+        parts.append(content)
+        return detector.feed(content)
+
     def _get_default_signal(self) -> Dict[str, Any]:
         # 默认信号是降级保护，用来显式阻止在数据不足或 AI 调用失败时继续贸然交易。
-        logging.info("生成默认信号")
+        logger.info("生成默认信号")
         default_signal = {
             "action": "hold",
             "confidence": 0.3,
@@ -137,5 +620,5 @@ class SignalGenerator:
             "validity_period_hours": 1,
             "key_conditions": ["系统备用"],
         }
-        logging.debug("默认信号生成完成: %s", default_signal)
+        logger.debug("默认信号生成完成: %s", default_signal)
         return default_signal
@@ -1,7 +1,252 @@
+from collections import deque
 import numpy as np
-import pandas as pd
 import logging
 
+from .numeric_kernels import NUMBA_ENABLED
+from .numeric_kernels import compute_all_indicators
+from .numeric_kernels import decayed_cumsum
+from .numeric_kernels import ema_adjusted
+from .numeric_kernels import macd_tail
+from .numeric_kernels import moving_average_pair
+from .numeric_kernels import recent_and_previous_mean
+from .numeric_kernels import wilder_averages
+from .numeric_kernels import wilder_rsi
+
+try:
+    import talib
+except ImportError:  # TA-Lib 需要本地 C 库，不在默认锁定依赖中
+    talib = None
+
+logger = logging.getLogger(__name__)
+
+# RSI 超买超卖强度按 30 个点归一化，预先取倒数，把除法换成乘法。
+_INV_RSI_BAND = 1.0 / 30.0
+
+
+def get_cached_array(market_data, key):
+    """按需把 market_data 中的序列转换为 float64 数组，并缓存在 `_<key>_np` 上供同一轮分析复用。"""
+    cache_key = f'_{key}_np'
+    values = market_data.get(key)
+    if values is None:
+        values = []
+    cached = market_data.get(cache_key)
+    # 长度不一致说明原始序列已被替换或追加，此时必须重新转换，避免复用过期数组。
+    if cached is None or len(cached) != len(values):
+        cached = np.asarray(values, dtype=np.float64)
+        market_data[cache_key] = cached
+    return cached
+
+
+def _wilder_average_series(prices, period):
+    """返回逐点的 Wilder 平均涨幅 / 平均跌幅两条序列，长度均为 max(len(prices) - 1 - period, 0) + 1。
+
+    首项取前 period 个差分的简单均值作为种子，之后的平滑 avg = decay * avg + alpha * x 是一阶线性递推，
+    交给 decayed_cumsum 分块向量化完成。两条序列各只分配一次，涨跌幅直接写入预分配缓冲区后原地递推，
+    不再经过 np.maximum / 乘 alpha / concatenate 三次中间数组。种子之后的差分用 np.subtract 直接写进
+    up 缓冲区，不再用 np.diff 为整段价格另外分配一条差分数组。
+    """
+    alpha = 1.0 / period
+    count = max(prices.shape[0] - 1 - period, 0) + 1
+    up = np.empty(count, dtype=np.float64)
+    down = np.empty(count, dtype=np.float64)
+    head = np.diff(prices[:period + 1])
+    up[0] = np.maximum(head, 0.0).sum() / period
+    down[0] = np.maximum(-head, 0.0).sum() / period
+    tail = np.subtract(prices[period + 1:], prices[period:-1], out=up[1:])
+    # 先取跌幅再原地截取涨幅；-min(x, 0) * alpha 与 max(-x, 0) * alpha 数值完全相同，省去一次取负的临时数组
+    np.minimum(tail, 0.0, out=down[1:])
+    down[1:] *= -alpha
+    np.maximum(tail, 0.0, out=tail)
+    tail *= alpha
+    decay = 1.0 - alpha
+    decayed_cumsum(up, decay, out=up)
+    decayed_cumsum(down, decay, out=down)
+    return up, down
+
+
+# MACD 三条 EMA 的衰减系数 (1 - alpha)，alpha = 2 / (span + 1)。
+_MACD_FAST_DECAY = 1.0 - 2.0 / 13.0
+_MACD_SLOW_DECAY = 1.0 - 2.0 / 27.0
+_MACD_SIGNAL_DECAY = 1.0 - 2.0 / 10.0
+_MACD_EMPTY_SUMS = (0.0, 0.0, 0.0, 0.0, 0.0, 0.0)
+
+
+def _macd_step(sums, close):
+    """在 EMA 累加量上推进一根 K 线，返回 (新累加量, MACD 线, 信号线)。"""
+    fast_num = close + _MACD_FAST_DECAY * sums[0]
+    fast_den = 1.0 + _MACD_FAST_DECAY * sums[1]
+    slow_num = close + _MACD_SLOW_DECAY * sums[2]
+    slow_den = 1.0 + _MACD_SLOW_DECAY * sums[3]
+    macd = fast_num / fast_den - slow_num / slow_den
+    signal_num = macd + _MACD_SIGNAL_DECAY * sums[4]
+    signal_den = 1.0 + _MACD_SIGNAL_DECAY * sums[5]
+    return (fast_num, fast_den, slow_num, slow_den, signal_num, signal_den), macd, signal_num / signal_den
+
+
+def _find_closed_index(timestamps, last_timestamp):
+    """返回上次已处理的收盘 K 线在本轮 timestamps 中的下标；首次调用、已滑出窗口或数据回退时返回 -1。"""
+    if last_timestamp is None:
+        return -1
+    index = int(np.searchsorted(timestamps, last_timestamp))
+    if index >= len(timestamps) - 1 or int(timestamps[index]) != last_timestamp:
+        return -1
+    return index
+
+
+class MacdState:
+    """单个交易对的 MACD 增量状态，只保存截至最近一根已收盘 K 线的 EMA 累加量。
+
+    pandas 的 `ewm(span=...)` 默认 adjust=True，其均值等于两个累加量之比：
+    num_t = x_t + (1 - alpha) * num_{t-1}，den_t = 1 + (1 - alpha) * den_{t-1}。
+    保存这两个量即可 O(1) 推进一根 K 线；最后一根 K 线仍在变化，只临时计算、不写回状态。
+    """
+
+    __slots__ = ('last_timestamp', 'sums', 'prev_macd', 'prev_signal')
+
+    def __init__(self):
+        self.last_timestamp = None
+        self.sums = _MACD_EMPTY_SUMS
+        self.prev_macd = 0.0
+        self.prev_signal = 0.0
+
+    def update(self, closes, timestamps):
+        """返回 (上一根 MACD, 当前 MACD, 上一根信号线, 当前信号线)。"""
+        closed_timestamp = timestamps[-2]
+        if self.last_timestamp != closed_timestamp:
+            index = _find_closed_index(timestamps, self.last_timestamp)
+            if index >= 0:
+                # 只推进上次之后新收盘的 K 线，稳态下通常只有一根
+                for close in closes[index + 1:-1]:
+                    self.sums, self.prev_macd, self.prev_signal = _macd_step(self.sums, float(close))
+            else:
+                # 首次调用或中间出现缺口：用已收盘部分整体回填一次
+                logger.debug("MACD增量状态回填，数据点数: %s", len(closes) - 1)
+                sums, macd, signal = _MACD_EMPTY_SUMS, 0.0, 0.0
+                for close in closes[:-1]:
+                    sums, macd, signal = _macd_step(sums, float(close))
+                self.sums, self.prev_macd, self.prev_signal = sums, macd, signal
+            self.last_timestamp = closed_timestamp
+        _, macd, signal = _macd_step(self.sums, float(closes[-1]))
+        return self.prev_macd, macd, self.prev_signal, signal
+
+
+class RsiState:
+    """单个交易对的 RSI 增量状态，保存截至最近一根已收盘 K 线的 Wilder 平均涨跌幅。
+
+    新收盘的每根 K 线只做一次 O(1) 平滑；最后一根 K 线仍在变化，只临时计算、不写回状态。
+    首次调用或数据出现缺口时，用已收盘部分按 `compute_rsi` 相同的种子规则整体回填。
+    """
+
+    __slots__ = ('period', 'last_timestamp', 'last_close', 'up', 'down')
+
+    def __init__(self, period=14):
+        self.period = period
+        self.last_timestamp = None
+        self.last_close = 0.0
+        self.up = 0.0
+        self.down = 0.0
+
+    def update(self, closes, timestamps):
+        """返回当前 RSI，要求 len(closes) > period + 1 且 timestamps 升序。"""
+        closed_timestamp = int(timestamps[-2])
+        if self.last_timestamp != closed_timestamp:
+            index = _find_closed_index(timestamps, self.last_timestamp)
+            if index >= 0:
+                # 只推进上次之后新收盘的 K 线，稳态下通常只有一根
+                for close in closes[index + 1:-1]:
+                    close = float(close)
+                    self.up, self.down = self._smooth(close - self.last_close)
+                    self.last_close = close
+            else:
+                logger.debug("RSI增量状态回填，数据点数: %s", len(closes) - 1)
+                self._backfill(np.asarray(closes[:-1], dtype=np.float64))
+            self.last_timestamp = closed_timestamp
+        up, down = self._smooth(float(closes[-1]) - self.last_close)
+        total = up + down
+        return 100.0 * up / total if total > 0.0 else 0.0
+
+    def _smooth(self, delta):
+        gain = delta if delta > 0 else 0.0
+        loss = -delta if delta < 0 else 0.0
+        period = self.period
+        return (self.up * (period - 1) + gain) / period, (self.down * (period - 1) + loss) / period
+
+    def _backfill(self, closed):
+        if NUMBA_ENABLED:
+            # 装有 numba 时回填走编译后的单次循环，不分配中间数组
+            up, down = wilder_averages(closed, self.period)
+            self.up, self.down, self.last_close = float(up), float(down), float(closed[-1])
+            return
+        up, down = _wilder_average_series(closed, self.period)
+        self.up = float(up[-1])
+        self.down = float(down[-1])
+        self.last_close = float(closed[-1])
+
+
+class RollingMean:
+    """固定窗口滚动均值：deque 保存窗口内的值，运行和随入队 / 出队 O(1) 更新。"""
+
+    __slots__ = ('size', 'buffer', 'total')
+
+    def __init__(self, size):
+        self.size = size
+        self.buffer = deque(maxlen=size)
+        self.total = 0.0
+
+    def push(self, value):
+        if len(self.buffer) == self.size:
+            self.total -= self.buffer[0]
+        self.buffer.append(value)
+        self.total += value
+
+    def mean_with(self, pending):
+        """把尚未入队的 pending 视为窗口最后一个值时的均值。"""
+        return (self.total + pending) / (len(self.buffer) + 1)
+
+
+class PriceTrendState:
+    """单个交易对的均线增量状态，窗口只保存已收盘 K 线，最后一根 K 线临时参与计算。"""
+
+    __slots__ = ('short_period', 'long_period', 'last_timestamp', 'short_mean', 'long_mean')
+
+    def __init__(self, short_period=10, long_period=20):
+        self.short_period = short_period
+        self.long_period = long_period
+        self.last_timestamp = None
+        self.short_mean = RollingMean(short_period - 1)
+        self.long_mean = RollingMean(long_period - 1)
+
+    def update(self, closes, timestamps):
+        """返回 (短期均值, 长期均值)，要求 len(closes) >= long_period。"""
+        closed_timestamp = timestamps[-2]
+        if self.last_timestamp != closed_timestamp:
+            if self.last_timestamp is not None and len(timestamps) >= 3 and timestamps[-3] == self.last_timestamp:
+                close = float(closes[-2])
+                self.short_mean.push(close)
+                self.long_mean.push(close)
+            else:
+                # 首次调用或中间出现缺口：重建两个窗口，同时清掉运行和累积的浮点误差
+                self.short_mean = RollingMean(self.short_period - 1)
+                self.long_mean = RollingMean(self.long_period - 1)
+                for close in closes[-self.long_period:-1]:
+                    close = float(close)
+                    self.short_mean.push(close)
+                    self.long_mean.push(close)
+            self.last_timestamp = closed_timestamp
+        current_price = float(closes[-1])
+        return self.short_mean.mean_with(current_price), self.long_mean.mean_with(current_price)
+
+
+class SymbolIndicatorState:
+    """单个交易对跨周期保留的指标增量状态。"""
+
+    __slots__ = ('macd', 'price_trend', 'rsi')
+
+    def __init__(self):
+        self.macd = MacdState()
+        self.price_trend = PriceTrendState()
+        self.rsi = RsiState()
+
 
 class TechnicalAnalyzer:
     """技术指标分析器
@@ -23,24 +268,53 @@ class TechnicalAnalyzer:
         Returns:
             numpy.ndarray: RSI值数组
         """
-        logging.debug(f"计算RSI指标，周期: {period}，数据点数: {len(prices)}")
-        deltas = np.diff(prices)
-        seed = deltas[:period]
-        up = seed[seed >= 0].sum() / period
-        down = -seed[seed < 0].sum() / period
-        rs = up / (down + 1e-10)
-        rsi = 100 - (100 / (1 + rs))
-
-        for i in range(period, len(deltas)):
-            delta = deltas[i]
-            up = (up * (period - 1) + max(delta, 0)) / period
-            down = (down * (period - 1) + max(-delta, 0)) / period
-            rs = up / (down + 1e-10)
-            rsi = np.append(rsi, 100 - (100 / (1 + rs)))
-
-        logging.debug(f"RSI计算完成，最新值: {rsi[-1]:.2f}")
+        logger.debug("计算RSI指标，周期: %s，数据点数: %s", period, len(prices))
+        prices = np.asarray(prices, dtype=np.float64)
+        if talib is not None and prices.shape[0] > period:
+            # TA-Lib 的 RSI 同样以前 period 个差分的简单均值为种子做 Wilder 平滑，
+            # 前 period 个位置为 NaN，截掉后与下方实现逐点对齐。
+            rsi = talib.RSI(np.ascontiguousarray(prices), timeperiod=period)[period:]
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("RSI计算完成(TA-Lib)，最新值: %.2f", rsi[-1])
+            return rsi
+        if NUMBA_ENABLED:
+            # 编译后的逐点递推即使只有几十根 K 线也比分块向量化少一个数量级的调用开销，装有 numba 时不再按长度分流
+            rsi = wilder_rsi(prices, period)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("RSI计算完成(numba)，最新值: %.2f", rsi[-1])
+            return rsi
+
+        # RSI = 100 * up / (up + down)，原地写回 up 缓冲区；涨跌均为 0 的位置 up 本身为 0，跳过除法后即为 0
+        up, down = _wilder_average_series(prices, period)
+        total = np.add(up, down, out=down)
+        rsi = np.divide(up, total, out=up, where=total > 0.0)
+        rsi *= 100.0
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("RSI计算完成，最新值: %.2f", rsi[-1])
         return rsi
 
+    @staticmethod
+    def compute_macd_tail(closes):
+        """返回 (上一根 MACD, 当前 MACD, 上一根信号线, 当前信号线) 四个 float，不足两根时上一根的值为 None。
+
+        指标只用到末尾两点：装有 numba 时只推进标量累加量；纯 NumPy 下信号线依赖整条 MACD 线，仍按数组计算。
+        """
+        closes = np.asarray(closes, dtype=np.float64)
+        if NUMBA_ENABLED:
+            prev_macd, macd_value, prev_signal, signal_value = (float(value) for value in macd_tail(closes))
+        else:
+            macd_line = ema_adjusted(closes, 12) - ema_adjusted(closes, 26)
+            signal_line = ema_adjusted(macd_line, 9)
+            macd_value = float(macd_line[-1])
+            signal_value = float(signal_line[-1])
+            if closes.shape[0] >= 2:
+                prev_macd = float(macd_line[-2])
+                prev_signal = float(signal_line[-2])
+        if closes.shape[0] < 2:
+            prev_macd = prev_signal = None
+        return prev_macd, macd_value, prev_signal, signal_value
+
     @staticmethod
     def analyze_rsi(rsi_value):
         """分析RSI指标状态
@@ -53,7 +327,7 @@ class TechnicalAnalyzer:
         Returns:
             dict: 包含RSI分析结果的字典
         """
-        logging.debug(f"分析RSI指标状态，当前值: {rsi_value}")
+        logger.debug("分析RSI指标状态，当前值: %s", rsi_value)
         rsi_analysis = {
             'value': rsi_value,
             'condition': 'neutral',
@@ -62,39 +336,49 @@ class TechnicalAnalyzer:
         }
 
         if rsi_value < 30:
-            rsi_analysis.update({'condition': 'oversold', 'strength': min(1.0, (30 - rsi_value) / 30)})
+            rsi_analysis.update({'condition': 'oversold', 'strength': min(1.0, (30 - rsi_value) * _INV_RSI_BAND)})
             rsi_analysis['details'] = f'RSI {rsi_value:.1f} 处于超卖区域'
-            logging.debug("RSI处于超卖状态")
+            logger.debug("RSI处于超卖状态")
         elif rsi_value > 70:
-            rsi_analysis.update({'condition': 'overbought', 'strength': min(1.0, (rsi_value - 70) / 30)})
+            rsi_analysis.update({'condition': 'overbought', 'strength': min(1.0, (rsi_value - 70) * _INV_RSI_BAND)})
             rsi_analysis['details'] = f'RSI {rsi_value:.1f} 处于超买区域'
-            logging.debug("RSI处于超买状态")
+            logger.debug("RSI处于超买状态")
         else:
             rsi_analysis['strength'] = 0.5
             rsi_analysis['details'] = f'RSI {rsi_value:.1f} 处于中性区域'
-            logging.debug("RSI处于中性状态")
+            logger.debug("RSI处于中性状态")
 
         return rsi_analysis
 
     @staticmethod
-    def analyze_macd(closes):
+    def analyze_macd(closes, state=None, timestamps=None):
         """分析MACD指标
         
         异同移动平均线（MACD）用于判断价格趋势和动量。
+        传入 state 与 timestamps 时按 K 线增量推进 EMA，只对新收盘的 K 线做 O(1) 更新；
+        否则对整段收盘价全量计算。
         
         Args:
             closes (list): 收盘价序列
+            state (MacdState): 该交易对的 MACD 增量状态，可选
+            timestamps (list): 与 closes 对齐的 K 线时间戳，可选
             
         Returns:
             tuple: (macd_analysis, macd_line, signal_line, macd_histogram)
         """
-        logging.debug(f"分析MACD指标，数据点数: {len(closes)}")
-        # 计算MACD相关值
-        ema12 = pd.Series(closes).ewm(span=12).mean().values
-        ema26 = pd.Series(closes).ewm(span=26).mean().values
-        macd_line = ema12 - ema26
-        signal_line = pd.Series(macd_line).ewm(span=9).mean().values
-        macd_histogram = macd_line - signal_line
+        logger.debug("分析MACD指标，数据点数: %s", len(closes))
+        if state is not None and timestamps is not None and len(closes) >= 2 and len(timestamps) == len(closes):
+            prev_macd, macd_value, prev_signal, signal_value = state.update(closes, timestamps)
+        else:
+            # 计算MACD相关值：EMA 直接在 float64 数据上递推，省去三次 pandas Series 构造与拆箱
+            prev_macd, macd_value, prev_signal, signal_value = TechnicalAnalyzer.compute_macd_tail(closes)
+        macd_analysis, macd_histogram = TechnicalAnalyzer._classify_macd(macd_value, signal_value, prev_macd, prev_signal)
+        return macd_analysis, macd_value, signal_value, macd_histogram
+
+    @staticmethod
+    def _classify_macd(macd_value, signal_value, prev_macd=None, prev_signal=None):
+        """根据最新与上一根的 MACD / 信号线数值给出趋势、动量与交叉结论，返回 (分析结果, 柱值)。"""
+        macd_histogram = macd_value - signal_value
 
         # MACD分析
         macd_analysis = {
@@ -105,80 +389,98 @@ class TechnicalAnalyzer:
         }
 
         # MACD趋势判断
-        if macd_histogram[-1] > 0:
+        if macd_histogram > 0:
             macd_analysis['trend'] = 'bullish'
-            macd_analysis['momentum'] = min(1.0, float(macd_histogram[-1]) / (abs(float(macd_line[-1])) + 1e-10))
-            logging.debug("MACD呈看涨趋势")
+            macd_analysis['momentum'] = min(1.0, macd_histogram / (abs(macd_value) + 1e-10))
+            logger.debug("MACD呈看涨趋势")
         else:
             macd_analysis['trend'] = 'bearish'
-            macd_analysis['momentum'] = min(1.0, abs(float(macd_histogram[-1])) / (abs(float(macd_line[-1])) + 1e-10))
-            logging.debug("MACD呈看跌趋势")
+            macd_analysis['momentum'] = min(1.0, abs(macd_histogram) / (abs(macd_value) + 1e-10))
+            logger.debug("MACD呈看跌趋势")
 
         # 金叉死叉判断
-        if len(macd_line) >= 2 and len(signal_line) >= 2:
+        if prev_macd is not None:
             # 检查是否发生金叉（MACD线上穿信号线）
-            if macd_line[-2] <= signal_line[-2] and macd_line[-1] > signal_line[-1]:
+            if prev_macd <= prev_signal and macd_value > signal_value:
                 macd_analysis['crossover'] = 'golden'
                 macd_analysis['details'] = 'MACD金叉，看涨信号'
-                logging.info("检测到MACD金叉信号")
+                logger.info("检测到MACD金叉信号")
             # 检查是否发生死叉（MACD线下穿信号线）
-            elif macd_line[-2] >= signal_line[-2] and macd_line[-1] < signal_line[-1]:
+            elif prev_macd >= prev_signal and macd_value < signal_value:
                 macd_analysis['crossover'] = 'death'
                 macd_analysis['details'] = 'MACD死叉，看跌信号'
-                logging.info("检测到MACD死叉信号")
+                logger.info("检测到MACD死叉信号")
             else:
                 macd_analysis['details'] = 'MACD无明显交叉信号'
-                logging.debug("MACD无明显交叉信号")
+                logger.debug("MACD无明显交叉信号")
         else:
             macd_analysis['details'] = '数据不足，无法判断交叉信号'
-            logging.warning("数据不足，无法判断MACD交叉信号")
+            logger.warning("数据不足，无法判断MACD交叉信号")
 
-        logging.debug(f"MACD分析完成，趋势: {macd_analysis['trend']}, 动量: {macd_analysis['momentum']:.2f}")
-        return macd_analysis, macd_line[-1], signal_line[-1], macd_histogram[-1]
+        logger.debug("MACD分析完成，趋势: %s, 动量: %.2f", macd_analysis['trend'], macd_analysis['momentum'])
+        return macd_analysis, macd_histogram
 
     @staticmethod
-    def analyze_price_trend(closes, short_period=10, long_period=20):
+    def analyze_price_trend(closes, short_period=10, long_period=20, state=None, timestamps=None):
         """分析价格趋势
         
         通过比较不同周期的移动平均线来判断价格趋势。
+        传入周期匹配的 state 与 timestamps 时，均线由滚动窗口 O(1) 更新。
         
         Args:
             closes (list): 收盘价序列
             short_period (int): 短期周期，默认为10
             long_period (int): 长期周期，默认为20
+            state (PriceTrendState): 该交易对的均线增量状态，可选
+            timestamps (list): 与 closes 对齐的 K 线时间戳，可选
             
         Returns:
             dict: 包含价格趋势分析结果的字典
         """
-        logging.debug(f"分析价格趋势，短期周期: {short_period}，长期周期: {long_period}，数据点数: {len(closes)}")
+        logger.debug("分析价格趋势，短期周期: %s，长期周期: %s，数据点数: %s", short_period, long_period, len(closes))
         if len(closes) < long_period:
-            logging.warning("数据不足，无法进行价格趋势分析")
+            logger.warning("数据不足，无法进行价格趋势分析")
             return {'trend': 'neutral', 'strength': 0, 'details': '数据不足'}
 
-        short_ma = sum(closes[-short_period:]) / short_period
-        long_ma = sum(closes[-long_period:]) / long_period
-        current_price = closes[-1]
+        if (
+            state is not None
+            and timestamps is not None
+            and len(timestamps) == len(closes)
+            and state.short_period == short_period
+            and state.long_period == long_period
+        ):
+            short_ma, long_ma = state.update(closes, timestamps)
+        else:
+            # 列表入参会在这里转换一次；perform_technical_analysis 传入的缓存数组则直接零拷贝复用。
+            closes = np.asarray(closes, dtype=np.float64)
+            short_ma, long_ma = moving_average_pair(closes, short_period, long_period)
+            short_ma = float(short_ma)
+            long_ma = float(long_ma)
+        return TechnicalAnalyzer._classify_price_trend(float(closes[-1]), short_ma, long_ma)
 
+    @staticmethod
+    def _classify_price_trend(current_price, short_ma, long_ma):
+        """根据当前价与短长均线的排列判断价格趋势。"""
         # 趋势判断
         if current_price > short_ma > long_ma:
             trend = 'up'
             strength = min(1.0, (current_price - long_ma) / long_ma * 10)
-            logging.debug("价格呈上升趋势")
+            logger.debug("价格呈上升趋势")
         elif current_price < short_ma < long_ma:
             trend = 'down'
             strength = min(1.0, (long_ma - current_price) / long_ma * 10)
-            logging.debug("价格呈下降趋势")
+            logger.debug("价格呈下降趋势")
         else:
             trend = 'neutral'
             strength = 0.5
-            logging.debug("价格呈震荡趋势")
+            logger.debug("价格呈震荡趋势")
 
         result = {
             'trend': trend,
             'strength': strength,
             'details': f'价格趋势: {trend}, 短期MA: {short_ma:.2f}, 长期MA: {long_ma:.2f}'
         }
-        logging.debug(f"价格趋势分析完成: {result['details']}")
+        logger.debug("价格趋势分析完成: %s", result['details'])
         return result
 
     @staticmethod
@@ -193,102 +495,156 @@ class TechnicalAnalyzer:
         Returns:
             dict: 包含成交量分析结果的字典
         """
-        logging.debug(f"分析成交量趋势，数据点数: {len(volumes)}")
+        logger.debug("分析成交量趋势，数据点数: %s", len(volumes))
         if len(volumes) < 10:
-            logging.warning("成交量数据不足，无法进行分析")
+            logger.warning("成交量数据不足，无法进行分析")
             return {'trend': 'neutral', 'details': '数据不足'}
 
         # 计算最近5期和之前5期的平均成交量
-        recent_volume = sum(volumes[-5:]) / 5
-        previous_volume = sum(volumes[-10:-5]) / 5
+        volumes = np.asarray(volumes, dtype=np.float64)
+        recent_volume, previous_volume = recent_and_previous_mean(volumes, 5)
+        return TechnicalAnalyzer._classify_volume(float(recent_volume), float(previous_volume))
 
+    @staticmethod
+    def _classify_volume(recent_volume, previous_volume):
+        """比较最近与之前两段成交量均值，判断成交量趋势。"""
         # 判断成交量趋势
         if recent_volume > previous_volume * 1.1:  # 成交量增加超过10%
             trend = 'increasing'
             details = f'成交量增加，当前: {recent_volume:.2f}, 之前: {previous_volume:.2f}'
-            logging.debug("成交量呈上升趋势")
+            logger.debug("成交量呈上升趋势")
         elif recent_volume < previous_volume * 0.9:  # 成交量减少超过10%
             trend = 'decreasing'
             details = f'成交量减少，当前: {recent_volume:.2f}, 之前: {previous_volume:.2f}'
-            logging.debug("成交量呈下降趋势")
+            logger.debug("成交量呈下降趋势")
         else:
             trend = 'stable'
             details = f'成交量稳定，当前: {recent_volume:.2f}, 之前: {previous_volume:.2f}'
-            logging.debug("成交量保持稳定")
+            logger.debug("成交量保持稳定")
 
         result = {
             'trend': trend,
             'details': details
         }
-        logging.debug(f"成交量分析完成: {result['details']}")
+        logger.debug("成交量分析完成: %s", result['details'])
         return result
 
     @staticmethod
-    def perform_technical_analysis(market_data):
+    def _analyze_fused(closes, volumes, technicals):
+        """无增量状态时单次遍历收盘价得到全部指标，再交给各自的分类逻辑，结论与逐项分析一致。"""
+        bundle = compute_all_indicators(closes, volumes)
+        # RSI 只取行情侧已经算好的值，缺失时按中性 50 处理
+        rsi_value = technicals.get('rsi', 50)
+        rsi_analysis = TechnicalAnalyzer.analyze_rsi(rsi_value)
+
+        if closes.size >= 2:
+            macd_analysis = TechnicalAnalyzer._classify_macd(bundle.macd, bundle.signal, bundle.prev_macd, bundle.prev_signal)[0]
+        else:
+            macd_analysis = TechnicalAnalyzer._classify_macd(bundle.macd, bundle.signal)[0]
+
+        if closes.size < 20:
+            logger.warning("数据不足，无法进行价格趋势分析")
+            price_trend = {'trend': 'neutral', 'strength': 0, 'details': '数据不足'}
+        else:
+            price_trend = TechnicalAnalyzer._classify_price_trend(float(closes[-1]), bundle.short_ma, bundle.long_ma)
+
+        if volumes.size < 10:
+            logger.warning("成交量数据不足，无法进行分析")
+            volume_analysis = {'trend': 'neutral', 'details': '数据不足'}
+        else:
+            volume_analysis = TechnicalAnalyzer._classify_volume(bundle.recent_volume, bundle.previous_volume)
+        return rsi_analysis, macd_analysis, price_trend, volume_analysis
+
+    @staticmethod
+    def perform_technical_analysis(market_data, indicator_state=None):
         """执行完整的技术分析
         
         整合所有技术指标分析，生成全面的技术分析报告。
         
         Args:
             market_data (dict): 市场数据字典，包含价格、成交量等信息
+            indicator_state (SymbolIndicatorState): 该交易对的指标增量状态，可选；需配合 market_data['timestamps'] 使用
             
         Returns:
             dict: 包含所有技术分析结果的字典
         """
-        logging.info("开始执行完整的技术分析")
-        closes = market_data.get('closes', [])
-        volumes = market_data.get('volumes', [])
+        logger.info("开始执行完整的技术分析")
+        closes = get_cached_array(market_data, 'closes')
+        volumes = get_cached_array(market_data, 'volumes')
         technicals = market_data.get('technicals', {})
         
-        if not closes or not volumes:
-            logging.warning("缺少必要的市场数据，无法执行技术分析")
+        if closes.size == 0 or volumes.size == 0:
+            logger.warning("缺少必要的市场数据，无法执行技术分析")
             return {}
             
-        # 获取技术指标
-        rsi_value = technicals.get('rsi', 50)
-        rsi_analysis = TechnicalAnalyzer.analyze_rsi(rsi_value)
-        logging.debug(f"RSI分析完成: {rsi_analysis['details']}")
-        
-        macd_analysis, macd_line, macd_signal, macd_histogram = TechnicalAnalyzer.analyze_macd(closes)
-        logging.debug(f"MACD分析完成: {macd_analysis['details']}")
-        
-        price_trend = TechnicalAnalyzer.analyze_price_trend(closes)
-        logging.debug(f"价格趋势分析完成: {price_trend['details']}")
-        
-        volume_analysis = TechnicalAnalyzer.analyze_volume(volumes)
-        logging.debug(f"成交量分析完成: {volume_analysis['details']}")
+        timestamps = market_data.get('timestamps')
+        has_state = indicator_state is not None and timestamps is not None and len(timestamps) == closes.size
+        if NUMBA_ENABLED and not has_state:
+            # 编译后的融合内核单次遍历即可得到全部指标；纯 Python 执行时逐点循环反而慢于分项向量化，因此只在 numba 下启用
+            rsi_analysis, macd_analysis, price_trend, volume_analysis = TechnicalAnalyzer._analyze_fused(
+                closes, volumes, technicals
+            )
+        else:
+            # 有增量状态时 MACD 与均线都是 O(1) 推进，直接沿用各自的增量路径
+            macd_state = indicator_state.macd if has_state else None
+            price_trend_state = indicator_state.price_trend if has_state else None
+            rsi_value = technicals.get('rsi', 50)
+            rsi_analysis = TechnicalAnalyzer.analyze_rsi(rsi_value)
+            if 'macd_prev_line' in technicals:
+                # 行情获取时已按已收盘 K 线增量算好的 MACD 直接复用，只做分类
+                macd_analysis = TechnicalAnalyzer._classify_macd(
+                    technicals['macd_line'], technicals['macd_signal'],
+                    technicals['macd_prev_line'], technicals['macd_prev_signal'],
+                )[0]
+            else:
+                macd_analysis = TechnicalAnalyzer.analyze_macd(closes, state=macd_state, timestamps=timestamps)[0]
+            price_trend = TechnicalAnalyzer.analyze_price_trend(closes, state=price_trend_state, timestamps=timestamps)
+            volume_analysis = TechnicalAnalyzer.analyze_volume(volumes)
+        # 每个周期、每个交易对都会走到这里；调试日志关闭时整段跳过，不再逐条取参并进入 logging 调用
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+        if debug_enabled:
+            logger.debug("RSI分析完成: %s", rsi_analysis['details'])
+            logger.debug("MACD分析完成: %s", macd_analysis['details'])
+            logger.debug("价格趋势分析完成: %s", price_trend['details'])
+            logger.debug("成交量分析完成: %s", volume_analysis['details'])
         
-        # 计算信号计数
-        bullish_signals = 0
-        bearish_signals = 0
-
-        if rsi_analysis['condition'] == 'oversold':
-            bullish_signals += 1
-            logging.debug("检测到RSI超卖看涨信号")
-        elif rsi_analysis['condition'] == 'overbought':
-            bearish_signals += 1
-            logging.debug("检测到RSI超买看跌信号")
-
-        if macd_analysis['crossover'] == 'golden':
-            bullish_signals += 1
-            logging.debug("检测到MACD金叉看涨信号")
-        elif macd_analysis['crossover'] == 'death':
-            bearish_signals += 1
-            logging.debug("检测到MACD死叉看跌信号")
-
-        if price_trend['trend'] == 'up':
-            bullish_signals += 1
-            logging.debug("检测到价格上升趋势信号")
-        elif price_trend['trend'] == 'down':
-            bearish_signals += 1
-            logging.debug("检测到价格下降趋势信号")
-
-        if volume_analysis['trend'] == 'increasing':
-            bullish_signals += 1
-            logging.debug("检测到成交量上升信号")
+        # 计算信号计数：各条件只取一次，布尔值直接按 0/1 累加，省去逐项分支与重复的字典索引。
+        rsi_condition = rsi_analysis['condition']
+        macd_crossover = macd_analysis['crossover']
+        trend = price_trend['trend']
+        bullish_signals = (
+            int(rsi_condition == 'oversold')
+            + int(macd_crossover == 'golden')
+            + int(trend == 'up')
+            + int(volume_analysis['trend'] == 'increasing')
+        )
+        bearish_signals = (
+            int(rsi_condition == 'overbought')
+            + int(macd_crossover == 'death')
+            + int(trend == 'down')
+        )
+        if debug_enabled:
+            logger.debug(
+                "信号条件 - RSI: %s, MACD交叉: %s, 价格趋势: %s, 成交量: %s",
+                rsi_condition,
+                macd_crossover,
+                trend,
+                volume_analysis['trend'],
+            )
+
+        # RSI 极端超买/超卖时，直接给出顺势追单的拦截标记，供信号校验复用，不必再次解析 RSI 明细。
+        rsi_extreme = rsi_analysis['strength'] > 0.7
+        buy_blocked = rsi_extreme and rsi_condition == 'overbought'
+        sell_blocked = rsi_extreme and rsi_condition == 'oversold'
 
         total_signals = max(bullish_signals + bearish_signals, 1)
         overall_strength = abs(bullish_signals - bearish_signals) / total_signals
+        if bullish_signals > bearish_signals:
+            signal_bias = 'bullish'
+        elif bearish_signals > bullish_signals:
+            signal_bias = 'bearish'
+        else:
+            signal_bias = 'neutral'
 
         result = {
             'rsi': rsi_analysis,
@@ -298,8 +654,10 @@ class TechnicalAnalyzer:
             'bullish_signals': bullish_signals,
             'bearish_signals': bearish_signals,
             'overall_strength': overall_strength,
-            'signal_bias': 'bullish' if bullish_signals > bearish_signals else 'bearish' if bearish_signals > bullish_signals else 'neutral'
+            'signal_bias': signal_bias,
+            'buy_blocked': buy_blocked,
+            'sell_blocked': sell_blocked,
         }
         
-        logging.info(f"技术分析完成 - 看涨信号: {bullish_signals}, 看跌信号: {bearish_signals}, 总体偏向: {result['signal_bias']}")
+        logger.info("技术分析完成 - 看涨信号: %s, 看跌信号: %s, 总体偏向: %s", bullish_signals, bearish_signals, signal_bias)
         return result
\ No newline at end of file
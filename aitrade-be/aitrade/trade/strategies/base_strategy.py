@@ -1,3 +1,4 @@
+import asyncio
 from abc import ABC, abstractmethod
 from typing import Any, Dict, Optional
 
@@ -21,3 +22,11 @@ class BaseStrategy(ABC):
     @abstractmethod
     def generate_signal(self, market_data: Dict[str, Any], position: Optional[Dict[str, Any]]) -> Dict[str, Any]:
         pass
+
+    async def generate_signal_async(self, market_data: Dict[str, Any], position: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        # 纯本地计算的规则策略没有异步 I/O，默认放到线程中执行同步实现；有网络调用的策略可覆盖为原生协程。
+        return await asyncio.to_thread(self.generate_signal, market_data, position)
+
+    async def aclose(self) -> None:
+        """释放绑定在事件循环上的异步资源，默认无需处理。"""
+        return None
@@ -3,7 +3,9 @@ from typing import Any, Dict, Optional
 
 import pandas as pd
 
+from ..gpt_signal.numeric_kernels import macd_histogram_unadjusted
 from .base_strategy import BaseStrategy
+from .rolling_window import rolling_mean, tail_mean
 
 
 class BTCSpotBreakoutStrategy(BaseStrategy):
@@ -61,14 +63,10 @@ class BTCSpotBreakoutStrategy(BaseStrategy):
         ema_prev = float(ema_series.iloc[-1 - ema_slope_lookback])
         ema_slope_positive = ema_now > ema_prev
 
-        fast_ema = close_series.ewm(span=12, adjust=False).mean()
-        slow_ema = close_series.ewm(span=26, adjust=False).mean()
-        macd_line = fast_ema - slow_ema
-        macd_signal = macd_line.ewm(span=9, adjust=False).mean()
-        macd_histogram = macd_line - macd_signal
-        macd_histogram_value = float(macd_histogram.iloc[-1])
+        # 三条 EMA 在一个内核里单次遍历推进，只取柱值末尾一点
+        macd_histogram_value = float(macd_histogram_unadjusted(close_series.to_numpy()))
 
-        volume_ma = float(volume_series.rolling(window=volume_ma_period).mean().iloc[-1])
+        volume_ma = tail_mean(volume_series, volume_ma_period)
         atr_value = float(self._calculate_atr(high_series, low_series, close_series, atr_period).iloc[-1])
 
         current_price = float(close_series.iloc[-1])
@@ -191,4 +189,4 @@ class BTCSpotBreakoutStrategy(BaseStrategy):
             ],
             axis=1,
         ).max(axis=1)
-        return true_range.rolling(window=period).mean().bfill()
+        return rolling_mean(true_range, period).bfill()
@@ -3,7 +3,9 @@ from typing import Any, Dict, Optional
 
 import pandas as pd
 
+from ..gpt_signal.numeric_kernels import ema_unadjusted_last
 from .base_strategy import BaseStrategy
+from .rolling_window import rolling_mean, tail_mean
 
 
 class BTCSpotTrendBreakoutStrategy(BaseStrategy):
@@ -86,14 +88,14 @@ class BTCSpotTrendBreakoutStrategy(BaseStrategy):
         atr_trail_mult = float(self.config.get('atr_trail_mult', 3.0))
         default_risk_per_trade = float(self.config.get('default_risk_per_trade', 0.01))
 
-        trend_ema_fast = float(trend_close_series.ewm(span=ema_fast_period, adjust=False).mean().iloc[-1])
-        trend_ema_slow = float(trend_close_series.ewm(span=ema_slow_period, adjust=False).mean().iloc[-1])
+        trend_ema_fast = float(ema_unadjusted_last(trend_close_series.to_numpy(), ema_fast_period))
+        trend_ema_slow = float(ema_unadjusted_last(trend_close_series.to_numpy(), ema_slow_period))
         trend_adx = float(self._calculate_adx(trend_high_series, trend_low_series, trend_close_series, adx_period).iloc[-1])
 
         current_price = float(close_series.iloc[-1])
         current_volume = float(volume_series.iloc[-1])
         breakout_high = float(high_series.iloc[-breakout_lookback - 1:-1].max())
-        volume_ma = float(volume_series.rolling(window=volume_ma_period).mean().iloc[-1])
+        volume_ma = tail_mean(volume_series, volume_ma_period)
         atr_value = float(self._calculate_atr(high_series, low_series, close_series, atr_period).iloc[-1])
 
         meta = {
@@ -207,7 +209,7 @@ class BTCSpotTrendBreakoutStrategy(BaseStrategy):
             ],
             axis=1,
         ).max(axis=1)
-        return true_range.rolling(window=period).mean().bfill()
+        return rolling_mean(true_range, period).bfill()
 
     @staticmethod
     def _calculate_adx(high_series: pd.Series, low_series: pd.Series, close_series: pd.Series, period: int) -> pd.Series:
@@ -224,7 +226,7 @@ class BTCSpotTrendBreakoutStrategy(BaseStrategy):
             dtype='float64',
         )
         atr = BTCSpotTrendBreakoutStrategy._calculate_atr(high_series, low_series, close_series, period)
-        plus_di = (plus_dm.rolling(window=period).mean() / atr.replace(0, pd.NA)) * 100
-        minus_di = (minus_dm.rolling(window=period).mean() / atr.replace(0, pd.NA)) * 100
+        plus_di = (rolling_mean(plus_dm, period) / atr.replace(0, pd.NA)) * 100
+        minus_di = (rolling_mean(minus_dm, period) / atr.replace(0, pd.NA)) * 100
         dx = ((plus_di - minus_di).abs() / (plus_di + minus_di).replace(0, pd.NA)) * 100
         return dx.rolling(window=period).mean().bfill().fillna(0.0)
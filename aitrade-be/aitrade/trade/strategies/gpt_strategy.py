@@ -3,6 +3,16 @@ import logging
 from ..gpt_signal import SignalGenerator
 from .base_strategy import BaseStrategy
 
+# provider 到默认端点的映射；未知 provider 回退 DeepSeek
+DEFAULT_BASE_URLS = {
+    'deepseek': 'https://api.deepseek.com/v1',
+    'openai': 'https://api.openai.com/v1',
+}
+PROVIDER_LABELS = {
+    'deepseek': 'DeepSeek',
+    'openai': 'OpenAI',
+}
+
 
 class GPTStrategy(BaseStrategy):
     name = 'gpt'
@@ -25,13 +35,28 @@ class GPTStrategy(BaseStrategy):
             base_url=resolved_base_url,
             proxy_url=runtime_config.proxy_url if runtime_config.proxy_enable else None,
             model=runtime_config.gpt_model,
+            max_connections=runtime_config.http_max_connections,
+            max_keepalive_connections=runtime_config.http_max_keepalive_connections,
+            keepalive_expiry=runtime_config.http_keepalive_expiry,
+            enable_cache=bool(self.config.get('signal_cache_enabled', False)),
+            enable_fast_path=bool(self.config.get('fast_path_enabled', False)),
+            fast_path_min_strength=float(self.config.get('fast_path_min_strength', 0.75)),
         )
+        self.signal_generator.warm_up_connection()
 
     def get_required_history(self) -> int:
         return 35
 
     def generate_signal(self, market_data, position):
-        signal = self.signal_generator.get_ai_signal(market_data)
+        return self._apply_confidence_threshold(self.signal_generator.get_ai_signal(market_data))
+
+    async def generate_signal_async(self, market_data, position):
+        return self._apply_confidence_threshold(await self.signal_generator.get_ai_signal_async(market_data))
+
+    async def aclose(self):
+        await self.signal_generator.aclose()
+
+    def _apply_confidence_threshold(self, signal):
         signal['strategy'] = self.name
         signal.setdefault('stop_loss_pct', 0.05)
         signal.setdefault('risk_per_trade', 0.02)
@@ -69,12 +94,9 @@ class GPTStrategy(BaseStrategy):
     def _resolve_base_url(provider: str) -> str:
         # 这里只负责 provider 到默认端点的兜底映射；
         # 如果页面已经显式保存了自定义 base_url，则不会走到这里。
-        if provider == 'openai':
-            logging.info("使用OpenAI API作为AI服务提供商")
-            return 'https://api.openai.com/v1'
-
-        if provider != 'deepseek':
+        if provider not in DEFAULT_BASE_URLS:
             logging.warning("未知的AI服务提供商: %s，默认使用DeepSeek", provider)
+            provider = 'deepseek'
 
-        logging.info("使用DeepSeek API作为AI服务提供商")
-        return 'https://api.deepseek.com/v1'
+        logging.info("使用%s API作为AI服务提供商", PROVIDER_LABELS[provider])
+        return DEFAULT_BASE_URLS[provider]
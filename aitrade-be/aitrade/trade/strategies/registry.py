@@ -79,6 +79,30 @@ _STRATEGY_DEFINITIONS: list[dict[str, Any]] = [
                 'step': 0.01,
                 'description': '当模型信号置信度低于该值时自动转为观望。',
             },
+            {
+                'field': 'signal_cache_enabled',
+                'label': '启用信号缓存',
+                'type': 'boolean',
+                'required': False,
+                'description': '量化后的市场特征与上一次一致时直接复用模型结论（不超过信号有效期且最长 1 小时）；默认关闭。',
+            },
+            {
+                'field': 'fast_path_enabled',
+                'label': '启用规则快路径',
+                'type': 'boolean',
+                'required': False,
+                'description': '本地技术指标高度一致时跳过模型直接按规则下单；默认关闭，开启前先看日志中的影子命中率。',
+            },
+            {
+                'field': 'fast_path_min_strength',
+                'label': '快路径强度阈值',
+                'type': 'number',
+                'required': False,
+                'min': 0,
+                'max': 1,
+                'step': 0.01,
+                'description': '技术信号总体强度超过该值才会命中规则快路径。',
+            },
         ],
         'schemaVersion': 1,
     },
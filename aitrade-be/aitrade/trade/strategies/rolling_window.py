@@ -0,0 +1,33 @@
+"""
+规则策略共用的滑动窗口均值
+
+`rolling_mean` 与 `Series.rolling(window).mean()` 结果一致（窗口未满的位置为 NaN）。
+如果运行环境安装了 bottleneck，会改用其 C 实现的 `move_mean`；bottleneck 不在默认锁定依赖中，
+缺失时回退到 pandas。输入序列含 NaN 时两者的处理规则不同，只用于 ATR、方向运动这类不含 NaN 的序列。
+
+只需要最后一个窗口均值时用 `tail_mean`，直接对末尾切片求一次均值，不再生成整条滑动序列。
+"""
+
+import math
+
+import numpy as np
+import pandas as pd
+
+try:
+    import bottleneck as bn
+except ImportError:  # bottleneck 为可选加速依赖
+    bn = None
+
+
+def rolling_mean(series: pd.Series, window: int) -> pd.Series:
+    if bn is None or not 1 <= window <= len(series):
+        return series.rolling(window=window).mean()
+    return pd.Series(bn.move_mean(series.to_numpy(dtype=np.float64), window), index=series.index)
+
+
+def tail_mean(values, window: int) -> float:
+    """等价于 `rolling(window).mean().iloc[-1]`：序列长度不足一个窗口时返回 NaN。"""
+    values = np.asarray(values, dtype=np.float64)
+    if window < 1 or values.shape[0] < window:
+        return math.nan
+    return float(values[-window:].mean())
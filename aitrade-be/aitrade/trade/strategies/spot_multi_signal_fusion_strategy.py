@@ -7,7 +7,10 @@ import pandas as pd
 
 from ...config.config_file import DEFAULT_BTC_SPOT_BREAKOUT_CONFIG
 from ...config.config_file import DEFAULT_BTC_SPOT_TREND_BREAKOUT_CONFIG
+from ..gpt_signal.numeric_kernels import ema_unadjusted_last
+from ..gpt_signal.numeric_kernels import macd_histogram_unadjusted
 from .base_strategy import BaseStrategy
+from .rolling_window import rolling_mean, tail_mean
 
 
 class SpotMultiSignalFusionStrategy(BaseStrategy):
@@ -95,7 +98,7 @@ class SpotMultiSignalFusionStrategy(BaseStrategy):
                 'confidence': 0.0,
                 'reason': f'融合策略所需K线不足，至少需要 {required_history} 根',
                 'strategy': self.name,
-                'asof': market_data.get('decisionTimestamp') or market_data.get('timestamp'),
+                'asof': market_data.get('decisionTimestamp') or market_data.get('timestamp_ms') or market_data.get('timestamp'),
                 'signal_sources': [],
                 'signal_score': 0.0,
                 'degraded': True,
@@ -160,7 +163,7 @@ class SpotMultiSignalFusionStrategy(BaseStrategy):
                 'confidence': 0.0,
                 'reason': '可用信号节点不足，暂不交易',
                 'strategy': self.name,
-                'asof': market_data.get('decisionTimestamp') or market_data.get('timestamp'),
+                'asof': market_data.get('decisionTimestamp') or market_data.get('timestamp_ms') or market_data.get('timestamp'),
                 'signal_sources': serialized_nodes,
                 'signal_score': 0.0,
                 'degraded': True,
@@ -176,7 +179,7 @@ class SpotMultiSignalFusionStrategy(BaseStrategy):
                 'confidence': 0.0,
                 'reason': '部分必需信号节点缺失，暂不交易',
                 'strategy': self.name,
-                'asof': market_data.get('decisionTimestamp') or market_data.get('timestamp'),
+                'asof': market_data.get('decisionTimestamp') or market_data.get('timestamp_ms') or market_data.get('timestamp'),
                 'signal_sources': serialized_nodes,
                 'signal_score': 0.0,
                 'degraded': True,
@@ -199,7 +202,7 @@ class SpotMultiSignalFusionStrategy(BaseStrategy):
                 'confidence': 0.0,
                 'reason': 'ATR结果异常，暂不交易',
                 'strategy': self.name,
-                'asof': market_data.get('decisionTimestamp') or market_data.get('timestamp'),
+                'asof': market_data.get('decisionTimestamp') or market_data.get('timestamp_ms') or market_data.get('timestamp'),
                 'signal_sources': serialized_nodes,
                 'signal_score': signal_score,
                 'degraded': degraded,
@@ -231,7 +234,7 @@ class SpotMultiSignalFusionStrategy(BaseStrategy):
             'risk_per_trade': float(self.config.get('default_risk_per_trade', 0.01)),
             'stop_loss_price': stop_loss_price,
             'trailing_stop_price': trailing_stop_price,
-            'asof': market_data.get('decisionTimestamp') or market_data.get('timestamp'),
+            'asof': market_data.get('decisionTimestamp') or market_data.get('timestamp_ms') or market_data.get('timestamp'),
             'signal_sources': serialized_nodes,
             'signal_score': signal_score,
             'degraded': degraded,
@@ -270,12 +273,9 @@ class SpotMultiSignalFusionStrategy(BaseStrategy):
         breakout_high = float(high_series.iloc[-breakout_lookback - 1:-1].max())
         breakout_low = float(low_series.iloc[-breakout_lookback - 1:-1].min())
         rsi_value = float(self._calculate_rsi(close_series, 14).iloc[-1])
-        fast_ema = close_series.ewm(span=12, adjust=False).mean()
-        slow_ema = close_series.ewm(span=26, adjust=False).mean()
-        macd_line = fast_ema - slow_ema
-        macd_signal = macd_line.ewm(span=9, adjust=False).mean()
-        macd_histogram = float((macd_line - macd_signal).iloc[-1])
-        volume_ma = float(volume_series.rolling(window=min(20, len(volume_series))).mean().iloc[-1])
+        # 三条 EMA 在一个内核里单次遍历推进，只取柱值末尾一点
+        macd_histogram = float(macd_histogram_unadjusted(close_series.to_numpy()))
+        volume_ma = tail_mean(volume_series, min(20, len(volume_series)))
         current_volume = float(volume_series.iloc[-1])
 
         buy_score = 0.0
@@ -480,14 +480,11 @@ class SpotMultiSignalFusionStrategy(BaseStrategy):
         ema_slope_positive = ema_now > ema_prev
         ema_slope_negative = ema_now < ema_prev
 
-        fast_ema = close_series.ewm(span=12, adjust=False).mean()
-        slow_ema = close_series.ewm(span=26, adjust=False).mean()
-        macd_line = fast_ema - slow_ema
-        macd_signal = macd_line.ewm(span=9, adjust=False).mean()
-        macd_histogram = float((macd_line - macd_signal).iloc[-1])
+        # 三条 EMA 在一个内核里单次遍历推进，只取柱值末尾一点
+        macd_histogram = float(macd_histogram_unadjusted(close_series.to_numpy()))
 
         current_volume = float(volume_series.iloc[-1])
-        volume_ma = float(volume_series.rolling(window=volume_ma_period).mean().iloc[-1])
+        volume_ma = tail_mean(volume_series, volume_ma_period)
         entry_channel_high = float(high_series.iloc[-donchian_entry - 1:-1].max())
         exit_channel_low = float(low_series.iloc[-donchian_exit - 1:-1].min())
         breakout_price = entry_channel_high * (1 + breakout_buffer_bps / 10000)
@@ -599,13 +596,13 @@ class SpotMultiSignalFusionStrategy(BaseStrategy):
         adx_threshold = float(self.config.get('kline_trend_breakout_adx_threshold', 25))
         volume_multiplier = float(self.config.get('kline_trend_breakout_volume_multiplier', 1.0))
 
-        trend_ema_fast = float(trend_close_series.ewm(span=ema_fast_period, adjust=False).mean().iloc[-1])
-        trend_ema_slow = float(trend_close_series.ewm(span=ema_slow_period, adjust=False).mean().iloc[-1])
+        trend_ema_fast = float(ema_unadjusted_last(trend_close_series.to_numpy(), ema_fast_period))
+        trend_ema_slow = float(ema_unadjusted_last(trend_close_series.to_numpy(), ema_slow_period))
         trend_adx = float(self._calculate_adx(trend_high_series, trend_low_series, trend_close_series, adx_period).iloc[-1])
         breakout_high = float(high_series.iloc[-breakout_lookback - 1:-1].max())
         breakout_low = float(low_series.iloc[-breakout_lookback - 1:-1].min())
         current_volume = float(volume_series.iloc[-1])
-        volume_ma = float(volume_series.rolling(window=volume_ma_period).mean().iloc[-1])
+        volume_ma = tail_mean(volume_series, volume_ma_period)
 
         trend_ok = trend_ema_fast > trend_ema_slow and trend_adx >= adx_threshold
         trend_weak = trend_ema_fast < trend_ema_slow or trend_adx < adx_threshold
@@ -794,7 +791,7 @@ class SpotMultiSignalFusionStrategy(BaseStrategy):
             ],
             axis=1,
         ).max(axis=1)
-        return true_range.rolling(window=period).mean().bfill()
+        return rolling_mean(true_range, period).bfill()
 
     @staticmethod
     def _calculate_adx(high_series: pd.Series, low_series: pd.Series, close_series: pd.Series, period: int) -> pd.Series:
@@ -811,7 +808,7 @@ class SpotMultiSignalFusionStrategy(BaseStrategy):
             dtype='float64',
         )
         atr = SpotMultiSignalFusionStrategy._calculate_atr(high_series, low_series, close_series, period)
-        plus_di = (plus_dm.rolling(window=period).mean() / atr.replace(0, pd.NA)) * 100
-        minus_di = (minus_dm.rolling(window=period).mean() / atr.replace(0, pd.NA)) * 100
+        plus_di = (rolling_mean(plus_dm, period) / atr.replace(0, pd.NA)) * 100
+        minus_di = (rolling_mean(minus_dm, period) / atr.replace(0, pd.NA)) * 100
         dx = ((plus_di - minus_di).abs() / (plus_di + minus_di).replace(0, pd.NA)) * 100
         return dx.rolling(window=period).mean().bfill().fillna(0.0)
@@ -1,18 +1,41 @@
+import asyncio
 import logging
-from threading import Event
 
+try:
+    import uvloop
+except ImportError:  # uvloop 为可选加速依赖，不支持 Windows
+    uvloop = None
+
+from .gpt_signal.numeric_kernels import warm_up as warm_up_numeric_kernels
 from .trading_system.trading_bot import TradingBot
 from ..config import config_file
 
 
 class OptimizedCryptoBot:
+    """交易任务线程持有的机器人封装。
+
+    每个机器人在所属任务线程内保留一个事件循环，逐轮执行 `TradingBot.run_cycle_async`；
+    策略的异步 AI 连接池与异步行情客户端都绑定在这个事件循环上，跨周期复用，`close()` 时在同一循环内关闭。
+    """
+
     def __init__(self, cfg: config_file.Config, execution_context: dict | None = None):
         self.trading_bot = TradingBot(cfg, execution_context=execution_context)
+        # 在任务启动时完成 numba 内核的 JIT 编译（或磁盘缓存加载），首个交易周期不再承担这部分耗时
+        warm_up_numeric_kernels()
+        # 装有 uvloop 时只为本任务线程的事件循环使用 uvloop，不修改全局事件循环策略，同进程的 Web 服务不受影响；
+        # uringcore 仅支持 Linux 且尚未发布 1.0，也不在项目依赖中，这里不采用。
+        self._runner = asyncio.Runner(loop_factory=uvloop.new_event_loop if uvloop is not None else None)
         logging.info("优化版交易机器人已初始化")
 
-    def run(self, stop_event: Event | None = None):
-        """运行交易机器人"""
-        self.trading_bot.run(stop_event=stop_event)
+    def run_cycle(self) -> None:
+        """在当前线程的事件循环中执行一轮交易周期。"""
+        self._runner.run(self.trading_bot.run_cycle_async())
 
     def close(self):
-        self.trading_bot.close()
+        try:
+            self._runner.run(self.trading_bot.aclose())
+        except Exception as exc:
+            logging.warning("关闭交易机器人异步资源失败: %s", exc)
+        finally:
+            self._runner.close()
+            self.trading_bot.close()
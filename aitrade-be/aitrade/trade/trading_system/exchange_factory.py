@@ -0,0 +1,54 @@
+import logging
+from typing import Any, Dict, Optional
+
+import ccxt
+
+
+def build_ccxt_config(exchange_type: str, api_key: str, secret: str, password: str = '') -> Dict[str, Any]:
+    """构造同步 / 异步 ccxt 客户端共用的基础配置；代理参数两者格式不同，由调用方自行补充。"""
+    ccxt_cfg = {
+        'apiKey': api_key,
+        'secret': secret,
+        'enableRateLimit': True,
+    }
+
+    if exchange_type == "okx" and password:
+        ccxt_cfg['password'] = password
+
+    if exchange_type == "binance":
+        ccxt_cfg['options'] = {
+            'defaultType': 'spot',
+            'fetchMarkets': {
+                'types': ['spot'],
+            },
+        }
+    return ccxt_cfg
+
+
+def create_exchange(
+    exchange_type: str,
+    api_key: str,
+    secret: str,
+    password: str = '',
+    sandbox: bool = True,
+    proxies: Optional[Dict[str, str]] = None,
+) -> ccxt.Exchange:
+    """创建同步 ccxt 交易所客户端。
+
+    行情获取与交易执行共用同一实例时，市场列表缓存、HTTP 会话和 enableRateLimit 的节流计数都只有一份，
+    不会各自加载市场、各自计算限频。
+    """
+    ccxt_cfg = build_ccxt_config(exchange_type, api_key, secret, password)
+    if proxies:
+        ccxt_cfg['proxies'] = proxies
+
+    if exchange_type == "binance":
+        exchange = ccxt.binance(ccxt_cfg)
+        logging.info("初始化Binance交易所，沙盒模式: %s", sandbox)
+    else:
+        exchange = ccxt.okx(ccxt_cfg)
+        logging.info("初始化OKX交易所，沙盒模式: %s", sandbox)
+
+    if sandbox and hasattr(exchange, 'set_sandbox_mode'):
+        exchange.set_sandbox_mode(True)
+    return exchange
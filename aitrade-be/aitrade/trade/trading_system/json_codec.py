@@ -0,0 +1,52 @@
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # orjson 仅随 freqtrade 间接安装，缺失时回退标准库 json
+    orjson = None
+
+_ORJSON_OPTIONS = (orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS) if orjson is not None else 0
+
+
+def dumps_text(value: Any) -> str:
+    """序列化为 UTF-8 JSON 文本，非 ASCII 字符原样保留（等价于 ensure_ascii=False）。
+
+    orjson 可用时优先使用，并直接支持 NumPy 数组 / 标量；遇到 orjson 不支持的类型时回退标准库。
+    orjson 会把 NaN / Infinity 写成 null，而历史数据由标准库写入、保留 `NaN` 字面量；输出里出现 null 时
+    改用标准库重新序列化，保证同一个值无论是否安装 orjson 都写出相同的数据。
+    """
+    if orjson is not None:
+        try:
+            text = orjson.dumps(value, option=_ORJSON_OPTIONS).decode('utf-8')
+        except TypeError:
+            pass
+        else:
+            if 'null' not in text:
+                return text
+            try:
+                return json.dumps(value, ensure_ascii=False)
+            except TypeError:
+                # 含 NumPy 值时标准库无法序列化，保留 orjson 的结果
+                return text
+    return json.dumps(value, ensure_ascii=False)
+
+
+def dumps_pretty(value: Any) -> str:
+    """序列化为两空格缩进的 JSON 文本，用于日志展示；无法直接序列化的值（如 datetime）按 str() 输出。"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(value, option=_ORJSON_OPTIONS | orjson.OPT_INDENT_2, default=str).decode('utf-8')
+        except TypeError:
+            pass
+    return json.dumps(value, indent=2, ensure_ascii=False, default=str)
+
+
+def loads_text(text: str | bytes) -> Any:
+    """解析 JSON 文本；orjson 不接受标准库写出的 `NaN` / `Infinity` 字面量，解析失败时回退标准库。"""
+    if orjson is not None:
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(text)
@@ -1,56 +1,63 @@
+import asyncio
 import logging
-from datetime import datetime
-from typing import Any, Dict, List
+import os
+import time
+from functools import cached_property
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 import ccxt
+import ccxt.async_support as ccxt_async
 import numpy as np
-import pandas as pd
+
+from ..gpt_signal.technical_analyzer import SymbolIndicatorState
+from ..gpt_signal.technical_analyzer import TechnicalAnalyzer
+from .exchange_factory import build_ccxt_config
+from .exchange_factory import create_exchange
+from .market_series import MarketSeries
+from .market_series import OhlcvRingBuffer
+from .risk_manager import VOLATILITY_WINDOW
+from .risk_manager import window_volatility
 
 
 class MarketDataFetcher:
     """市场数据获取器。"""
 
-    def __init__(self, exchange_type: str, api_key: str, secret: str, password: str = '', sandbox: bool = True, proxies: Dict[str, str] = None):
-        ccxt_cfg = {
-            'apiKey': api_key,
-            'secret': secret,
-            'enableRateLimit': True,
-        }
-
-        if exchange_type == "okx" and password:
-            ccxt_cfg['password'] = password
-
-        if proxies:
-            ccxt_cfg['proxies'] = proxies
+    def __init__(
+        self,
+        exchange_type: str,
+        api_key: str,
+        secret: str,
+        password: str = '',
+        sandbox: bool = True,
+        proxies: Dict[str, str] = None,
+        exchange: Optional[ccxt.Exchange] = None,
+        cache_dir: Optional[str] = None,
+    ):
+        # 传入 exchange 时直接复用（如与 TradeExecutor 共享的同一客户端），否则首次访问时才按参数创建
+        self._exchange_args = (exchange_type, api_key, secret, password, sandbox, proxies)
+        if exchange is not None:
+            self.exchange = exchange
 
-        if exchange_type == "binance":
-            ccxt_cfg['options'] = {
-                'defaultType': 'spot',
-                'fetchMarkets': {
-                    'types': ['spot'],
-                },
-            }
-            self.exchange = ccxt.binance(ccxt_cfg)
-            logging.info("初始化Binance交易所，沙盒模式: %s", sandbox)
-        else:
-            self.exchange = ccxt.okx(ccxt_cfg)
-            logging.info("初始化OKX交易所，沙盒模式: %s", sandbox)
-
-        if sandbox and hasattr(self.exchange, 'set_sandbox_mode'):
-            self.exchange.set_sandbox_mode(True)
+        # 每个 (交易对, 周期) 一块预分配缓冲区，跨周期复用，避免每轮重新分配列数组
+        self._series_buffers: Dict[Tuple[str, str], OhlcvRingBuffer] = {}
+        # RSI / MACD 按 (交易对, 周期) 保留截至最近已收盘 K 线的平滑状态，每轮只推进新收盘的 K 线
+        self._indicator_states: Dict[Tuple[str, str], SymbolIndicatorState] = {}
+        # 指定 cache_dir 时，每个 (交易对, 周期) 的 K 线窗口落盘为 .npy，重启后从最后一根增量补齐
+        self.cache_dir = cache_dir
+        # 各 (交易对, 周期) 已落盘窗口中最后一根已收盘 K 线的时间戳，只有出现新收盘的 K 线才重写缓存
+        self._saved_closed_timestamps: Dict[Tuple[str, str], int] = {}
 
-        try:
-            self.exchange.load_markets()
-            logging.debug("成功加载交易所市场数据")
-        except Exception as e:
-            logging.error("加载市场数据失败: %s", e)
+    @cached_property
+    def exchange(self) -> ccxt.Exchange:
+        return create_exchange(*self._exchange_args)
 
-    def fetch_ohlcv(self, symbol: str, timeframe: str, limit: int) -> List[List[float]]:
+    def fetch_ohlcv(self, symbol: str, timeframe: str, limit: int, since: Optional[int] = None) -> List[List[float]]:
         try:
-            logging.debug("获取 %s 的 %s OHLCV数据，条数: %s", symbol, timeframe, limit)
+            logging.debug("获取 %s 的 %s OHLCV数据，条数: %s，起始: %s", symbol, timeframe, limit, since)
             markets = self.exchange.markets
             if not markets:
-                logging.info("交易所市场列表为空，尝试重新加载")
+                # 构造时不做网络请求，市场列表在首次获取行情时才加载
+                logging.info("交易所市场列表尚未加载，开始加载")
                 markets = self.exchange.load_markets()
 
             if symbol not in markets:
@@ -59,42 +66,123 @@ class MarketDataFetcher:
                 if available_symbols:
                     logging.debug("部分可用交易对示例: %s", available_symbols[:10])
 
-            data = self.exchange.fetch_ohlcv(symbol, timeframe, limit=limit)
+            data = self.exchange.fetch_ohlcv(symbol, timeframe, since=since, limit=limit)
             logging.info("成功获取 %s 条OHLCV数据", len(data))
             return data
         except Exception as e:
             logging.error("获取OHLCV数据失败: %s", e)
             raise
 
-    def get_enhanced_market_data(self, symbol: str = 'BTC/USDT', timeframe: str = '15m', limit: int = 100) -> Dict[str, Any]:
+    def get_enhanced_market_data(
+        self,
+        symbol: str = 'BTC/USDT',
+        timeframe: str = '15m',
+        limit: int = 100,
+        ohlcv: Optional[List[List[float]]] = None,
+    ) -> Dict[str, Any]:
+        """获取并计算增强市场数据；传入 ohlcv 时直接使用（如异步并发预取的结果），不再发起请求。
+
+        缓冲区已有完整窗口时只从最后一根 K 线开始增量获取；ohlcv 也可以是这样的增量结果。
+        """
         logging.info("获取 %s 的增强市场数据", symbol)
-        ohlcv = self.fetch_ohlcv(symbol, timeframe, limit)
+        buffer = self._get_series_buffer(symbol, timeframe, limit)
+        if ohlcv is None:
+            ohlcv = self.fetch_ohlcv(symbol, timeframe, limit, since=self.ohlcv_since(symbol, timeframe, limit))
+        if len(ohlcv) < limit and len(buffer) >= limit and not (ohlcv and int(ohlcv[0][0]) <= buffer.last_timestamp):
+            # 增量结果为空或与已缓存的 K 线之间有缺口，改为整段获取
+            logging.info("增量K线无法与缓存衔接，整段重新获取: symbol=%s timeframe=%s", symbol, timeframe)
+            ohlcv = self.fetch_ohlcv(symbol, timeframe, limit)
 
-        timestamps = [c[0] for c in ohlcv]
-        opens = [c[1] for c in ohlcv]
-        highs = [c[2] for c in ohlcv]
-        lows = [c[3] for c in ohlcv]
-        closes = [c[4] for c in ohlcv]
-        volumes = [c[5] for c in ohlcv]
+        # OHLCV 写入该 (交易对, 周期) 的预分配列缓冲区，只有新增 / 仍在形成的 K 线会被写入；
+        # 返回的列数组是缓冲区视图，仅在本轮调度内使用，下一次获取同一周期时会被原地更新。
+        series = buffer.update(ohlcv, length=limit)
+        if len(ohlcv) != len(series):
+            # 增量获取时行列表只含新 K 线，按缓冲区窗口还原，保持与各列数组对齐
+            ohlcv = series.to_ohlcv()
+        self._save_cached_series(symbol, timeframe, series)
 
-        technicals = self._calculate_technical_indicators(closes, highs, lows, volumes)
+        state = self._indicator_states.get((symbol, timeframe))
+        if state is None:
+            state = self._indicator_states[(symbol, timeframe)] = SymbolIndicatorState()
+        technicals = self._calculate_technical_indicators(series, state=state)
         market_data = {
             'symbol': symbol,
-            'timestamp': datetime.now().isoformat(),
-            'price': closes[-1],
-            'timestamps': timestamps,
-            'opens': opens,
-            'highs': highs,
-            'lows': lows,
-            'closes': closes,
-            'volumes': volumes,
+            # 直接使用最新一根 K 线的毫秒时间戳，需要可读时间的地方再按需格式化
+            'timestamp_ms': int(series.timestamps[-1]),
+            'price': float(series.closes[-1]),
+            **series.to_market_fields(),
             'ohlcv': ohlcv,
             'technicals': technicals,
         }
 
-        logging.debug("市场数据获取完成，当前价格: %s", closes[-1])
+        logging.debug("市场数据获取完成，当前价格: %s", market_data['price'])
         return market_data
 
+    def ohlcv_since(self, symbol: str, timeframe: str, limit: int) -> Optional[int]:
+        """返回增量获取的起始时间戳（缓冲区最后一根 K 线，可能尚未收盘）。
+
+        缓冲区不足一个窗口，或距最后一根已超过一个窗口的时长（增量结果无法覆盖到最新）时返回 None，表示整段获取。
+        """
+        buffer = self._series_buffers.get((symbol, timeframe))
+        if buffer is None or len(buffer) < limit:
+            return None
+        last_timestamp = buffer.last_timestamp
+        elapsed_bars = (time.time_ns() // 1_000_000 - last_timestamp) // (ccxt.Exchange.parse_timeframe(timeframe) * 1000)
+        if elapsed_bars + 1 >= limit:
+            return None
+        return last_timestamp
+
+    def _get_series_buffer(self, symbol: str, timeframe: str, limit: int) -> OhlcvRingBuffer:
+        buffer = self._series_buffers.get((symbol, timeframe))
+        if buffer is None:
+            buffer = self._series_buffers[(symbol, timeframe)] = OhlcvRingBuffer(limit)
+            rows = self._load_cached_rows(symbol, timeframe)
+            if rows is not None:
+                buffer.update(rows[-limit:])
+                if rows.shape[0] >= 2:
+                    self._saved_closed_timestamps[(symbol, timeframe)] = int(rows[-2, 0])
+        return buffer
+
+    def _cache_path(self, symbol: str, timeframe: str) -> str:
+        exchange_type, sandbox = self._exchange_args[0], self._exchange_args[4]
+        scope = f"{exchange_type}-sandbox" if sandbox else exchange_type
+        return os.path.join(self.cache_dir, f"ohlcv_{scope}_{symbol.replace('/', '-').replace(':', '-')}_{timeframe}.npy")
+
+    def _load_cached_rows(self, symbol: str, timeframe: str) -> Optional[np.ndarray]:
+        if not self.cache_dir:
+            return None
+        path = self._cache_path(symbol, timeframe)
+        if not os.path.exists(path):
+            return None
+        try:
+            # 文件按列保存 (6, n)，转置成交易所的行格式后写入缓冲区
+            rows = np.load(path).T
+        except (OSError, ValueError) as exc:
+            logging.warning("读取K线缓存失败，改为整段获取: path=%s error=%s", path, exc)
+            return None
+        logging.info("已从磁盘缓存恢复 %s 根K线: symbol=%s timeframe=%s", rows.shape[0], symbol, timeframe)
+        return rows
+
+    def _save_cached_series(self, symbol: str, timeframe: str, series: MarketSeries) -> None:
+        # 最后一根 K 线仍在形成，缓存只需跟随已收盘的 K 线推进；同一根收盘 K 线内的多次获取不重复写盘
+        if not self.cache_dir or len(series) < 2:
+            return
+        closed_timestamp = int(series.timestamps[-2])
+        saved_timestamp = self._saved_closed_timestamps.get((symbol, timeframe))
+        if saved_timestamp is not None and closed_timestamp <= saved_timestamp:
+            return
+        path = self._cache_path(symbol, timeframe)
+        columns = np.vstack((series.timestamps.astype(np.float64), series.opens, series.highs, series.lows, series.closes, series.volumes))
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            # 先写临时文件再替换，进程中途退出时不会留下写了一半的缓存
+            with open(path + '.tmp', 'wb') as handle:
+                np.save(handle, columns)
+            os.replace(path + '.tmp', path)
+            self._saved_closed_timestamps[(symbol, timeframe)] = closed_timestamp
+        except OSError as exc:
+            logging.warning("写入K线缓存失败: path=%s error=%s", path, exc)
+
     def fetch_recent_trades(self, symbol: str, limit: int = 200) -> List[Dict[str, Any]]:
         try:
             logging.info("获取 %s 的近期成交数据，条数: %s", symbol, limit)
@@ -105,53 +193,114 @@ class MarketDataFetcher:
             logging.error("获取近期成交数据失败: symbol=%s limit=%s error=%s", symbol, limit, exc)
             raise
 
-    def _calculate_technical_indicators(self, closes: List[float], highs: List[float], lows: List[float], volumes: List[float]) -> Dict[str, Any]:
+    def _calculate_technical_indicators(self, series: MarketSeries, state: Optional[SymbolIndicatorState] = None) -> Dict[str, Any]:
+        """直接在按列保存的 K 线批次上计算指标；各列都是连续的 float64 数组，不再逐列转换。"""
         logging.debug("开始计算技术指标")
+        timestamps = series.timestamps
+        closes = series.closes
+        highs = series.highs
+        lows = series.lows
+        volumes = series.volumes
 
-        def compute_rsi(prices, period=14):
-            deltas = np.diff(prices)
-            if len(deltas) < period:
-                return np.array([50.0])
-
-            seed = deltas[:period]
-            up = seed[seed >= 0].sum() / period
-            down = -seed[seed < 0].sum() / period
-            rs = up / (down + 1e-10)
-            rsi = np.array([100 - (100 / (1 + rs))])
-
-            for i in range(period, len(deltas)):
-                delta = deltas[i]
-                up = (up * (period - 1) + max(delta, 0)) / period
-                down = (down * (period - 1) + max(-delta, 0)) / period
-                rs = up / (down + 1e-10)
-                rsi = np.append(rsi, 100 - (100 / (1 + rs)))
-
-            return rsi
+        incremental = state is not None and len(timestamps) == len(closes)
+        if incremental and len(closes) >= 2:
+            prev_macd, macd_value, prev_signal, signal_value = state.macd.update(closes, timestamps)
+        else:
+            # 与 pandas ewm(span=...).mean()（adjust=True）数值一致，但不再为约 100 根 K 线构造 Series / EWM 对象，只取末尾标量
+            prev_macd, macd_value, prev_signal, signal_value = TechnicalAnalyzer.compute_macd_tail(closes)
+        macd_histogram = macd_value - signal_value
 
-        ema12 = pd.Series(closes).ewm(span=12).mean().values
-        ema26 = pd.Series(closes).ewm(span=26).mean().values
-        macd_line = ema12 - ema26
-        signal_line = pd.Series(macd_line).ewm(span=9).mean().values
-        macd_histogram = macd_line - signal_line
+        if incremental and len(closes) > state.rsi.period + 1:
+            rsi = state.rsi.update(closes, timestamps)
+        elif len(closes) > 14:
+            # Wilder 平滑整段在 C 层完成（numba 编译或分块向量化），不再逐根 np.append 重新分配数组
+            rsi = float(TechnicalAnalyzer.compute_rsi(closes)[-1])
+        else:
+            rsi = 50
 
+        # 每个窗口只做一次 C 层归约，并立即转成 Python float，后续比较不再经过 NumPy 标量
         lookback = min(20, len(highs))
-        recent_high = max(highs[-lookback:])
-        recent_low = min(lows[-lookback:])
-        volume_avg = np.mean(volumes[-lookback:])
-        price_ma = np.mean(closes[-lookback:])
-        volume_trend = "上升" if volumes[-1] > volume_avg else "下降"
+        recent_high = float(highs[-lookback:].max())
+        recent_low = float(lows[-lookback:].min())
+        volume_avg = float(volumes[-lookback:].mean())
+        price_ma = float(closes[-lookback:].mean())
+        volume_trend = "上升" if float(volumes[-1]) > volume_avg else "下降"
 
         technicals = {
-            'rsi': float(compute_rsi(closes)[-1]) if len(closes) > 14 else 50,
-            'macd_line': float(macd_line[-1]),
-            'macd_signal': float(signal_line[-1]),
-            'macd_histogram': float(macd_histogram[-1]),
-            'macd_trend': "bullish" if macd_histogram[-1] > 0 else "bearish",
-            'resistance': float(recent_high),
-            'support': float(recent_low),
+            'rsi': rsi,
+            'macd_line': macd_value,
+            'macd_signal': signal_value,
+            # 上一根的 MACD / 信号线供技术分析判断金叉死叉，同一批 K 线不必再由分析器各自推进一遍增量状态
+            'macd_prev_line': prev_macd,
+            'macd_prev_signal': prev_signal,
+            'macd_histogram': macd_histogram,
+            'macd_trend': "bullish" if macd_histogram > 0 else "bearish",
+            'resistance': recent_high,
+            'support': recent_low,
             'volume_trend': volume_trend,
-            'price_vs_ma': "above" if closes[-1] > price_ma else "below",
+            'price_vs_ma': "above" if float(closes[-1]) > price_ma else "below",
+            # 风控检查使用的短窗口价格波动率，每根 K 线随指标只算一次
+            'price_volatility': window_volatility(closes) if len(closes) >= VOLATILITY_WINDOW else None,
         }
 
         logging.info("技术指标计算完成 - RSI: %.2f, MACD: %.4f", technicals['rsi'], technicals['macd_histogram'])
         return technicals
+
+
+class AsyncMarketDataFetcher:
+    """基于 `ccxt.async_support` 的 K 线并发获取器。
+
+    多个交易对 / 周期的 `fetch_ohlcv` 主要耗在网络往返上，这里用 `asyncio.gather` 一次并发发出，
+    总耗时接近最慢的单次请求；同一实例的并发调用仍受 ccxt `enableRateLimit` 节流约束。
+    底层 aiohttp 会话绑定首次请求所在的事件循环，用完需要在同一事件循环内 `await close()`。
+    """
+
+    def __init__(self, exchange_type: str, api_key: str, secret: str, password: str = '', sandbox: bool = True, proxies: Dict[str, str] = None):
+        ccxt_cfg = build_ccxt_config(exchange_type, api_key, secret, password)
+        if proxies:
+            # 异步客户端走 aiohttp，不识别 requests 风格的 proxies 字典
+            ccxt_cfg['aiohttp_proxy'] = proxies.get('https') or proxies.get('http')
+
+        if exchange_type == "binance":
+            self.exchange = ccxt_async.binance(ccxt_cfg)
+        else:
+            self.exchange = ccxt_async.okx(ccxt_cfg)
+        logging.info("初始化异步行情客户端: exchange=%s 沙盒模式: %s", exchange_type, sandbox)
+
+        if sandbox and hasattr(self.exchange, 'set_sandbox_mode'):
+            self.exchange.set_sandbox_mode(True)
+
+    async def fetch_ohlcv_batch(
+        self,
+        requests: Sequence[Tuple[str, str, int]],
+        since: Optional[Dict[Tuple[str, str], int]] = None,
+    ) -> Dict[Tuple[str, str], List[List[float]]]:
+        """并发获取多组 (交易对, 周期, 条数) 的 K 线，返回以 (交易对, 周期) 为键的结果。
+
+        since 按 (交易对, 周期) 给出增量获取的起始时间戳（见 `MarketDataFetcher.ohlcv_since`），缺省的组整段获取。
+        单组失败只记录日志并从结果中省略，由调用方决定是否回退到同步获取。
+        """
+        since = since or {}
+        results = await asyncio.gather(
+            *(
+                self.exchange.fetch_ohlcv(symbol, timeframe, since=since.get((symbol, timeframe)), limit=limit)
+                for symbol, timeframe, limit in requests
+            ),
+            return_exceptions=True,
+        )
+        fetched = {}
+        for (symbol, timeframe, limit), result in zip(requests, results):
+            if isinstance(result, BaseException):
+                logging.error("异步获取OHLCV数据失败: symbol=%s timeframe=%s limit=%s error=%s", symbol, timeframe, limit, result)
+                continue
+            fetched[(symbol, timeframe)] = result
+        logging.info("异步并发获取OHLCV完成: 成功 %s / %s 组", len(fetched), len(requests))
+        return fetched
+
+    async def fetch_ohlcv_many(self, symbols: List[str], timeframe: str, limit: int) -> Dict[str, List[List[float]]]:
+        """同一周期下并发获取多个交易对的 K 线，返回以交易对为键的结果，失败的交易对不出现在结果中。"""
+        fetched = await self.fetch_ohlcv_batch([(symbol, timeframe, limit) for symbol in symbols])
+        return {symbol: data for (symbol, _), data in fetched.items()}
+
+    async def close(self) -> None:
+        await self.exchange.close()
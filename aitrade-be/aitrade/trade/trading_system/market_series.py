@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+
+
+@dataclass(slots=True)
+class MarketSeries:
+    """按列（SoA）保存的一段 K 线序列，每列都是独立的连续 ndarray。
+
+    交易所返回的是按行组织的 `[ts, open, high, low, close, volume]` 列表；这里只做一次
+    二维 float64 转换并按列复制成连续内存，下游技术分析直接复用这些数组，不再各自把
+    Python 列表重新转换成 NumPy 数组。
+    """
+
+    timestamps: np.ndarray
+    opens: np.ndarray
+    highs: np.ndarray
+    lows: np.ndarray
+    closes: np.ndarray
+    volumes: np.ndarray
+
+    @classmethod
+    def from_ohlcv(cls, ohlcv: list[list[Any]]) -> MarketSeries:
+        if len(ohlcv) == 0:
+            empty = np.empty(0, dtype=np.float64)
+            return cls(np.empty(0, dtype=np.int64), empty, empty.copy(), empty.copy(), empty.copy(), empty.copy())
+        # 转置后再 copy，保证每一列在内存中连续；毫秒时间戳小于 2^53，经 float64 中转不会丢精度。
+        columns = np.asarray(ohlcv, dtype=np.float64)[:, :6].T.copy()
+        return cls(
+            timestamps=columns[0].astype(np.int64),
+            opens=columns[1],
+            highs=columns[2],
+            lows=columns[3],
+            closes=columns[4],
+            volumes=columns[5],
+        )
+
+    def __len__(self) -> int:
+        return int(self.closes.shape[0])
+
+    def to_ohlcv(self) -> list[list[Any]]:
+        """还原为交易所格式的 `[ts, open, high, low, close, volume]` 行列表，时间戳为 int。"""
+        rows = np.column_stack((self.opens, self.highs, self.lows, self.closes, self.volumes)).tolist()
+        for timestamp, row in zip(self.timestamps.tolist(), rows):
+            row.insert(0, timestamp)
+        return rows
+
+    def to_market_fields(self) -> dict[str, np.ndarray]:
+        return {
+            'timestamps': self.timestamps,
+            'opens': self.opens,
+            'highs': self.highs,
+            'lows': self.lows,
+            'closes': self.closes,
+            'volumes': self.volumes,
+        }
+
+
+class OhlcvRingBuffer:
+    """按 (交易对, 周期) 复用的预分配 K 线缓冲区。
+
+    交易所每轮都会返回最近 `limit` 根 K 线，其中绝大部分与上一轮相同。这里只写入时间戳不早于
+    已保存最后一根（上一轮可能尚未收盘）的行，更早的行直接复用；稳态下每轮只写 1~2 行，也不再为
+    每个周期分配新的列数组。写满时把最近窗口整体前移，摊还后每次追加仍是 O(1)。
+
+    `update` 返回的 MarketSeries 是缓冲区的零拷贝视图，只在下一次 `update` 之前有效。
+    传入的行与已保存数据衔接时，只需提供最后一根之后的 K 线（增量获取），视图长度由 `length` 指定。
+    """
+
+    def __init__(self, window: int, slack: int = 64):
+        self.window = window
+        self.slack = slack
+        self.capacity = window + slack
+        self._timestamps = np.empty(self.capacity, dtype=np.int64)
+        # 行依次为 open / high / low / close / volume；按行切片得到的每一列都是连续内存
+        self._values = np.empty((5, self.capacity), dtype=np.float64)
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def last_timestamp(self) -> int | None:
+        return int(self._timestamps[self._size - 1]) if self._size else None
+
+    def update(self, ohlcv: list[list[Any]], length: int | None = None) -> MarketSeries:
+        if len(ohlcv) == 0:
+            return MarketSeries.from_ohlcv([])
+        if len(ohlcv) > self.window:
+            self._grow(len(ohlcv))
+
+        start = 0
+        if self._size:
+            last_ts = int(self._timestamps[self._size - 1])
+            if int(ohlcv[0][0]) <= last_ts:
+                # 从已保存的最后一根开始覆盖，之前的行沿用
+                start = len(ohlcv)
+                while start > 0 and int(ohlcv[start - 1][0]) >= last_ts:
+                    start -= 1
+                if start < len(ohlcv) and int(ohlcv[start][0]) == last_ts:
+                    self._size -= 1
+            else:
+                # 与已有数据之间存在缺口（首次加载或长时间中断），整体重建
+                self._size = 0
+
+        if start < len(ohlcv):
+            self._extend(ohlcv[start:])
+        return self._view(min(len(ohlcv) if length is None else length, self._size))
+
+    def _extend(self, rows: list[list[Any]]) -> None:
+        # 新增行一次性转成二维数组后按列整块写入，首次加载整段 K 线时不再逐行逐字段赋值
+        block = np.asarray(rows, dtype=np.float64)
+        count = block.shape[0]
+        if self._size + count > self.capacity:
+            # 调用方保证 count <= window，前移后仍足以覆盖下一次视图所需的历史行
+            keep = min(self._size, self.window - count)
+            self._timestamps[:keep] = self._timestamps[self._size - keep:self._size]
+            self._values[:, :keep] = self._values[:, self._size - keep:self._size]
+            self._size = keep
+        start = self._size
+        end = start + count
+        self._timestamps[start:end] = block[:, 0]
+        self._values[:, start:end] = block[:, 1:6].T
+        self._size = end
+
+    def _grow(self, window: int) -> None:
+        # 已保存的行不足以拼出更长的窗口，直接按新容量重新分配，由本轮数据整体重建
+        logging.debug("K线缓冲区窗口扩大: %s -> %s", self.window, window)
+        self.window = window
+        self.capacity = window + self.slack
+        self._timestamps = np.empty(self.capacity, dtype=np.int64)
+        self._values = np.empty((5, self.capacity), dtype=np.float64)
+        self._size = 0
+
+    def _view(self, length: int) -> MarketSeries:
+        start = self._size - length
+        end = self._size
+        return MarketSeries(
+            timestamps=self._timestamps[start:end],
+            opens=self._values[0, start:end],
+            highs=self._values[1, start:end],
+            lows=self._values[2, start:end],
+            closes=self._values[3, start:end],
+            volumes=self._values[4, start:end],
+        )
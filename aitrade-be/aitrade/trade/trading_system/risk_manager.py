@@ -1,14 +1,33 @@
 import logging
+import math
 from typing import Any, Dict
 
 import numpy as np
 
+VOLATILITY_WINDOW = 10
+
+
+def window_volatility(values, window: int = VOLATILITY_WINDOW) -> float:
+    """末尾 window 个值的变异系数 std / mean（总体标准差），均值下限 1e-10。
+
+    窗口只有十来个点，手写一次减均值和点积，比 `np.std` 走通用归约的固定开销更小。
+    """
+    tail = np.asarray(values[-window:], dtype=np.float64)
+    mean = tail.mean()
+    deviation = tail - mean
+    return math.sqrt(deviation.dot(deviation) / tail.shape[0]) / max(float(mean), 1e-10)
+
 
 class RiskManager:
     """风险管理器。"""
 
     @staticmethod
     def risk_management_check(data: Dict[str, Any], signal: Dict[str, Any]) -> Dict[str, Any]:
+        """依次检查数据量、波动率、规则策略止损与 RSI，命中第一条拦截规则即返回，结果里带上对应的拦截原因。
+
+        波动率优先复用行情获取时在 K 线列数组上算好的 `technicals['price_volatility']`，
+        只有外部构造的数据才在末尾窗口上现算一次；检查顺序与拦截原因、指标字段保持不变。
+        """
         proposed_action = signal.get('action', 'hold')
         strategy = signal.get('strategy', 'unknown')
         closes = data.get('closes', [])
@@ -40,7 +59,7 @@ class RiskManager:
                 'metrics': metrics,
             }
 
-        if len(closes) < 10:
+        if len(closes) < VOLATILITY_WINDOW:
             logging.warning("价格数据不足，取消交易")
             return {
                 'passed': False,
@@ -48,7 +67,10 @@ class RiskManager:
                 'metrics': metrics,
             }
 
-        volatility = np.std(closes[-10:]) / max(np.mean(closes[-10:]), 1e-10)
+        # 行情获取时已随技术指标算好的波动率直接复用，缺失时（如外部构造的数据）再现算
+        volatility = technicals.get('price_volatility')
+        if volatility is None:
+            volatility = window_volatility(closes)
         metrics['volatility'] = float(volatility)
         logging.info("风险检查 - 策略: %s, 价格: %s, RSI: %.2f, 波动率: %.4f", strategy, price, rsi, volatility)
 
@@ -121,11 +143,11 @@ class RiskManager:
 
     @staticmethod
     def check_market_conditions(volumes: list, volatility_threshold: float = 0.03) -> bool:
-        if len(volumes) < 10:
+        if len(volumes) < VOLATILITY_WINDOW:
             logging.debug("成交量数据不足，市场条件默认为合适")
             return True
 
-        recent_volatility = np.std(volumes[-10:]) / max(np.mean(volumes[-10:]), 1e-10)
+        recent_volatility = window_volatility(volumes)
         is_suitable = recent_volatility < volatility_threshold
         logging.info("市场条件检查 - 近期波动率: %.4f, 是否合适: %s", recent_volatility, is_suitable)
 
@@ -1,4 +1,3 @@
-import json
 import logging
 from datetime import datetime, timezone
 from typing import Any, Dict, Optional, Sequence
@@ -19,6 +18,8 @@ from ...db import TradeTaskRunModel
 from ...db import UserModel
 from ...db.session import get_engine
 from ...db.session import get_session_factory
+from .json_codec import dumps_text
+from .json_codec import loads_text
 
 
 class SQLAlchemyTradeStore:
@@ -297,13 +298,13 @@ class SQLAlchemyTradeStore:
     def _json_text(value: Any) -> Optional[str]:
         if value is None:
             return None
-        return json.dumps(value, ensure_ascii=False)
+        return dumps_text(value)
 
     @staticmethod
     def _json_value(value: Optional[str], default: Any = None) -> Any:
         if value is None:
             return default
-        return json.loads(value)
+        return loads_text(value)
 
     def _ensure_trade_records_schema(self) -> None:
         inspector = inspect(self.engine)
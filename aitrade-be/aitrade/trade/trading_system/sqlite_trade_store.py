@@ -1,9 +1,11 @@
-import json
 import os
 import sqlite3
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
 
+from .json_codec import dumps_text
+from .json_codec import loads_text
+
 
 class SQLiteTradeStore:
     """SQLite 交易持久化存储。"""
@@ -280,13 +282,13 @@ class SQLiteTradeStore:
     def _json_text(value: Any) -> Optional[str]:
         if value is None:
             return None
-        return json.dumps(value, ensure_ascii=False)
+        return dumps_text(value)
 
     @staticmethod
     def _json_value(value: Optional[str], default: Any = None) -> Any:
         if value is None:
             return default
-        return json.loads(value)
+        return loads_text(value)
 
     @staticmethod
     def _utc_now() -> str:
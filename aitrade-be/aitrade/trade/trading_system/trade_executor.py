@@ -1,15 +1,23 @@
 import json
 import logging
+import time
 from datetime import datetime, timedelta, timezone
+from functools import cached_property
 from typing import Any, Dict, Optional
 
 import ccxt
+import numpy as np
 
 from ...config.config_file import DEFAULT_PAPER_BALANCE
 from ...config.config_file import TRADE_MODES
+from .exchange_factory import create_exchange
+from .json_codec import dumps_pretty
 from .trade_store_factory import create_trade_store
 from .trade_store_factory import summarize_database_target
 
+# 市场列表（精度、最小下单量等）很少变化，缓存超过该时长后在下一次下单前重新拉取
+MARKETS_REFRESH_SECONDS = 6 * 3600
+
 
 class TradingHaltError(RuntimeError):
     def __init__(self, reason: str, detail: Optional[Dict[str, Any]] = None):
@@ -18,6 +26,66 @@ class TradingHaltError(RuntimeError):
         self.detail = detail or {}
 
 
+class TradeLog:
+    """本进程内已成交记录的列式存储。
+
+    时间戳、动作、价格、数量各占一列预分配数组，写满时容量翻倍，摊还后追加仍是 O(1)；
+    完整的信号与订单明细只写入交易日志文件，这里不再为每笔成交保留一份字典。
+    """
+
+    def __init__(self, capacity: int = 64):
+        self._timestamps_ms = np.empty(capacity, dtype=np.int64)
+        self._actions = np.empty(capacity, dtype='U16')
+        self._prices = np.empty(capacity, dtype=np.float64)
+        self._amounts = np.empty(capacity, dtype=np.float64)
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def append(self, timestamp_ms: int, action: str, price: Any, amount: Any) -> None:
+        if self._size == self._timestamps_ms.shape[0]:
+            self._grow()
+        index = self._size
+        self._timestamps_ms[index] = timestamp_ms
+        self._actions[index] = action
+        self._prices[index] = self._to_float(price)
+        self._amounts[index] = self._to_float(amount)
+        self._size += 1
+
+    @property
+    def timestamps_ms(self) -> np.ndarray:
+        return self._timestamps_ms[:self._size]
+
+    @property
+    def actions(self) -> np.ndarray:
+        return self._actions[:self._size]
+
+    @property
+    def prices(self) -> np.ndarray:
+        return self._prices[:self._size]
+
+    @property
+    def amounts(self) -> np.ndarray:
+        return self._amounts[:self._size]
+
+    def _grow(self) -> None:
+        capacity = self._timestamps_ms.shape[0] * 2
+        for name in ('_timestamps_ms', '_actions', '_prices', '_amounts'):
+            column = getattr(self, name)
+            grown = np.empty(capacity, dtype=column.dtype)
+            grown[:self._size] = column[:self._size]
+            setattr(self, name, grown)
+
+    @staticmethod
+    def _to_float(value: Any) -> float:
+        # 市价单回报里价格 / 数量可能缺失，记为 NaN
+        try:
+            return float(value)
+        except (TypeError, ValueError):
+            return float('nan')
+
+
 class TradeExecutor:
     """交易执行器。"""
 
@@ -33,45 +101,27 @@ class TradeExecutor:
         persistence_config: Optional[Dict[str, Any]] = None,
         paper_balance: Optional[float] = None,
         owner_user_id: Optional[int] = None,
+        exchange: Optional[ccxt.Exchange] = None,
     ):
-        ccxt_cfg = {
-            'apiKey': api_key,
-            'secret': secret,
-            'enableRateLimit': True,
-        }
-
-        if exchange_type == "okx" and password:
-            ccxt_cfg['password'] = password
-
-        if proxies:
-            ccxt_cfg['proxies'] = proxies
-
-        if exchange_type == "binance":
-            ccxt_cfg['options'] = {
-                'defaultType': 'spot',
-                'fetchMarkets': {
-                    'types': ['spot'],
-                },
-            }
-            self.exchange = ccxt.binance(ccxt_cfg)
-            logging.info("初始化Binance交易所用于交易执行，沙盒模式: %s", sandbox)
-        else:
-            self.exchange = ccxt.okx(ccxt_cfg)
-            logging.info("初始化OKX交易所用于交易执行，沙盒模式: %s", sandbox)
-
-        if sandbox and hasattr(self.exchange, 'set_sandbox_mode'):
-            self.exchange.set_sandbox_mode(True)
+        # 传入 exchange 时与行情获取器共用同一客户端，市场列表与限频计数只有一份；
+        # 否则首次访问时才按参数创建，构造执行器本身不触发任何网络请求
+        self._exchange_args = (exchange_type, api_key, secret, password, sandbox, proxies)
+        if exchange is not None:
+            self.exchange = exchange
 
         if trade_mode not in TRADE_MODES:
             raise ValueError(f'不支持的交易方式: {trade_mode}')
 
         self.exchange_type = exchange_type
         self.sandbox = sandbox
+        # 市场列表在首次下单时才加载
+        self._markets: Optional[Dict[str, Any]] = None
+        self._markets_loaded_at = 0.0
         self.trade_mode = trade_mode
         self.paper_balance = float(paper_balance if paper_balance is not None else DEFAULT_PAPER_BALANCE)
         self.owner_user_id = int(owner_user_id or 0)
         self.position = None
-        self.trade_log = []
+        self.trade_log = TradeLog()
         self.trade_logger = logging.getLogger('trade')
         self.persistence_config = persistence_config or {}
         self.persistence_enabled = bool(self.persistence_config.get('enabled', True))
@@ -96,6 +146,28 @@ class TradeExecutor:
             self.paper_balance,
         )
 
+    @cached_property
+    def exchange(self) -> ccxt.Exchange:
+        return create_exchange(*self._exchange_args)
+
+    def refresh_markets(self) -> Dict[str, Any]:
+        """重新拉取交易所市场列表并更新缓存，用于交易对上下架等少见场景。"""
+        self._markets = self.exchange.load_markets(True)
+        self._markets_loaded_at = time.monotonic()
+        return self._markets
+
+    def _get_market(self, symbol: str) -> Optional[Dict[str, Any]]:
+        # 首次使用时加载（共享客户端已加载过则直接取 ccxt 缓存）；之后只在缓存过期或交易对不在缓存中时才重新拉取
+        if self._markets is None:
+            self._markets = self.exchange.load_markets()
+            self._markets_loaded_at = time.monotonic()
+        elif time.monotonic() - self._markets_loaded_at > MARKETS_REFRESH_SECONDS:
+            logging.info("市场列表缓存已超过 %s 秒，重新加载", MARKETS_REFRESH_SECONDS)
+            self.refresh_markets()
+        if symbol not in self._markets:
+            self.refresh_markets()
+        return self._markets.get(symbol)
+
     def close(self) -> None:
         if self.store is not None:
             self.store.close()
@@ -190,10 +262,10 @@ class TradeExecutor:
                 ) / data['price']
                 logging.info("计算交易数量: %s", amount)
 
-                markets = self.exchange.load_markets()
-                if symbol not in markets:
+                market = self._get_market(symbol)
+                if market is None:
                     logging.error("交易对 %s 不在交易所市场列表中", symbol)
-                    available_symbols = list(markets.keys())
+                    available_symbols = list(self._markets.keys())
                     if available_symbols:
                         logging.debug("部分可用交易对示例: %s", available_symbols[:10])
                     self._persist_trade_record(
@@ -212,7 +284,6 @@ class TradeExecutor:
                     )
                     return
 
-                market = markets[symbol]
                 min_amount = market['limits']['amount']['min'] if 'min' in market['limits']['amount'] else 0
                 amount = max(amount, min_amount)
                 logging.info("调整后交易数量: %s (最小: %s)", amount, min_amount)
@@ -360,7 +431,7 @@ class TradeExecutor:
 
     def _log_trade(self, signal: Dict[str, Any], order: Dict[str, Any], action: str) -> None:
         log_entry = {
-            'timestamp': self._utc_now(),
+            'timestamp_ms': time.time_ns() // 1_000_000,
             'action': action,
             'trade_mode': self.trade_mode,
             'signal': signal,
@@ -368,9 +439,11 @@ class TradeExecutor:
             'price': order.get('price', 'unknown'),
             'amount': order.get('amount', 'unknown'),
         }
-        self.trade_log.append(log_entry)
-        logging.info("交易日志: %s", json.dumps(log_entry, indent=2, ensure_ascii=False))
-        self.trade_logger.info("交易成功: %s", json.dumps(log_entry, indent=2, ensure_ascii=False))
+        self.trade_log.append(log_entry['timestamp_ms'], action, log_entry['price'], log_entry['amount'])
+        # 两条日志共用同一份序列化结果
+        log_text = dumps_pretty(log_entry)
+        logging.info("交易日志: %s", log_text)
+        self.trade_logger.info("交易成功: %s", log_text)
 
     def _get_available_usdt_balance(self) -> float:
         if self.trade_mode == 'paper':
@@ -1,11 +1,16 @@
+import asyncio
 import logging
 import time
-from threading import Event
+
+import numpy as np
 
 from ...config import config_file
+from ...config.path_utils import resolve_ohlcv_cache_dir
 
 from ..gpt_signal.technical_analyzer import TechnicalAnalyzer
 from ..strategies import create_strategy
+from .exchange_factory import create_exchange
+from .market_data_fetcher import AsyncMarketDataFetcher
 from .market_data_fetcher import MarketDataFetcher
 from .risk_manager import RiskManager
 from .trade_executor import TradeExecutor
@@ -20,6 +25,18 @@ class TradingBot:
         self.execution_context = execution_context or {}
 
         market_data_sandbox = config.trade_mode == 'sandbox'
+        # 同步 ccxt 客户端与异步行情客户端共用同一份代理配置
+        proxies = {'http': config.proxy_url, 'https': config.proxy_url} if config.proxy_enable else None
+
+        # 行情获取与交易执行共用一个 ccxt 客户端：市场列表只加载一次，限频计数也不会各算各的
+        self.exchange = create_exchange(
+            exchange_type=config.exchange_type,
+            api_key=config.exchange_api_key,
+            secret=config.exchange_api_secret,
+            password=config.exchange_password,
+            sandbox=market_data_sandbox,
+            proxies=proxies,
+        )
 
         logging.info("初始化市场数据获取器")
         self.market_data_fetcher = MarketDataFetcher(
@@ -28,7 +45,8 @@ class TradingBot:
             secret=config.exchange_api_secret,
             password=config.exchange_password,
             sandbox=market_data_sandbox,
-            proxies={'http': config.proxy_url, 'https': config.proxy_url} if config.proxy_enable else None,
+            exchange=self.exchange,
+            cache_dir=resolve_ohlcv_cache_dir(config.data_root_dir),
         )
 
         logging.info("初始化交易执行器")
@@ -39,10 +57,10 @@ class TradingBot:
             password=config.exchange_password,
             sandbox=market_data_sandbox,
             trade_mode=config.trade_mode,
-            proxies={'http': config.proxy_url, 'https': config.proxy_url} if config.proxy_enable else None,
             persistence_config=config.trade_persistence_config,
             paper_balance=config.trade_paper_balance,
             owner_user_id=self.execution_context.get('owner_user_id'),
+            exchange=self.exchange,
         )
 
         logging.info("初始化风险管理器")
@@ -53,6 +71,18 @@ class TradingBot:
         self.market_data_requirements = self.strategy.get_market_data_requirements()
         self.required_history = max(config.trade_limit, self.strategy.get_required_history())
 
+        # 需要多个周期 K 线时，异步主循环用异步行情客户端并发预取各周期数据
+        self.async_market_data_fetcher = None
+        if self.market_data_requirements.get('context_timeframes'):
+            self.async_market_data_fetcher = AsyncMarketDataFetcher(
+                exchange_type=config.exchange_type,
+                api_key=config.exchange_api_key,
+                secret=config.exchange_api_secret,
+                password=config.exchange_password,
+                sandbox=market_data_sandbox,
+                proxies=proxies,
+            )
+
         if config.trade_persistence_config.get('restore_position_on_startup'):
             restored = self.trade_executor.restore_position_from_storage(config.trade_symbol)
             if restored:
@@ -73,19 +103,46 @@ class TradingBot:
 
     def close(self) -> None:
         self.trade_executor.close()
+        # 共享的 ccxt 客户端由机器人创建，其 HTTP 连接池随机器人一起释放
+        self.exchange.close()
 
     def get_cycle_interval_seconds(self) -> int:
         timeframe = self.market_data_requirements.get('primary_timeframe') or (str(self.config.trade_timeframe) + 'm')
         return self._timeframe_to_seconds(timeframe)
 
-    def run_cycle(self) -> None:
+    async def run_cycle_async(self) -> None:
+        """单轮调度，由交易任务线程的事件循环逐轮执行：策略信号走 generate_signal_async（GPT 策略直接使用异步 AI 客户端），
+        交易所与持久化仍是同步调用，放到线程中执行，避免阻塞事件循环。
+
+        先完成单日亏损检查，触发停止时直接抛出异常结束本轮，不再获取行情。"""
         logging.info("开始新的交易周期")
-        self.trade_executor.check_daily_loss_stop(self.execution_context.get('run_id'))
-        data = self._load_market_data()
+        await asyncio.to_thread(self.trade_executor.check_daily_loss_stop, self.execution_context.get('run_id'))
+        data = await self._load_market_data_async()
+        position = self.trade_executor.get_position()
+        signal = await self.strategy.generate_signal_async(data, position)
+        await asyncio.to_thread(self._apply_signal, data, position, signal)
+
+    async def _load_market_data_async(self) -> dict:
+        prefetched = await self._prefetch_ohlcv()
+        data = await asyncio.to_thread(self._load_market_data, prefetched)
         logging.debug("获取到市场数据: %s 价格: %s", data['symbol'], data['price'])
+        return data
 
-        position = self.trade_executor.get_position()
-        signal = self.strategy.generate_signal(data, position)
+    async def _prefetch_ohlcv(self) -> dict | None:
+        """并发获取主周期与上下文周期的 K 线；未启用异步行情客户端时返回 None。"""
+        if self.async_market_data_fetcher is None:
+            return None
+        symbol = self.config.trade_symbol
+        requests = [(symbol, timeframe, limit) for timeframe, limit in self._ohlcv_requests()]
+        # 已有完整窗口的周期只从缓存的最后一根 K 线开始增量获取
+        since = {}
+        for _, timeframe, limit in requests:
+            timestamp = self.market_data_fetcher.ohlcv_since(symbol, timeframe, limit)
+            if timestamp is not None:
+                since[(symbol, timeframe)] = timestamp
+        return await self.async_market_data_fetcher.fetch_ohlcv_batch(requests, since=since)
+
+    def _apply_signal(self, data: dict, position: dict | None, signal: dict) -> None:
         logging.info("策略信号生成完成: %s (%s)", signal['action'], signal.get('reason', '无原因'))
 
         if position:
@@ -117,28 +174,41 @@ class TradingBot:
             logging.warning("触发止损条件! 当前价格: %s, 止损价格: %s", data['price'], position['stop_loss'])
             self._execute_stop_loss(position, data)
 
-    def _load_market_data(self) -> dict:
+    def _ohlcv_requests(self) -> list[tuple[str, int]]:
+        """本轮需要的 (周期, K线条数)，第一项为主周期，其后为上下文周期。"""
         primary_timeframe = self.market_data_requirements.get('primary_timeframe') or (str(self.config.trade_timeframe) + 'm')
+        requests = [(primary_timeframe, self.required_history)]
+        context_timeframes = list(self.market_data_requirements.get('context_timeframes') or [])
+        if context_timeframes:
+            context_history_getter = getattr(self.strategy, 'get_required_context_history', None)
+            context_histories = context_history_getter() if callable(context_history_getter) else {}
+            for timeframe in context_timeframes:
+                requests.append((timeframe, max(int(context_histories.get(timeframe, self.required_history)), 10)))
+        return requests
+
+    def _load_market_data(self, prefetched: dict | None = None) -> dict:
+        # prefetched 中缺失的周期（异步获取失败或未预取）回退为同步获取
+        prefetched = prefetched or {}
+        symbol = self.config.trade_symbol
+        (primary_timeframe, primary_limit), *context_requests = self._ohlcv_requests()
         primary_data = self.market_data_fetcher.get_enhanced_market_data(
-            symbol=self.config.trade_symbol,
+            symbol=symbol,
             timeframe=primary_timeframe,
-            limit=self.required_history,
+            limit=primary_limit,
+            ohlcv=prefetched.get((symbol, primary_timeframe)),
         )
-        context_timeframes = list(self.market_data_requirements.get('context_timeframes') or [])
         extra_feeds = list(self.market_data_requirements.get('extra_feeds') or [])
-        if not context_timeframes and not extra_feeds:
+        if not context_requests and not extra_feeds:
             return primary_data
 
         contexts = {}
-        context_history_getter = getattr(self.strategy, 'get_required_context_history', None)
-        context_histories = context_history_getter() if callable(context_history_getter) else {}
         decision_ts = primary_data['timestamps'][-1]
-        for timeframe in context_timeframes:
-            context_limit = max(int(context_histories.get(timeframe, self.required_history)), 10)
+        for timeframe, context_limit in context_requests:
             context_data = self.market_data_fetcher.get_enhanced_market_data(
-                symbol=self.config.trade_symbol,
+                symbol=symbol,
                 timeframe=timeframe,
                 limit=context_limit,
+                ohlcv=prefetched.get((symbol, timeframe)),
             )
             contexts[timeframe] = self._trim_context_market_data(context_data, decision_ts)
 
@@ -307,8 +377,11 @@ class TradingBot:
         lower_threshold = float(params.get('lower_threshold', 30.0) or 30.0)
         upper_threshold = float(params.get('upper_threshold', 70.0) or 70.0)
         confirm_crossover = bool(params.get('confirm_crossover', True))
-        closes = list(primary_data.get('closes') or [])
-        timestamps = list(primary_data.get('timestamps') or [])
+        # 实盘行情已是 ndarray，不能用 `or` 判空，也无需再复制成列表。
+        closes = primary_data.get('closes')
+        closes = [] if closes is None else closes
+        timestamps = primary_data.get('timestamps')
+        timestamps = [] if timestamps is None else timestamps
         price = self._to_float(primary_data.get('price')) or 0.0
         if indicator_key not in {'rsi', 'macd'}:
             return {
@@ -331,7 +404,7 @@ class TradingBot:
                     'currentHistory': len(closes),
                 },
             }
-        latest_timestamp = int(timestamps[-1]) if timestamps else None
+        latest_timestamp = int(timestamps[-1]) if len(timestamps) else None
         closes_window = closes[-lookback_candles:]
         as_of = self._timestamp_ms_to_iso(latest_timestamp)
         if indicator_key == 'rsi':
@@ -441,11 +514,12 @@ class TradingBot:
 
     @staticmethod
     def _trim_context_market_data(context_data: dict, decision_ts: int) -> dict:
-        valid_indexes = [index for index, timestamp in enumerate(context_data.get('timestamps', [])) if timestamp <= decision_ts]
-        if not valid_indexes:
+        # K 线时间戳升序，二分定位最后一根不晚于决策时间的 K 线，不再逐根遍历
+        last_index = int(np.searchsorted(context_data.get('timestamps', []), decision_ts, side='right'))
+        if last_index == 0:
             return {
                 'symbol': context_data.get('symbol'),
-                'timestamp': context_data.get('timestamp'),
+                'timestamp_ms': context_data.get('timestamp_ms'),
                 'price': context_data.get('price'),
                 'timestamps': [],
                 'opens': [],
@@ -456,12 +530,11 @@ class TradingBot:
                 'ohlcv': [],
                 'technicals': {},
             }
-        last_index = valid_indexes[-1] + 1
         closes = context_data.get('closes', [])[:last_index]
         trimmed = {
             'symbol': context_data.get('symbol'),
-            'timestamp': context_data.get('timestamp'),
-            'price': closes[-1] if closes else context_data.get('price'),
+            'timestamp_ms': int(context_data['timestamps'][last_index - 1]),
+            'price': float(closes[-1]) if len(closes) else context_data.get('price'),
             'timestamps': context_data.get('timestamps', [])[:last_index],
             'opens': context_data.get('opens', [])[:last_index],
             'highs': context_data.get('highs', [])[:last_index],
@@ -506,26 +579,13 @@ class TradingBot:
             return int(normalized[:-1]) * 86400
         raise ValueError(f'不支持的周期格式: {timeframe}')
 
-    def run(self, stop_event: Event | None = None) -> None:
-        logging.info("启动交易机器人主循环...")
-        effective_stop_event = stop_event or Event()
-
-        while not effective_stop_event.is_set():
-            try:
-                self.run_cycle()
-                sleep_time = self.get_cycle_interval_seconds()
-                logging.info("交易周期完成，等待 %s 秒后开始下一周期", sleep_time)
-                if effective_stop_event.wait(sleep_time):
-                    logging.info("收到停止信号，交易机器人准备退出")
-                    break
-            except TradingHaltError:
-                raise
-            except Exception as e:
-                logging.exception("主循环发生错误: %s", e)
-                logging.info("等待60秒后重试...")
-                if effective_stop_event.wait(60):
-                    logging.info("收到停止信号，交易机器人准备退出")
-                    break
+    async def aclose(self) -> None:
+        """关闭绑定在事件循环上的异步资源（策略的 AI 连接池、异步行情客户端），需在运行周期的同一事件循环内调用。"""
+        try:
+            await self.strategy.aclose()
+        finally:
+            if self.async_market_data_fetcher is not None:
+                await self.async_market_data_fetcher.close()
 
     def _execute_stop_loss(self, position, market_data):
         try:
@@ -3,6 +3,7 @@ from __future__ import annotations
 import copy
 import json
 import logging
+import math
 from datetime import datetime
 from datetime import timedelta
 from datetime import timezone
@@ -905,6 +906,8 @@ class TradeTaskService:
                 stop_event = Event()
                 self._stop_events[runner_name] = stop_event
 
+            # 按单调时钟计算每轮的开始时刻，等待时长扣除本轮处理耗时，周期起点不随处理时间漂移
+            cycle_deadline = monotonic()
             while not stop_event.is_set():
                 # 每轮开始前先刷新 heartbeat 和周期开始时间，便于页面和日志观察当前活跃度。
                 cycle_started_at = self._now_iso()
@@ -931,18 +934,20 @@ class TradeTaskService:
                         },
                     )
 
-                bot.trading_bot.run_cycle()
+                bot.run_cycle()
 
                 # 周期结束后写回下一次计划执行时间；如果已经收到停止请求，则保留 stop_requested 状态等待退出。
                 cycle_finished_at = self._now_iso()
                 interval_seconds = bot.trading_bot.get_cycle_interval_seconds()
+                cycle_deadline = self._next_cycle_deadline(cycle_deadline, interval_seconds, monotonic())
+                wait_seconds = max(0.0, cycle_deadline - monotonic())
                 with self._lock:
                     model = self._get_or_create_runtime(runner_name)
                     if model.status != STATUS_STOP_REQUESTED:
                         model.status = STATUS_RUNNING
                     model.last_heartbeat_at = cycle_finished_at
                     model.last_cycle_finished_at = cycle_finished_at
-                    model.next_run_at = self._add_seconds(cycle_finished_at, interval_seconds)
+                    model.next_run_at = self._add_seconds(cycle_finished_at, wait_seconds)
                     model.updated_at = cycle_finished_at
                     self._save_runtime(model)
                     self._append_log(
@@ -958,7 +963,7 @@ class TradeTaskService:
                         },
                     )
 
-                if stop_event.wait(interval_seconds):
+                if stop_event.wait(max(0.0, cycle_deadline - monotonic())):
                     break
 
             stopped_at = self._now_iso()
@@ -1777,5 +1782,13 @@ class TradeTaskService:
         return datetime.now(timezone.utc).isoformat()
 
     @staticmethod
-    def _add_seconds(value: str, seconds: int) -> str:
+    def _next_cycle_deadline(deadline: float, interval_seconds: float, now: float) -> float:
+        # 下一轮的开始时刻顺延一个周期；某轮处理超过一个周期时跳过错过的节拍，对齐到下一拍而不是连续补跑。
+        deadline += interval_seconds
+        if deadline < now:
+            deadline += math.ceil((now - deadline) / interval_seconds) * interval_seconds
+        return deadline
+
+    @staticmethod
+    def _add_seconds(value: str, seconds: float) -> str:
         return (datetime.fromisoformat(value) + timedelta(seconds=seconds)).isoformat()
@@ -0,0 +1,61 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+BAR_MS = 60_000
+START_MS = 1_700_000_000_000
+
+
+def _wilder_rsi_reference(closes, period=14):
+    """逐根 K 线按定义递推的 RSI：前 period 个差分取简单均值作种子，之后 Wilder 平滑。"""
+    deltas = np.diff(np.asarray(closes, dtype=np.float64))
+    up = float(np.clip(deltas[:period], 0.0, None).sum()) / period
+    down = float(np.clip(-deltas[:period], 0.0, None).sum()) / period
+    values = []
+    for index in range(period, len(deltas) + 1):
+        if index > period:
+            delta = float(deltas[index - 1])
+            up = (up * (period - 1) + max(delta, 0.0)) / period
+            down = (down * (period - 1) + max(-delta, 0.0)) / period
+        values.append(100.0 * up / (up + down) if up + down > 0.0 else 0.0)
+    return np.asarray(values)
+
+
+def _macd_reference(closes, adjust=True):
+    """pandas ewm 组合出的 12/26/9 MACD，返回 (MACD 线, 信号线) 两个 ndarray。"""
+    series = pd.Series(np.asarray(closes, dtype=np.float64))
+    macd_line = series.ewm(span=12, adjust=adjust).mean() - series.ewm(span=26, adjust=adjust).mean()
+    signal_line = macd_line.ewm(span=9, adjust=adjust).mean()
+    return macd_line.to_numpy(), signal_line.to_numpy()
+
+
+@pytest.fixture
+def closes():
+    """固定种子的对数正态随机游走收盘价。"""
+    rng = np.random.default_rng(20240601)
+    return 100.0 * np.exp(np.cumsum(rng.normal(0.0, 0.01, 400)))
+
+
+@pytest.fixture
+def timestamps(closes):
+    return START_MS + BAR_MS * np.arange(closes.shape[0], dtype=np.int64)
+
+
+@pytest.fixture
+def ohlcv_rows(closes, timestamps):
+    rng = np.random.default_rng(7)
+    volumes = rng.uniform(10.0, 20.0, closes.shape[0])
+    return [
+        [int(ts), close * 0.999, close * 1.002, close * 0.997, close, volume]
+        for ts, close, volume in zip(timestamps.tolist(), closes.tolist(), volumes.tolist())
+    ]
+
+
+@pytest.fixture
+def reference_rsi():
+    return _wilder_rsi_reference
+
+
+@pytest.fixture
+def reference_macd():
+    return _macd_reference
@@ -0,0 +1,44 @@
+import json
+import math
+
+import pytest
+
+from aitrade.trade.trading_system import json_codec
+from aitrade.trade.trading_system.sqlite_trade_store import SQLiteTradeStore
+
+
+@pytest.fixture(params=['orjson', 'stdlib'])
+def codec(request, monkeypatch):
+    """分别覆盖安装与未安装 orjson 两种环境。"""
+    if request.param == 'orjson':
+        if json_codec.orjson is None:
+            pytest.skip('orjson 未安装')
+    else:
+        monkeypatch.setattr(json_codec, 'orjson', None)
+    return json_codec
+
+
+def test_loads_baseline_nan_row(codec):
+    # 历史数据由标准库 json.dumps 写入，短窗口下的 volume_ma / 波动率字段会是 NaN 字面量
+    row = json.dumps({'x': float('nan'), 'y': float('inf'), 'name': '买入'}, ensure_ascii=False)
+
+    value = codec.loads_text(row)
+
+    assert math.isnan(value['x'])
+    assert value['y'] == math.inf
+    assert value['name'] == '买入'
+    assert math.isnan(SQLiteTradeStore._json_value(row)['x'])
+
+
+def test_dumps_keeps_nan_like_stdlib(codec):
+    value = {'x': float('nan'), 'none': None, 'price': 1.5, 'name': '卖出'}
+
+    text = codec.dumps_text(value)
+
+    assert text == json.dumps(value, ensure_ascii=False)
+    assert math.isnan(codec.loads_text(text)['x'])
+
+
+def test_loads_still_rejects_invalid_json(codec):
+    with pytest.raises(json.JSONDecodeError):
+        codec.loads_text('{"x": ')
@@ -0,0 +1,33 @@
+import pytest
+
+from aitrade.trade.gpt_signal.technical_analyzer import SymbolIndicatorState
+from aitrade.trade.trading_system.market_data_fetcher import MarketDataFetcher
+from aitrade.trade.trading_system.market_series import MarketSeries
+
+WINDOW = 100
+
+
+@pytest.fixture
+def fetcher():
+    # 只用到指标计算，传入占位 exchange，避免创建真实交易所客户端
+    return MarketDataFetcher('okx', '', '', exchange=object())
+
+
+def test_symbol_indicator_state_matches_full_recompute(fetcher, ohlcv_rows, closes, reference_rsi, reference_macd):
+    expected_rsi = reference_rsi(closes)
+    macd_line, signal_line = reference_macd(closes)
+    state = SymbolIndicatorState()
+
+    first = MarketSeries.from_ohlcv(ohlcv_rows[:WINDOW])
+    stateless = fetcher._calculate_technical_indicators(first)
+    assert fetcher._calculate_technical_indicators(first, state=state) == pytest.approx(stateless, rel=1e-9)
+
+    for end in range(WINDOW + 1, len(ohlcv_rows) + 1):
+        technicals = fetcher._calculate_technical_indicators(MarketSeries.from_ohlcv(ohlcv_rows[end - WINDOW:end]), state=state)
+        assert technicals['rsi'] == pytest.approx(expected_rsi[end - 15], rel=1e-9)
+        assert (technicals['macd_prev_line'], technicals['macd_line']) == pytest.approx(
+            (macd_line[end - 2], macd_line[end - 1]), rel=1e-9
+        )
+        assert (technicals['macd_prev_signal'], technicals['macd_signal']) == pytest.approx(
+            (signal_line[end - 2], signal_line[end - 1]), rel=1e-9
+        )
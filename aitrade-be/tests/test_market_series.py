@@ -0,0 +1,74 @@
+import numpy as np
+import pytest
+
+from aitrade.trade.trading_system.market_series import MarketSeries
+from aitrade.trade.trading_system.market_series import OhlcvRingBuffer
+
+WINDOW = 100
+_FIELDS = ('timestamps', 'opens', 'highs', 'lows', 'closes', 'volumes')
+
+
+def _assert_series_equal(actual, rows):
+    """逐列与直接由行列表构造的 NumPy 数组比较。"""
+    expected = np.asarray(rows, dtype=np.float64)
+    assert len(actual) == expected.shape[0]
+    for column, field in enumerate(_FIELDS):
+        np.testing.assert_array_equal(getattr(actual, field), expected[:, column])
+
+
+def test_from_ohlcv_splits_contiguous_columns(ohlcv_rows):
+    series = MarketSeries.from_ohlcv(ohlcv_rows)
+
+    _assert_series_equal(series, ohlcv_rows)
+    assert series.timestamps.dtype == np.int64
+    for field in _FIELDS:
+        assert getattr(series, field).flags['C_CONTIGUOUS']
+    assert series.to_ohlcv() == ohlcv_rows
+
+
+def test_from_ohlcv_empty():
+    series = MarketSeries.from_ohlcv([])
+
+    assert len(series) == 0
+    assert series.timestamps.dtype == np.int64
+    assert series.to_ohlcv() == []
+
+
+@pytest.mark.parametrize('incremental', [True, False], ids=['incremental', 'full-window'])
+def test_ring_buffer_tracks_sliding_window(ohlcv_rows, incremental):
+    # slack 取得很小，保证滑动过程中多次触发整体前移
+    buffer = OhlcvRingBuffer(WINDOW, slack=4)
+    _assert_series_equal(buffer.update(ohlcv_rows[:WINDOW]), ohlcv_rows[:WINDOW])
+    for end in range(WINDOW + 1, len(ohlcv_rows) + 1):
+        # 增量获取从已保存的最后一根（上一轮可能未收盘）开始，整段获取则是完整窗口
+        rows = ohlcv_rows[end - 2:end] if incremental else ohlcv_rows[end - WINDOW:end]
+        series = buffer.update(rows, length=WINDOW)
+        _assert_series_equal(series, ohlcv_rows[end - WINDOW:end])
+        assert buffer.last_timestamp == ohlcv_rows[end - 1][0]
+
+
+def test_ring_buffer_overwrites_forming_bar(ohlcv_rows):
+    buffer = OhlcvRingBuffer(WINDOW)
+    buffer.update(ohlcv_rows[:WINDOW])
+    forming = list(ohlcv_rows[WINDOW - 1])
+    forming[4] += 1.0
+
+    series = buffer.update([forming], length=WINDOW)
+
+    _assert_series_equal(series, ohlcv_rows[:WINDOW - 1] + [forming])
+
+
+def test_ring_buffer_rebuilds_after_gap(ohlcv_rows):
+    buffer = OhlcvRingBuffer(WINDOW)
+    buffer.update(ohlcv_rows[:WINDOW])
+    later = ohlcv_rows[-WINDOW:]
+
+    _assert_series_equal(buffer.update(later), later)
+
+
+def test_ring_buffer_grows_for_longer_window(ohlcv_rows):
+    buffer = OhlcvRingBuffer(WINDOW)
+    buffer.update(ohlcv_rows[:WINDOW])
+
+    _assert_series_equal(buffer.update(ohlcv_rows), ohlcv_rows)
+    assert buffer.window == len(ohlcv_rows)
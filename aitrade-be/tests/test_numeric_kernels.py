@@ -0,0 +1,124 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from aitrade.trade.gpt_signal import numeric_kernels
+
+
+def _variants(*funcs):
+    """同一内核的全部可用实现：numba 编译版本、其未编译的 Python 版本与 NumPy 等价实现，去重后返回。"""
+    variants = []
+    for func in funcs:
+        for candidate in (func, getattr(func, 'py_func', None)):
+            if candidate is not None and candidate not in variants:
+                variants.append(candidate)
+    return variants
+
+
+@pytest.mark.parametrize('ema', _variants(numeric_kernels.ema_adjusted, numeric_kernels._ema_adjusted_numpy))
+@pytest.mark.parametrize('span', [9, 12, 26])
+def test_ema_adjusted_matches_pandas(closes, ema, span):
+    expected = pd.Series(closes).ewm(span=span).mean().to_numpy()
+    np.testing.assert_allclose(ema(closes, span), expected, rtol=1e-10)
+
+
+@pytest.mark.parametrize('macd_tail', _variants(numeric_kernels.macd_tail))
+def test_macd_tail_matches_pandas(closes, reference_macd, macd_tail):
+    macd_line, signal_line = reference_macd(closes)
+    np.testing.assert_allclose(
+        macd_tail(closes),
+        (macd_line[-2], macd_line[-1], signal_line[-2], signal_line[-1]),
+        rtol=1e-9,
+    )
+
+
+@pytest.mark.parametrize(
+    'histogram',
+    _variants(numeric_kernels.macd_histogram_unadjusted, numeric_kernels._macd_histogram_unadjusted_numpy),
+)
+def test_macd_histogram_unadjusted_matches_pandas(closes, reference_macd, histogram):
+    macd_line, signal_line = reference_macd(closes, adjust=False)
+    assert histogram(closes) == pytest.approx(macd_line[-1] - signal_line[-1], rel=1e-9)
+    assert histogram(np.empty(0, dtype=np.float64)) == 0.0
+
+
+@pytest.mark.parametrize(
+    'ema_last',
+    _variants(numeric_kernels.ema_unadjusted_last, numeric_kernels._ema_unadjusted_last_numpy),
+)
+@pytest.mark.parametrize('span', [5, 20, 50])
+def test_ema_unadjusted_last_matches_pandas(closes, ema_last, span):
+    expected = pd.Series(closes).ewm(span=span, adjust=False).mean().iloc[-1]
+    assert ema_last(closes, span) == pytest.approx(expected, rel=1e-12)
+    assert ema_last(np.empty(0, dtype=np.float64), span) == 0.0
+
+
+@pytest.mark.parametrize('rsi_from_averages', _variants(numeric_kernels.rsi_from_averages))
+@pytest.mark.parametrize(
+    ('up', 'down', 'expected'),
+    [(1.0, 1.0, 50.0), (2.0, 0.0, 100.0), (0.0, 3.0, 0.0), (0.0, 0.0, 0.0), (3.0, 1.0, 75.0)],
+)
+def test_rsi_from_averages(rsi_from_averages, up, down, expected):
+    assert rsi_from_averages(up, down) == pytest.approx(expected)
+
+
+@pytest.mark.parametrize('wilder_rsi', _variants(numeric_kernels.wilder_rsi))
+def test_wilder_rsi_matches_reference(closes, reference_rsi, wilder_rsi):
+    np.testing.assert_allclose(wilder_rsi(closes, 14), reference_rsi(closes), rtol=1e-10)
+
+
+@pytest.mark.parametrize('wilder_averages', _variants(numeric_kernels.wilder_averages))
+def test_wilder_averages_match_reference_tail(closes, reference_rsi, wilder_averages):
+    up, down = wilder_averages(closes, 14)
+    assert numeric_kernels.rsi_from_averages(up, down) == pytest.approx(reference_rsi(closes)[-1], rel=1e-10)
+
+
+def _decayed_cumsum_reference(values, decay):
+    out = np.empty_like(values)
+    carry = 0.0
+    for index, value in enumerate(values):
+        carry = value + decay * carry
+        out[index] = carry
+    return out
+
+
+@pytest.mark.parametrize('use_lfilter', [False, True])
+@pytest.mark.parametrize('decay', [0.0, 0.05, 0.5, 12.0 / 13.0, 0.999])
+def test_decayed_cumsum_matches_recurrence(monkeypatch, use_lfilter, decay):
+    if use_lfilter and numeric_kernels.lfilter is None:
+        pytest.skip('scipy 未安装')
+    if not use_lfilter:
+        # 强制走分块向量化实现，覆盖块与块之间的进位
+        monkeypatch.setattr(numeric_kernels, 'lfilter', None)
+    values = np.random.default_rng(3).normal(0.0, 1.0, 1000)
+    expected = _decayed_cumsum_reference(values, decay)
+    np.testing.assert_allclose(numeric_kernels.decayed_cumsum(values, decay), expected, rtol=1e-9, atol=1e-9)
+
+    in_place = values.copy()
+    result = numeric_kernels.decayed_cumsum(in_place, decay, out=in_place)
+    assert result is in_place
+    np.testing.assert_allclose(in_place, expected, rtol=1e-9, atol=1e-9)
+
+
+def test_compute_all_indicators_matches_reference(ohlcv_rows, reference_rsi, reference_macd):
+    columns = np.asarray(ohlcv_rows, dtype=np.float64)
+    closes = np.ascontiguousarray(columns[:, 4])
+    volumes = np.ascontiguousarray(columns[:, 5])
+    macd_line, signal_line = reference_macd(closes)
+
+    bundle = numeric_kernels.compute_all_indicators(closes, volumes)
+
+    assert bundle.rsi == pytest.approx(reference_rsi(closes)[-1], rel=1e-10)
+    assert (bundle.prev_macd, bundle.macd) == pytest.approx((macd_line[-2], macd_line[-1]), rel=1e-9)
+    assert (bundle.prev_signal, bundle.signal) == pytest.approx((signal_line[-2], signal_line[-1]), rel=1e-9)
+    assert (bundle.short_ma, bundle.long_ma) == pytest.approx((closes[-10:].mean(), closes[-20:].mean()), rel=1e-12)
+    assert (bundle.recent_volume, bundle.previous_volume) == pytest.approx(
+        (volumes[-5:].mean(), volumes[-10:-5].mean()), rel=1e-12
+    )
+
+
+@pytest.mark.parametrize('wilder_rsi', _variants(numeric_kernels.wilder_rsi))
+def test_flat_prices_give_zero_rsi(wilder_rsi):
+    flat = np.full(40, 100.0)
+    np.testing.assert_array_equal(wilder_rsi(flat, 14), np.zeros(26))
+    assert numeric_kernels.compute_all_indicators(flat, flat).rsi == 0.0
@@ -0,0 +1,32 @@
+import numpy as np
+import pytest
+
+from aitrade.trade.trading_system.risk_manager import RiskManager
+
+
+def _market_data(closes, rsi, precomputed=False):
+    closes = np.asarray(closes, dtype=np.float64)
+    technicals = {'rsi': rsi}
+    if precomputed:
+        technicals['price_volatility'] = float(np.std(closes[-10:]) / np.mean(closes[-10:]))
+    return {'closes': closes, 'price': float(closes[-1]), 'technicals': technicals}
+
+
+@pytest.mark.parametrize('precomputed', [False, True])
+def test_volatility_is_checked_before_rsi(precomputed):
+    # 波动率与 RSI 同时超限时，拦截原因与指标字段保持按波动率拦截
+    closes = [100.0, 120.0] * 10
+    result = RiskManager.risk_management_check(_market_data(closes, 90.0, precomputed), {'action': 'buy', 'strategy': 'gpt'})
+
+    assert not result['passed']
+    assert result['reason'].startswith('市场波动率过高')
+    assert result['metrics']['volatility'] == pytest.approx(np.std(closes[-10:]) / np.mean(closes[-10:]))
+
+
+def test_rsi_block_keeps_volatility_metric():
+    closes = np.linspace(100.0, 101.0, 20)
+    result = RiskManager.risk_management_check(_market_data(closes, 85.0), {'action': 'buy', 'strategy': 'gpt'})
+
+    assert not result['passed']
+    assert result['reason'] == 'RSI值过高 (85.00)，避免买入'
+    assert result['metrics']['volatility'] == pytest.approx(np.std(closes[-10:]) / np.mean(closes[-10:]))
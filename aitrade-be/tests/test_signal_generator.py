@@ -0,0 +1,62 @@
+import threading
+
+import pytest
+
+from aitrade.trade.gpt_signal.signal_generator import SignalGenerator
+from aitrade.trade.gpt_signal.signal_generator import _JsonObjectCloseDetector
+
+
+def _feed_all(chunks):
+    detector = _JsonObjectCloseDetector()
+    return [detector.feed(chunk) for chunk in chunks]
+
+
+@pytest.mark.parametrize(
+    ('chunks', 'expected'),
+    [
+        (['{"action":"buy","confidence":0.8}'], [True]),
+        (['{"action":', '"hold",', '"confidence":0.5', '}'], [False, False, False, True]),
+        # 嵌套对象只有在最外层闭合时才算完成
+        (['{"a":{"b":1}', ',"c":2}'], [False, True]),
+        # 字符串内的花括号不计数
+        (['{"reason":"突破 } 后回踩 {', '支撑"', ',"action":"buy"}'], [False, False, True]),
+        # 转义引号不会结束字符串，反斜杠落在分片末尾时状态跨分片保留
+        (['{"reason":"say \\', '"}\\" ok"', '}'], [False, False, True]),
+        # 首个 '{' 之前的说明文字（含引号）不影响扫描
+        (['结论如下 "json"：', '```json\n{"action":"sell"}'], [False, True]),
+        (['没有 JSON 的普通文本', '}'], [False, False]),
+    ],
+)
+def test_json_object_close_detector(chunks, expected):
+    assert _feed_all(chunks) == expected
+
+
+def test_json_object_close_detector_single_characters():
+    text = '前言 {"reason":"a \\"{quoted}\\" b","nested":{"x":[1,2]},"action":"hold"} 追加说明'
+    closed_at = text.index('} 追加') + 1
+
+    results = _feed_all(list(text))
+
+    assert results.index(True) == closed_at - 1
+
+
+def test_fast_path_stats_are_consistent_across_threads():
+    generator = SignalGenerator(api_key='test')
+    tech_analysis = {
+        'signal_bias': 'bullish', 'overall_strength': 1.0, 'bullish_signals': 3, 'buy_blocked': False,
+        'rsi': {'value': 40.0}, 'price_trend': {'trend': 'up'},
+    }
+
+    def worker():
+        for _ in range(500):
+            generator._build_fast_path_signal(tech_analysis)
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    stats = generator.get_cache_stats()
+    assert stats['fast_path_checks'] == stats['fast_path_hits'] == 4000
+    assert stats['fast_path_hit_rate'] == 1.0
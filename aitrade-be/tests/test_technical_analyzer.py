@@ -0,0 +1,90 @@
+import numpy as np
+import pytest
+
+from aitrade.trade.gpt_signal import technical_analyzer
+from aitrade.trade.gpt_signal.technical_analyzer import MacdState
+from aitrade.trade.gpt_signal.technical_analyzer import PriceTrendState
+from aitrade.trade.gpt_signal.technical_analyzer import RsiState
+from aitrade.trade.gpt_signal.technical_analyzer import TechnicalAnalyzer
+
+WINDOW = 100
+
+
+@pytest.fixture(params=[True, False], ids=['numba', 'numpy'])
+def backend(request, monkeypatch):
+    """分别覆盖 numba 逐点递推与纯 NumPy 分块向量化两条路径；TA-Lib 固定关闭。"""
+    monkeypatch.setattr(technical_analyzer, 'NUMBA_ENABLED', request.param)
+    monkeypatch.setattr(technical_analyzer, 'talib', None)
+    return request.param
+
+
+def _sliding_windows(closes, timestamps, start=WINDOW, stop=None):
+    """按实盘方式每轮取最近 WINDOW 根 K 线，最后一根视为仍在形成。"""
+    for end in range(start, (stop or closes.shape[0]) + 1):
+        yield end, closes[end - WINDOW:end], timestamps[end - WINDOW:end]
+
+
+def test_compute_rsi_matches_reference(backend, closes, reference_rsi):
+    np.testing.assert_allclose(TechnicalAnalyzer.compute_rsi(closes), reference_rsi(closes), rtol=1e-9)
+
+
+def test_compute_macd_tail_matches_pandas(backend, closes, reference_macd):
+    macd_line, signal_line = reference_macd(closes)
+    assert TechnicalAnalyzer.compute_macd_tail(closes) == pytest.approx(
+        (macd_line[-2], macd_line[-1], signal_line[-2], signal_line[-1]), rel=1e-9
+    )
+
+
+def test_rsi_state_matches_full_history(backend, closes, timestamps, reference_rsi):
+    expected = reference_rsi(closes)
+    state = RsiState()
+    for end, window, window_ts in _sliding_windows(closes, timestamps):
+        # 仍在形成的最后一根只参与临时计算，不能写回平滑状态
+        forming = window.copy()
+        forming[-1] *= 1.01
+        state.update(forming, window_ts)
+        assert state.update(window, window_ts) == pytest.approx(expected[end - 15], rel=1e-9)
+
+
+def test_rsi_state_backfills_after_gap(backend, closes, timestamps, reference_rsi):
+    state = RsiState()
+    for _, window, window_ts in _sliding_windows(closes, timestamps, stop=150):
+        state.update(window, window_ts)
+    # 跳过超过一个窗口的 K 线后，状态按新窗口整体回填，与整段重算一致
+    window = closes[-WINDOW:]
+    assert state.update(window, timestamps[-WINDOW:]) == pytest.approx(reference_rsi(window)[-1], rel=1e-9)
+
+
+def test_macd_state_matches_full_history(closes, timestamps, reference_macd):
+    macd_line, signal_line = reference_macd(closes)
+    state = MacdState()
+    for end, window, window_ts in _sliding_windows(closes, timestamps):
+        forming = window.copy()
+        forming[-1] *= 0.99
+        state.update(forming, window_ts)
+        assert state.update(window, window_ts) == pytest.approx(
+            (macd_line[end - 2], macd_line[end - 1], signal_line[end - 2], signal_line[end - 1]), rel=1e-9
+        )
+
+
+def test_price_trend_state_matches_window_means(closes, timestamps):
+    state = PriceTrendState()
+    for _, window, window_ts in _sliding_windows(closes, timestamps):
+        assert state.update(window, window_ts) == pytest.approx(
+            (window[-10:].mean(), window[-20:].mean()), rel=1e-12
+        )
+
+
+def test_flat_prices_give_zero_rsi(backend):
+    flat = np.full(WINDOW, 100.0)
+    timestamps = np.arange(WINDOW, dtype=np.int64)
+    np.testing.assert_array_equal(TechnicalAnalyzer.compute_rsi(flat), np.zeros(WINDOW - 14))
+    assert RsiState().update(flat, timestamps) == 0.0
+
+
+def test_missing_rsi_defaults_to_neutral(backend):
+    # 行情数据未带 RSI 时按中性 50 处理，单边或横盘序列也不会触发超买超卖
+    rising = np.linspace(100.0, 120.0, WINDOW)
+    analysis = TechnicalAnalyzer.perform_technical_analysis({'closes': rising, 'volumes': np.ones(WINDOW)})
+    assert analysis['rsi']['value'] == 50
+    assert analysis['rsi']['condition'] == 'neutral'